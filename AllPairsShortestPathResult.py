@@ -0,0 +1,108 @@
+from array import array
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class AllPairsShortestPathResult:
+    """Representa o resultado de um algoritmo de caminho mínimo, entre todos os pares de vértices.
+
+    Os custos e os próximos vértices de cada caminho são guardados em
+    vetores, linha por linha, e os caminhos só são montados quando solicitados.
+    """
+
+    vertexes: tuple[str, ...] = field(repr=False)
+    index: dict[str, int] = field(repr=False)
+    distances: array = field(repr=False)
+    successors: array = field(repr=False)
+    integral: bool = field(repr=False, default=True)
+
+    @property
+    def vertex_count(self) -> int:
+        """A quantidade de vértices do grafo."""
+        return len(self.vertexes)
+
+    def get_vertex_index(self, vertex: str) -> int:
+        """Transforma o rótulo de um vértice para o índice.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser buscado.
+
+        Returns:
+            int: O índice do vértice.
+        """
+        if vertex in self.index:
+            return self.index[vertex]
+        raise ValueError("O grafo não possui o vértice: " + vertex)
+
+    def export_cost(self, cost: float) -> int | float:
+        """Converte o custo para inteiro, caso todos os custos do grafo sejam inteiros.
+
+        Args:
+            cost (float): O custo a ser convertido.
+
+        Returns:
+            int | float: O custo convertido.
+        """
+        if self.integral and cost not in (float("inf"), float("-inf")):
+            return int(cost)
+        return cost
+
+    def distance(self, source: str, destiny: str) -> int | float:
+        """Retorna o custo mínimo entre dois vértices.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+
+        Returns:
+            int | float: O custo mínimo, infinito caso o destino não seja alcançável.
+
+        Examples:
+            ShortestMinimumPath(...).get_floyd_warshall_result().distance("A", "B")
+            ...
+        """
+        i, j = self.get_vertex_index(source), self.get_vertex_index(destiny)
+        return self.export_cost(self.distances[i * self.vertex_count + j])
+
+    def path(self, source: str, destiny: str) -> list[str]:
+        """Monta o caminho mínimo entre dois vértices.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+
+        Returns:
+            list[str]: Os rótulos dos vértices do caminho, vazio caso o destino não seja alcançável.
+
+        Examples:
+            ShortestMinimumPath(...).get_floyd_warshall_result().path("A", "B")
+            ...
+        """
+        i, j = self.get_vertex_index(source), self.get_vertex_index(destiny)
+        n = self.vertex_count
+        if self.successors[i * n + j] == -1:
+            return []
+        path = [self.vertexes[i]]
+        # Segue os próximos vértices até o destino, limitado a "n" passos por causa de ciclos negativos.
+        while i != j and len(path) <= n:
+            i = self.successors[i * n + j]
+            path.append(self.vertexes[i])
+        return path
+
+    def to_dict(self) -> dict[str, list[list[int | float]] | list[list[str]]]:
+        """Exporta o resultado no mesmo formato do método "apply_floyd_warshall_algorithm".
+
+        Returns:
+            dict[str, list[list[int | float]] | list[list[str]]]: Os custos e os antecessores.
+        """
+        n = self.vertex_count
+        return {
+            "Custo dos Arcos": [
+                [self.export_cost(cost) for cost in self.distances[i * n:(i + 1) * n]]
+                for i in range(n)
+            ],
+            "Vértices Antecessores": [
+                [self.vertexes[k] if k != -1 else "" for k in self.successors[i * n:(i + 1) * n]]
+                for i in range(n)
+            ],
+        }
@@ -0,0 +1,144 @@
+from collections.abc import Callable
+from os import close, path, remove
+from random import Random
+from sys import getsizeof
+from tempfile import mkstemp
+from time import perf_counter
+
+from BreadthFirstSearch import BreadthFirstSearch
+from ContractionHierarchy import ContractionHierarchy
+from FrozenGraph import FrozenGraph
+from GraphGenerator import GraphGenerator
+from ShortestMinimumPath import ShortestMinimumPath
+
+
+def measure(function: Callable[[], object], repeat: int = 3) -> float:
+    """Mede o menor tempo de execução de uma função, em segundos.
+
+    Args:
+        function (Callable[[], object]): A função a ser medida.
+        repeat (int, optional): A quantidade de execuções.
+
+    Returns:
+        float: O menor tempo entre as execuções.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def get_road_like_graph(rows: int, columns: int, keep: float = 0.7, seed: int = 0) -> FrozenGraph:
+    """Gera um grafo parecido com uma malha viária, uma grade com parte das ruas removidas.
+
+    Args:
+        rows (int): A quantidade de linhas da grade.
+        columns (int): A quantidade de colunas da grade.
+        keep (float, optional): A probabilidade de cada rua ser mantida.
+        seed (int, optional): A semente dos sorteios.
+
+    Returns:
+        FrozenGraph: O grafo gerado.
+    """
+    grid = GraphGenerator(seed, (1, 9)).grid(rows, columns)
+    random = Random(seed)
+    kept = {(i, j) for i, j, _ in grid.iter_edges() if i < j and random.random() < keep}
+    return FrozenGraph.from_edges(
+        grid.vertexes, ((i, j, weight) for i, j, weight in grid.iter_edges() if (min(i, j), max(i, j)) in kept)
+    )
+
+
+def get_adjacency_size(graph: FrozenGraph) -> int:
+    """Retorna a quantidade de bytes dos vetores de arcos e de custos.
+
+    Args:
+        graph (FrozenGraph): A cópia imutável do grafo.
+
+    Returns:
+        int: A quantidade de bytes.
+    """
+    return getsizeof(graph.offsets) + getsizeof(graph.targets) + getsizeof(graph.weights)
+
+
+def benchmark_reordering(rows: int = 300, columns: int = 300, seed: int = 0):
+    """Compara as buscas sobre grafos com os vértices embaralhados e renumerados.
+
+    Os vértices são embaralhados, simulando um grafo lido em uma ordem
+    qualquer, e em seguida renumerados por cada método de ordenação.
+
+    Args:
+        rows (int, optional): A quantidade de linhas da grade.
+        columns (int, optional): A quantidade de colunas da grade.
+        seed (int, optional): A semente dos sorteios.
+    """
+    graphs = {
+        "grade": GraphGenerator(seed, (1, 9)).grid(rows, columns),
+        "malha viária": get_road_like_graph(rows, columns, seed=seed),
+    }
+    for name, graph in graphs.items():
+        order = list(range(graph.vertex_count))
+        Random(seed).shuffle(order)
+        shuffled = graph.permute(order)
+        print(f"{name}: {graph.vertex_count} vértices, {graph.edge_count} arcos")
+        print(f"  {'ordem':<12}{'BFS (s)':>10}{'Dijkstra (s)':>14}{'bytes':>12}{'comprimido':>12}")
+        # O mesmo vértice de partida, o centro da grade, pelo rótulo, em todas as ordens.
+        source = graph.vertexes[rows // 2 * columns + columns // 2]
+        baseline = None
+        for method in ("embaralhada", "bfs", "rcm", "degree"):
+            current = shuffled if method == "embaralhada" else shuffled.reorder(method)
+            bfs = measure(lambda: BreadthFirstSearch(current).get_bfs_level(source))
+            dijkstra = measure(lambda: ShortestMinimumPath(current).get_dijkstra_result(source))
+            baseline = baseline or (bfs, dijkstra)
+            print(
+                f"  {method:<12}{bfs:>10.3f}{dijkstra:>14.3f}"
+                f"{get_adjacency_size(current):>12}{current.compress().nbytes:>12}"
+                f"  ({baseline[0] / bfs:.2f}x, {baseline[1] / dijkstra:.2f}x)"
+            )
+
+
+def benchmark_contraction_hierarchy(rows: int = 150, columns: int = 150, queries: int = 100, seed: int = 0):
+    """Compara as consultas ponto a ponto pela hierarquia de contração e pelo Dijkstra.
+
+    Args:
+        rows (int, optional): A quantidade de linhas da grade.
+        columns (int, optional): A quantidade de colunas da grade.
+        queries (int, optional): A quantidade de consultas, entre pares de vértices sorteados.
+        seed (int, optional): A semente dos sorteios.
+    """
+    graph = get_road_like_graph(rows, columns, seed=seed)
+    hierarchy = ContractionHierarchy.build(graph)
+    preprocessing_time = hierarchy.preprocessing_time
+    descriptor, file_path = mkstemp(suffix=".ch")
+    try:
+        hierarchy.save(file_path)
+        file_size = path.getsize(file_path)
+        hierarchy = ContractionHierarchy.load(file_path)
+    finally:
+        close(descriptor)
+        remove(file_path)
+    print(f"malha viária: {graph.vertex_count} vértices, {graph.edge_count} arcos")
+    print(f"  pré-processamento: {preprocessing_time:.2f} s")
+    print(f"  arcos: {hierarchy.arc_count}, atalhos: {hierarchy.shortcut_count}")
+    print(f"  memória: {hierarchy.nbytes} bytes, arquivo: {file_size} bytes")
+
+    random = Random(seed)
+    pairs = [(random.choice(graph.vertexes), random.choice(graph.vertexes)) for _ in range(queries)]
+    smp = ShortestMinimumPath(graph)
+    for source, destiny in pairs:
+        expected = smp.get_dijkstra_result(source, (destiny,)).distance_to(destiny)
+        if hierarchy.distance(source, destiny) != expected:
+            raise ValueError(f"Custos diferentes entre {source} e {destiny}.")
+    contraction = measure(lambda: [hierarchy.query(source, destiny) for source, destiny in pairs]) / queries
+    dijkstra = measure(
+        lambda: [smp.get_dijkstra_result(source, (destiny,)).path_to(destiny) for source, destiny in pairs]
+    ) / queries
+    print(f"  {'consulta':<12}{'tempo (ms)':>12}")
+    print(f"  {'hierarquia':<12}{contraction * 1000:>12.3f}  ({dijkstra / contraction:.2f}x)")
+    print(f"  {'dijkstra':<12}{dijkstra * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    benchmark_reordering()
+    benchmark_contraction_hierarchy()
@@ -0,0 +1,188 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from mmap import mmap
+from multiprocessing import shared_memory
+from os import cpu_count
+
+from AllPairsShortestPathResult import AllPairsShortestPathResult
+from Graph import Graph
+from Kernels import floyd_warshall_tile
+
+# Matrizes compartilhadas, abertas uma única vez em cada processo.
+attached_storage = {}
+
+
+def attach_storage(descriptor: tuple) -> tuple[memoryview, memoryview | None]:
+    """Abre as matrizes compartilhadas, de custos e de próximos vértices.
+
+    As matrizes podem estar em memória compartilhada, ("shm", custos, próximos)
+    ou em um arquivo mapeado em memória, ("file", caminho, posição, tamanho),
+    sendo que, no arquivo, somente os custos são guardados.
+
+    Args:
+        descriptor (tuple): O tipo e a localização das matrizes.
+
+    Returns:
+        tuple[memoryview, memoryview | None]: Os custos e os próximos vértices, caso existam.
+    """
+    if descriptor not in attached_storage:
+        kind = descriptor[0]
+        if kind == "shm":
+            _, distances_name, successors_name = descriptor
+            handles = [shared_memory.SharedMemory(distances_name)]
+            distances = handles[0].buf.cast("d")
+            successors = None
+            if successors_name is not None:
+                handles.append(shared_memory.SharedMemory(successors_name))
+                successors = handles[1].buf.cast("q")
+            views = [distances] if successors is None else [distances, successors]
+        elif kind == "file":
+            _, path, offset, length = descriptor
+            with open(path, "r+b") as file:
+                handle = mmap(file.fileno(), 0)
+            buffer = memoryview(handle)
+            distances = buffer[offset:offset + length].cast("d")
+            successors = None
+            handles, views = [handle], [distances, buffer]
+        else:
+            raise ValueError("O tipo de armazenamento não é suportado: " + kind)
+        attached_storage[descriptor] = (handles, views, distances, successors)
+    _, _, distances, successors = attached_storage[descriptor]
+    return distances, successors
+
+
+def detach_storage(descriptor: tuple):
+    """Fecha as matrizes compartilhadas abertas no processo atual.
+
+    Args:
+        descriptor (tuple): O tipo e a localização das matrizes.
+    """
+    handles, views, _, _ = attached_storage.pop(descriptor)
+    for view in views:
+        view.release()
+    for handle in handles:
+        handle.close()
+
+
+def process_tile(descriptor: tuple, n: int, tile_size: int, i_block: int, j_block: int, k_block: int):
+    """Atualiza um bloco da matriz de custos, utilizando os vértices intermediários de outro bloco.
+
+    Args:
+        descriptor (tuple): O tipo e a localização das matrizes.
+        n (int): A quantidade de vértices do grafo.
+        tile_size (int): O tamanho dos blocos.
+        i_block (int): O bloco das linhas.
+        j_block (int): O bloco das colunas.
+        k_block (int): O bloco dos vértices intermediários.
+    """
+    distances, successors = attach_storage(descriptor)
+    floyd_warshall_tile(
+        n,
+        distances,
+        successors,
+        (i_block * tile_size, min((i_block + 1) * tile_size, n)),
+        (j_block * tile_size, min((j_block + 1) * tile_size, n)),
+        (k_block * tile_size, min((k_block + 1) * tile_size, n)),
+    )
+
+
+def run_blocked_phases(descriptor: tuple, n: int, tile_size: int, workers: int):
+    """Executa as fases do Floyd-Warshall em blocos, sobre matrizes já inicializadas.
+
+    Em cada fase, o bloco da diagonal é processado primeiro, em seguida os
+    blocos da sua linha e coluna e, por fim, os demais blocos, sendo que os
+    blocos de uma mesma etapa são independentes e distribuídos entre os processos.
+
+    Args:
+        descriptor (tuple): O tipo e a localização das matrizes.
+        n (int): A quantidade de vértices do grafo.
+        tile_size (int): O tamanho dos blocos.
+        workers (int): A quantidade de processos.
+    """
+    blocks = (n + tile_size - 1) // tile_size
+
+    def run(executor: ProcessPoolExecutor | None, tiles: list[tuple[int, int, int]]):
+        """Processa blocos independentes, em paralelo caso existam processos."""
+        if executor is None:
+            for tile in tiles:
+                process_tile(descriptor, n, tile_size, *tile)
+        else:
+            futures = [executor.submit(process_tile, descriptor, n, tile_size, *tile) for tile in tiles]
+            for future in futures:
+                future.result()
+
+    executor = ProcessPoolExecutor(workers) if workers > 1 and blocks > 1 else None
+    try:
+        for k in range(blocks):
+            # Bloco da diagonal.
+            process_tile(descriptor, n, tile_size, k, k, k)
+            # Blocos da linha e da coluna da diagonal.
+            run(executor, [(k, j, k) for j in range(blocks) if j != k] + [(i, k, k) for i in range(blocks) if i != k])
+            # Demais blocos.
+            run(executor, [(i, j, k) for i in range(blocks) if i != k for j in range(blocks) if j != k])
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if descriptor in attached_storage:
+            detach_storage(descriptor)
+
+
+@dataclass
+class BlockedFloydWarshall:
+    """Responsável pelo algoritmo de Floyd-Warshall em blocos, distribuído entre processos."""
+
+    graph: Graph = field(repr=False)
+    tile_size: int = 64
+    workers: int | None = None
+
+    def apply(self) -> AllPairsShortestPathResult:
+        """Aplica o algoritmo de Floyd-Warshall em blocos, sobre matrizes em memória compartilhada.
+
+        Returns:
+            AllPairsShortestPathResult: Os custos e os próximos vértices, os caminhos são montados sob demanda.
+
+        Examples:
+            BlockedFloydWarshall(...).apply()
+
+            BlockedFloydWarshall(..., tile_size=128, workers=8).apply()
+            ...
+        """
+        if self.tile_size < 1:
+            raise ValueError("O tamanho dos blocos deve ser positivo.")
+        graph = self.graph.freeze()
+        n = graph.vertex_count
+        size = max(n * n, 1) * 8
+        distances_memory = shared_memory.SharedMemory(create=True, size=size)
+        successors_memory = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            # Inicializa as matrizes, linha por linha, com os custos e os próximos vértices.
+            distances = distances_memory.buf.cast("d")
+            successors = successors_memory.buf.cast("q")
+            infinity_row, empty_row = array("d", [float("inf")]) * n, array("q", [-1]) * n
+            for i in range(n):
+                distances[i * n:(i + 1) * n] = infinity_row
+                successors[i * n:(i + 1) * n] = empty_row
+            for i in range(n):
+                distances[i * n + i] = 0
+                successors[i * n + i] = i
+            for i, j, weight in graph.iter_edges():
+                distances[i * n + j] = weight
+                successors[i * n + j] = j
+            distances.release()
+            successors.release()
+
+            descriptor = ("shm", distances_memory.name, successors_memory.name)
+            run_blocked_phases(descriptor, n, self.tile_size, self.workers or cpu_count() or 1)
+
+            # Copia o resultado para fora da memória compartilhada.
+            result_distances, result_successors = array("d"), array("q")
+            result_distances.frombytes(distances_memory.buf[:n * n * 8])
+            result_successors.frombytes(successors_memory.buf[:n * n * 8])
+        finally:
+            for memory in (distances_memory, successors_memory):
+                memory.close()
+                memory.unlink()
+        return AllPairsShortestPathResult(
+            graph.vertexes, graph.index, result_distances, result_successors, graph.weights.typecode == "q"
+        )
@@ -1,6 +1,10 @@
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 from Graph import Graph
+from Kernels import bfs_levels
+from TreeView import TreeView
 
 
 @dataclass
@@ -24,28 +28,56 @@ class BreadthFirstSearch:
             BreadthFirstSearch(...).apply_bfs("1")
             ...
         """
+        return list(self.iter_bfs(source))
+
+    def iter_bfs(self, source: str) -> Iterator[tuple[str, str]]:
+        """Realiza a Busca em Largura, gerando os arcos conforme são descobertos.
+
+        A busca pode ser interrompida a qualquer momento, basta parar a iteração.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Yields:
+            tuple[str, str]: O arco percorrido pelo algoritmo, os rótulos dos vértices.
+
+        Examples:
+            next(BreadthFirstSearch(...).iter_bfs("A"))
+
+            for edge in BreadthFirstSearch(...).iter_bfs("1"): ...
+        """
+        graph = self.graph.freeze()
+        vertexes = graph.vertexes
+        for parent, child in self.iter_bfs_indexes(graph.translate_vertex_label_to_index(source)):
+            yield (vertexes[parent], vertexes[child])
+
+    def iter_bfs_indexes(self, source: int) -> Iterator[tuple[int, int]]:
+        """Realiza a Busca em Largura utilizando somente os índices dos vértices.
+
+        Args:
+            source (int): O índice do vértice tomado como ponto de partida.
+
+        Yields:
+            tuple[int, int]: O arco percorrido pelo algoritmo, os índices dos vértices.
+        """
+        graph = self.graph.freeze()
+        offsets, targets = graph.undirected_offsets, graph.undirected_targets
         # Indica quais vértices vão ser visitados.
-        queue = [source]
-        # Indica quais vértices foram visitados.
-        visited = [False] * self.graph.vertex_count
-        # Indica o caminho percorrido pelo BFS.
-        path = []
+        queue = deque([source])
+        # Indica quais vértices foram descobertos.
+        visited = bytearray(graph.vertex_count)
+        visited[source] = 1
         while queue:
             # Próximo vértice a ser visitado.
-            current_vertex = queue.pop(0)
-            # Índice do próximo vértice.
-            current_vertex_index = self.graph.translate_vertex_label_to_index(current_vertex)
-            if not visited[current_vertex_index]:
-                # Marca o vértice atual como visitado.
-                visited[current_vertex_index] = True
-                # Visita os vértices adjacentes.
-                for neighbor_index, neighbor in enumerate(self.graph.vertexes):
-                    if self.graph.contain_undirected_edge((current_vertex, neighbor)):
-                        if not visited[neighbor_index]:
-                            # Adiciona ao caminho percorrido e repete todo o processo.
-                            path.append((current_vertex, neighbor))
-                            queue.append(neighbor)
-        return path
+            current_vertex = queue.popleft()
+            # Visita os vértices adjacentes.
+            for position in range(offsets[current_vertex], offsets[current_vertex + 1]):
+                neighbor = targets[position]
+                if not visited[neighbor]:
+                    # Marca o vizinho como descoberto e repete todo o processo.
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+                    yield (current_vertex, neighbor)
     
     def get_bfs_level(self, source: str) -> dict[str, int]:
         """Retorna o nível dos vértices percorrido pelo BFS.
@@ -62,55 +94,39 @@ class BreadthFirstSearch:
             BreadthFirstSearch(...).get_bfs_level("1")
             ...
         """
-        # Nível dos vértices.
-        level = dict.fromkeys(self.graph.vertexes, 0)
-        # Caminho percorrido pelo BFS.
-        path = self.apply_bfs(source)
-        # Atualiza o nível dos vértices.
-        for edge in path:
-            # Extrai o rótulo dos arcos.
-            (i, j) = edge
-            # Atualiza o nível.
-            level[j] = level[i] + 1
-        return level
+        graph = self.graph.freeze()
+        # Nível dos vértices, calculado pelo núcleo compilado, caso disponível.
+        level = bfs_levels(
+            graph.undirected_offsets,
+            graph.undirected_targets,
+            graph.vertex_count,
+            graph.translate_vertex_label_to_index(source),
+        )
+        return dict(zip(graph.vertexes, level))
     
-    def get_bfs_tree(self, source: str) -> Graph:
+    def get_bfs_tree(self, source: str) -> TreeView:
         """Gera a Árvore Geradora do BFS.
 
+        A árvore é uma visão, guardada como um vetor de antecessores, sobre a
+        cópia imutável do grafo, e possui os mesmos métodos de leitura do
+        "Graph", o método "materialize" cria o "Graph" da árvore.
+        Assim como antes, os arcos da árvore possuem custo 1.
+
         Args:
             source (str): O rótulo do vértice tomado como ponto de partida.
 
         Returns:
-            Graph: A Árvore Geradora.
+            TreeView: A Árvore Geradora.
         
         Examples:
             BreadthFirstSearch(...).get_bfs_tree("A")
 
-            BreadthFirstSearch(...).get_bfs_tree("1")
+            BreadthFirstSearch(...).get_bfs_tree("1").materialize()
             ...
         """
-        # Inicializa a matriz de incidência da árvore geradora.
-        tree = Graph()
-        # Caminho percorrido pelo BFS.
-        path = self.apply_bfs(source)
-        # Vértices inclusos no caminho percorrido pelo BFS.
-        vertexes_in_bfs_path = self.get_bfs_vertexes(source)
-        # Adiciona os vértices.
-        for vertex in vertexes_in_bfs_path:
-            tree.add_vertex(vertex)
-        # Adiciona os arcos.
-        for edge in path:
-            # Custo do arco.
-            cost = self.graph.get_edge_weight(edge)
-            # Por fim, adiciona os arcos com os custos.
-            tree.add_edge_undirected(edge)
-        # Monta o grafo.
-        tree.create_graph()
-        # Atualiza o grafo.
-        tree.update_graph()
-        # Retorna o grafo.
-        return tree
-
+        graph = self.graph.freeze()
+        source_index = graph.translate_vertex_label_to_index(source)
+        return TreeView.from_arcs(graph, source_index, self.iter_bfs_indexes(source_index), unit_cost=True)
 
     def get_bfs_vertexes(self, source: str) -> list[str]:
         """Indica quais vértices foram percorridos pelo BFS.
@@ -127,6 +143,140 @@ class BreadthFirstSearch:
             BreadthFirstSearch(...).get_bfs_vertexes("1")
             ... 
         """
-        # Caminho percorrido pelo BFS.
-        path = self.apply_bfs(source)
-        return sorted(set([vertex for edge in path for vertex in edge]))
+        graph = self.graph.freeze()
+        # Vértices inclusos no caminho percorrido pelo BFS.
+        vertexes = set()
+        for edge in self.iter_bfs_indexes(graph.translate_vertex_label_to_index(source)):
+            vertexes.update(edge)
+        return sorted(graph.vertexes[vertex] for vertex in vertexes)
+
+    def get_bfs_level_multi_source(self, sources: tuple[str, ...], batch_size: int = 64) -> dict[str, dict[str, int]]:
+        """Retorna o nível dos vértices para múltiplos pontos de partida (MS-BFS).
+
+        Até "batch_size" buscas são feitas simultaneamente, cada vértice
+        guarda, em um inteiro, um bit para cada ponto de partida do lote.
+
+        Args:
+            sources (tuple[str, ...]): Os rótulos dos vértices tomados como pontos de partida.
+            batch_size (int, optional): A quantidade de buscas feitas simultaneamente.
+
+        Returns:
+            dict[str, dict[str, int]]: O nível dos vértices, para cada ponto de partida.
+
+        Examples:
+            BreadthFirstSearch(...).get_bfs_level_multi_source(("A", "B"))
+
+            BreadthFirstSearch(...).get_bfs_level_multi_source(("1", "2", "3"))
+            ...
+        """
+        if batch_size < 1:
+            raise ValueError("O tamanho do lote deve ser positivo.")
+        graph = self.graph.freeze()
+        offsets, targets = graph.undirected_offsets, graph.undirected_targets
+        vertexes = graph.vertexes
+        # Nível dos vértices, para cada ponto de partida.
+        levels = {}
+
+        for start in range(0, len(sources), batch_size):
+            batch = sources[start:start + batch_size]
+            # Bits dos pontos de partida que já alcançaram cada vértice.
+            seen = [0] * graph.vertex_count
+            # Fronteira atual, o vértice e os bits que o alcançaram.
+            visit = {}
+            # Nível, por índice, de cada ponto de partida do lote.
+            batch_levels = [[0] * graph.vertex_count for _ in batch]
+            for bit, source in enumerate(batch):
+                source_index = graph.translate_vertex_label_to_index(source)
+                seen[source_index] |= 1 << bit
+                visit[source_index] = visit.get(source_index, 0) | 1 << bit
+
+            level = 0
+            while visit:
+                level += 1
+                visit_next = {}
+                for vertex, bits in visit.items():
+                    for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                        # Bits que alcançam o vizinho pela primeira vez.
+                        discovered = bits & ~seen[neighbor]
+                        if discovered:
+                            seen[neighbor] |= discovered
+                            visit_next[neighbor] = visit_next.get(neighbor, 0) | discovered
+                            # Atualiza o nível para cada ponto de partida descoberto.
+                            while discovered:
+                                lowest = discovered & -discovered
+                                batch_levels[lowest.bit_length() - 1][neighbor] = level
+                                discovered ^= lowest
+                visit = visit_next
+
+            for bit, source in enumerate(batch):
+                levels[source] = dict(zip(vertexes, batch_levels[bit]))
+        return levels
+
+    def get_bfs_level_direction_optimizing(self, source: str, alpha: int = 14, beta: int = 24) -> dict[str, int]:
+        """Retorna o nível dos vértices, alternando entre a busca top-down e bottom-up.
+
+        A busca bottom-up é utilizada quando a fronteira é grande, comum em
+        grafos de diâmetro pequeno, evitando visitar arcos desnecessários.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            alpha (int, optional): O limiar para trocar para a busca bottom-up.
+            beta (int, optional): O limiar para retornar a busca top-down.
+
+        Returns:
+            dict[str, int]: O nível dos vértices.
+
+        Examples:
+            BreadthFirstSearch(...).get_bfs_level_direction_optimizing("A")
+
+            BreadthFirstSearch(...).get_bfs_level_direction_optimizing("1")
+            ...
+        """
+        graph = self.graph.freeze()
+        offsets, targets = graph.undirected_offsets, graph.undirected_targets
+        vertex_count = graph.vertex_count
+        # Nível dos vértices, -1 indica que o vértice não foi visitado.
+        level = [-1] * vertex_count
+        source_index = graph.translate_vertex_label_to_index(source)
+        level[source_index] = 0
+        frontier = [source_index]
+        # Quantidade de arcos ainda não explorados.
+        degree = [offsets[i + 1] - offsets[i] for i in range(vertex_count)]
+        unexplored_edges = len(targets) - degree[source_index]
+        bottom_up = False
+        depth = 0
+
+        while frontier:
+            depth += 1
+            frontier_edges = sum(degree[vertex] for vertex in frontier)
+            # Escolhe a direção da busca de acordo com o tamanho da fronteira.
+            if not bottom_up and frontier_edges > unexplored_edges / alpha:
+                bottom_up = True
+            elif bottom_up and len(frontier) < vertex_count / beta:
+                bottom_up = False
+
+            next_frontier = []
+            if bottom_up:
+                # Cada vértice não visitado procura um pai na fronteira.
+                for vertex in range(vertex_count):
+                    if level[vertex] == -1:
+                        for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                            if level[neighbor] == depth - 1:
+                                level[vertex] = depth
+                                next_frontier.append(vertex)
+                                break
+            else:
+                # Cada vértice da fronteira visita os seus vizinhos.
+                for vertex in frontier:
+                    for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                        if level[neighbor] == -1:
+                            level[neighbor] = depth
+                            next_frontier.append(neighbor)
+            unexplored_edges -= sum(degree[vertex] for vertex in next_frontier)
+            frontier = next_frontier
+
+        # Vértices não alcançados possuem nível 0, assim como no "get_bfs_level".
+        return {
+            vertex: max(level[index], 0)
+            for index, vertex in enumerate(graph.vertexes)
+        }
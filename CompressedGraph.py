@@ -0,0 +1,213 @@
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from sys import getsizeof
+
+from FrozenGraph import FrozenGraph
+
+
+def write_varint(data: bytearray, value: int):
+    """Escreve um inteiro não negativo, utilizando 7 bits por byte.
+
+    Args:
+        data (bytearray): Os bytes no qual o inteiro será escrito.
+        value (int): O inteiro a ser escrito.
+    """
+    while value >= 0x80:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def zigzag(value: int) -> int:
+    """Transforma um inteiro em não negativo, intercalando os positivos e os negativos.
+
+    Args:
+        value (int): O inteiro a ser transformado.
+
+    Returns:
+        int: O inteiro não negativo.
+    """
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+@dataclass(frozen=True, slots=True)
+class CompressedGraph:
+    """Representa uma cópia somente leitura de um grafo, com os arcos comprimidos.
+
+    Os vizinhos de cada vértice são guardados como diferenças (delta) entre
+    índices consecutivos, com tamanho variável (varint), assim como os custos
+    inteiros, sendo assim, grafos renumerados com "reorder" ocupam poucos bytes por arco.
+    """
+
+    vertexes: tuple[str, ...]
+    index: dict[str, int] = field(repr=False)
+    byte_offsets: array = field(repr=False)
+    edge_offsets: array = field(repr=False)
+    data: bytes = field(repr=False)
+    weights: array | None = field(repr=False)
+    cache: dict[str, object] = field(repr=False, compare=False, default_factory=dict)
+
+    @classmethod
+    def from_frozen(cls, graph: FrozenGraph) -> "CompressedGraph":
+        """Comprime a cópia imutável do grafo.
+
+        Args:
+            graph (FrozenGraph): A cópia imutável do grafo.
+
+        Returns:
+            CompressedGraph: A cópia comprimida do grafo.
+
+        Examples:
+            CompressedGraph.from_frozen(Graph().freeze())
+            ...
+        """
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        # Custos inteiros são comprimidos junto dos vizinhos, os demais são mantidos em um vetor.
+        integral = weights.typecode == "q"
+        data = bytearray()
+        byte_offsets = array("q", [0])
+        for i in range(graph.vertex_count):
+            previous = i
+            for position in range(offsets[i], offsets[i + 1]):
+                j = targets[position]
+                # A primeira diferença é relativa ao próprio vértice, podendo ser negativa.
+                write_varint(data, zigzag(j - previous) if position == offsets[i] else j - previous)
+                if integral:
+                    write_varint(data, zigzag(weights[position]))
+                previous = j
+            byte_offsets.append(len(data))
+        return cls(
+            graph.vertexes,
+            graph.index,
+            byte_offsets,
+            array("q", offsets),
+            bytes(data),
+            None if integral else array("d", weights),
+        )
+
+    @property
+    def vertex_count(self) -> int:
+        """A quantidade de vértices do grafo."""
+        return len(self.vertexes)
+
+    @property
+    def edge_count(self) -> int:
+        """A quantidade de arcos direcionados do grafo."""
+        return self.edge_offsets[-1]
+
+    @property
+    def nbytes(self) -> int:
+        """A quantidade de bytes utilizada pelos arcos e pelos custos."""
+        size = getsizeof(self.data) + getsizeof(self.byte_offsets) + getsizeof(self.edge_offsets)
+        return size + (getsizeof(self.weights) if self.weights is not None else 0)
+
+    def iter_weighted_neighbors(self, vertex: int) -> Iterator[tuple[int, int | float]]:
+        """Descomprime, sob demanda, os vizinhos de um vértice e o custo dos arcos.
+
+        Args:
+            vertex (int): O índice do vértice.
+
+        Yields:
+            tuple[int, int | float]: O índice do vizinho, em ordem crescente, e o custo do arco.
+        """
+        data, weights = self.data, self.weights
+        cursor, end = self.byte_offsets[vertex], self.byte_offsets[vertex + 1]
+        position = self.edge_offsets[vertex]
+        previous = vertex
+        first = True
+        while cursor < end:
+            values = []
+            # Lê a diferença e, caso os custos sejam inteiros, o custo.
+            for _ in range(1 if weights is not None else 2):
+                value = shift = 0
+                while True:
+                    byte = data[cursor]
+                    cursor += 1
+                    value |= (byte & 0x7F) << shift
+                    if byte < 0x80:
+                        break
+                    shift += 7
+                values.append(value)
+            delta = values[0]
+            if first:
+                delta = (delta >> 1) ^ -(delta & 1)
+                first = False
+            previous += delta
+            if weights is None:
+                weight = (values[1] >> 1) ^ -(values[1] & 1)
+            else:
+                weight = weights[position]
+            position += 1
+            yield (previous, weight)
+
+    def neighbors(self, vertex: int) -> list[int]:
+        """Retorna os índices dos vizinhos de um vértice.
+
+        Args:
+            vertex (int): O índice do vértice.
+
+        Returns:
+            list[int]: Os índices dos vizinhos, em ordem crescente.
+        """
+        return [j for j, _ in self.iter_weighted_neighbors(vertex)]
+
+    def iter_edges(self) -> Iterator[tuple[int, int, int | float]]:
+        """Percorre todos os arcos do grafo, com os índices dos vértices.
+
+        Yields:
+            tuple[int, int, int | float]: A origem, o destino e o custo do arco.
+        """
+        for i in range(self.vertex_count):
+            for j, weight in self.iter_weighted_neighbors(i):
+                yield (i, j, weight)
+
+    def contain_vertex(self, vertex: str) -> bool:
+        """Verifica se um vértice está no grafo.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser procurado.
+
+        Returns:
+            bool: Se o vértice existe no grafo.
+        """
+        return vertex in self.index
+
+    def freeze(self) -> FrozenGraph:
+        """Descomprime o grafo, uma única vez, permitindo a utilização de todos os algoritmos.
+
+        A cópia descomprimida é guardada, pois os algoritmos chamam este
+        método várias vezes em uma mesma consulta.
+
+        Returns:
+            FrozenGraph: A cópia imutável do grafo.
+        """
+        if "frozen" not in self.cache:
+            self.cache["frozen"] = FrozenGraph.from_edges(self.vertexes, self.iter_edges())
+        return self.cache["frozen"]
+
+    def translate_vertex_index_to_label(self, vertex: int) -> str:
+        """Transforma o índice de um vértice para o rótulo.
+
+        Args:
+            vertex (int): O índice do vértice a ser buscado.
+
+        Returns:
+            str: O rótulo do vértice.
+        """
+        if 0 <= vertex < self.vertex_count:
+            return self.vertexes[vertex]
+        raise ValueError("Não existe nenhum vértice com esse índice.")
+
+    def translate_vertex_label_to_index(self, vertex: str) -> int:
+        """Transforma o rótulo de um vértice para o índice.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser buscado.
+
+        Returns:
+            int: O índice do vértice.
+        """
+        if vertex in self.index:
+            return self.index[vertex]
+        raise ValueError("O grafo não possui o vértice: " + vertex)
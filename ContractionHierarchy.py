@@ -0,0 +1,422 @@
+from array import array
+from dataclasses import dataclass, field
+from heapq import heapify, heappop, heappush
+from json import dumps, loads
+from math import inf
+from struct import calcsize, pack, unpack
+from sys import byteorder, getsizeof
+from time import perf_counter
+
+from FrozenGraph import FrozenGraph
+from Graph import Graph
+
+# Cabeçalho: identificador, versão, ordem dos bytes, se os custos são inteiros,
+# quantidade de vértices, quantidade de arcos e tamanho dos rótulos.
+HEADER_FORMAT = "<4sHccQQQ"
+HEADER_SIZE = calcsize(HEADER_FORMAT)
+MAGIC = b"GRCH"
+VERSION = 1
+
+
+@dataclass
+class ContractionHierarchy:
+    """Representa uma hierarquia de contração, para consultas de caminho mínimo entre dois vértices.
+
+    No pré-processamento, os vértices são contraídos do menos para o mais
+    importante e atalhos são adicionados, preservando os custos mínimos. As
+    consultas percorrem somente arcos que sobem na hierarquia, a partir da
+    origem e, invertidos, a partir do destino, visitando poucos vértices.
+    """
+
+    vertexes: tuple[str, ...] = field(repr=False)
+    index: dict[str, int] = field(repr=False)
+    rank: array = field(repr=False)
+    sources: array = field(repr=False)
+    targets: array = field(repr=False)
+    weights: array = field(repr=False)
+    middles: array = field(repr=False)
+    integral: bool = field(repr=False, default=True)
+    preprocessing_time: float = 0.0
+    up_offsets: array = field(repr=False, init=False, default_factory=lambda: array("q"))
+    up_arcs: array = field(repr=False, init=False, default_factory=lambda: array("q"))
+    down_offsets: array = field(repr=False, init=False, default_factory=lambda: array("q"))
+    down_arcs: array = field(repr=False, init=False, default_factory=lambda: array("q"))
+    arc_index: dict[tuple[int, int], int] = field(repr=False, init=False, default_factory=dict)
+
+    def __post_init__(self):
+        # Arcos que sobem na hierarquia, a partir da origem de cada arco.
+        up_rows = [[] for _ in self.vertexes]
+        # Arcos que descem na hierarquia, guardados no destino, para a busca invertida.
+        down_rows = [[] for _ in self.vertexes]
+        for arc, (u, v) in enumerate(zip(self.sources, self.targets)):
+            if self.rank[u] < self.rank[v]:
+                up_rows[u].append(arc)
+            else:
+                down_rows[v].append(arc)
+            self.arc_index[(u, v)] = arc
+        for rows, offsets, arcs in ((up_rows, self.up_offsets, self.up_arcs), (down_rows, self.down_offsets, self.down_arcs)):
+            offsets.append(0)
+            for row in rows:
+                arcs.extend(row)
+                offsets.append(len(arcs))
+
+    @classmethod
+    def build(cls, graph: Graph | FrozenGraph, witness_limit: int = 64) -> "ContractionHierarchy":
+        """Pré-processa o grafo, contraindo todos os vértices.
+
+        A importância de cada vértice é a diferença entre os atalhos criados e
+        os arcos removidos pela sua contração, somada à quantidade de vizinhos
+        já contraídos, sendo atualizada sob demanda (lazy update).
+
+        Args:
+            graph (Graph | FrozenGraph): O grafo, com custos não negativos.
+            witness_limit (int, optional): A quantidade máxima de vértices visitados na busca por caminhos alternativos.
+
+        Returns:
+            ContractionHierarchy: A hierarquia de contração.
+
+        Examples:
+            ContractionHierarchy.build(graph)
+
+            ContractionHierarchy.build(graph, witness_limit=256)
+            ...
+        """
+        start_time = perf_counter()
+        frozen = graph.freeze()
+        n = frozen.vertex_count
+        if any(weight < 0 for weight in frozen.weights):
+            raise ValueError("A hierarquia de contração não suporta custos negativos.")
+
+        # Arcos restantes, de saída e de entrada, somente o menor custo entre dois vértices.
+        outgoing = [{} for _ in range(n)]
+        incoming = [{} for _ in range(n)]
+        for u, v, weight in frozen.iter_edges():
+            if u != v and weight < outgoing[u].get(v, inf):
+                outgoing[u][v] = weight
+                incoming[v][u] = weight
+        # Vértice intermediário de cada atalho.
+        middle = {}
+
+        def get_shortcuts(vertex: int) -> list[tuple[int, int, int | float]]:
+            """Calcula os atalhos necessários para contrair um vértice.
+
+            Um atalho só é criado caso não exista um caminho alternativo (witness),
+            de custo menor ou igual, que não passe pelo vértice.
+
+            Args:
+                vertex (int): O índice do vértice.
+
+            Returns:
+                list[tuple[int, int, int | float]]: Os atalhos, a origem, o destino e o custo.
+            """
+            shortcuts = []
+            targets = outgoing[vertex]
+            if not targets:
+                return shortcuts
+            max_target = max(targets.values())
+            for u, weight_uv in incoming[vertex].items():
+                max_cost = weight_uv + max_target
+                # Busca por caminhos alternativos, limitada pelo custo e pela quantidade de vértices.
+                distance = {u: 0}
+                heap = [(0, u)]
+                settled = 0
+                remaining = len(targets)
+                while heap and settled < witness_limit and remaining:
+                    cost, x = heappop(heap)
+                    if cost > distance[x]:
+                        continue
+                    if cost > max_cost:
+                        break
+                    settled += 1
+                    if x in targets:
+                        remaining -= 1
+                    for y, weight in outgoing[x].items():
+                        if y != vertex and cost + weight < distance.get(y, inf):
+                            distance[y] = cost + weight
+                            heappush(heap, (cost + weight, y))
+                for w, weight_vw in targets.items():
+                    if w != u and distance.get(w, inf) > weight_uv + weight_vw:
+                        shortcuts.append((u, w, weight_uv + weight_vw))
+            return shortcuts
+
+        contracted_neighbors = [0] * n
+        # Nível de cada vértice na hierarquia, evitando hierarquias muito profundas.
+        depth = [0] * n
+
+        def get_priority(vertex: int, shortcuts: list[tuple[int, int, int | float]]) -> int:
+            """Calcula a importância de um vértice, os menos importantes são contraídos primeiro."""
+            edge_difference = len(shortcuts) - len(outgoing[vertex]) - len(incoming[vertex])
+            return 2 * edge_difference + contracted_neighbors[vertex] + depth[vertex]
+
+        queue = [(get_priority(vertex, get_shortcuts(vertex)), vertex) for vertex in range(n)]
+        heapify(queue)
+        rank = array("q", [0]) * n
+        sources, targets, weight_list, middles = array("q"), array("q"), [], array("q")
+        next_rank = 0
+        while queue:
+            _, vertex = heappop(queue)
+            # Atualiza a importância, contraindo somente se ainda for o menos importante.
+            shortcuts = get_shortcuts(vertex)
+            priority = get_priority(vertex, shortcuts)
+            if queue and priority > queue[0][0]:
+                heappush(queue, (priority, vertex))
+                continue
+            rank[vertex] = next_rank
+            next_rank += 1
+            # Guarda, na hierarquia, os arcos restantes do vértice e o remove do grafo.
+            for w, weight in outgoing[vertex].items():
+                sources.append(vertex)
+                targets.append(w)
+                weight_list.append(weight)
+                middles.append(middle.get((vertex, w), -1))
+                del incoming[w][vertex]
+                contracted_neighbors[w] += 1
+                depth[w] = max(depth[w], depth[vertex] + 1)
+            for u, weight in incoming[vertex].items():
+                sources.append(u)
+                targets.append(vertex)
+                weight_list.append(weight)
+                middles.append(middle.get((u, vertex), -1))
+                del outgoing[u][vertex]
+                contracted_neighbors[u] += 1
+                depth[u] = max(depth[u], depth[vertex] + 1)
+            outgoing[vertex], incoming[vertex] = {}, {}
+            # Adiciona os atalhos, substituindo arcos de custo maior.
+            for u, w, weight in shortcuts:
+                if weight < outgoing[u].get(w, inf):
+                    outgoing[u][w] = weight
+                    incoming[w][u] = weight
+                    middle[(u, w)] = vertex
+
+        integral = frozen.weights.typecode == "q"
+        return cls(
+            frozen.vertexes,
+            frozen.index,
+            rank,
+            sources,
+            targets,
+            array("q" if integral else "d", weight_list),
+            middles,
+            integral,
+            perf_counter() - start_time,
+        )
+
+    @property
+    def vertex_count(self) -> int:
+        """A quantidade de vértices do grafo."""
+        return len(self.vertexes)
+
+    @property
+    def arc_count(self) -> int:
+        """A quantidade de arcos da hierarquia, incluindo os atalhos."""
+        return len(self.sources)
+
+    @property
+    def shortcut_count(self) -> int:
+        """A quantidade de atalhos da hierarquia."""
+        return sum(1 for middle in self.middles if middle != -1)
+
+    @property
+    def nbytes(self) -> int:
+        """A quantidade de bytes utilizada pelos vetores da hierarquia."""
+        return sum(
+            getsizeof(values) for values in (
+                self.rank, self.sources, self.targets, self.weights, self.middles,
+                self.up_offsets, self.up_arcs, self.down_offsets, self.down_arcs,
+            )
+        )
+
+    def save(self, path: str):
+        """Guarda a hierarquia em um arquivo, para ser carregada sem o pré-processamento.
+
+        Args:
+            path (str): O caminho do arquivo a ser criado.
+
+        Examples:
+            ContractionHierarchy.build(graph).save("Hierarquia.bin")
+            ...
+        """
+        labels = dumps(self.vertexes).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(pack(
+                HEADER_FORMAT, MAGIC, VERSION, b"L" if byteorder == "little" else b"B",
+                b"I" if self.integral else b"F", self.vertex_count, self.arc_count, len(labels),
+            ))
+            file.write(labels)
+            for values in (self.rank, self.sources, self.targets, self.middles, self.weights):
+                values.tofile(file)
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionHierarchy":
+        """Carrega uma hierarquia guardada com o método "save".
+
+        Args:
+            path (str): O caminho do arquivo.
+
+        Returns:
+            ContractionHierarchy: A hierarquia de contração.
+
+        Examples:
+            ContractionHierarchy.load("Hierarquia.bin").query("A", "B")
+            ...
+        """
+        with open(path, "rb") as file:
+            magic, version, order, kind, n, m, labels_length = unpack(HEADER_FORMAT, file.read(HEADER_SIZE))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("O arquivo não é uma hierarquia de contração válida.")
+            if order != (b"L" if byteorder == "little" else b"B"):
+                raise ValueError("A ordem dos bytes do arquivo não é suportada.")
+            vertexes = tuple(loads(file.read(labels_length).decode("utf-8")))
+            values = []
+            for typecode, count in (("q", n), ("q", m), ("q", m), ("q", m), ("q" if kind == b"I" else "d", m)):
+                current = array(typecode)
+                current.fromfile(file, count)
+                values.append(current)
+        rank, sources, targets, middles, weights = values
+        return cls(
+            vertexes, {vertex: i for i, vertex in enumerate(vertexes)},
+            rank, sources, targets, weights, middles, kind == b"I",
+        )
+
+    def get_vertex_index(self, vertex: str) -> int:
+        """Transforma o rótulo de um vértice para o índice.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser buscado.
+
+        Returns:
+            int: O índice do vértice.
+        """
+        if vertex in self.index:
+            return self.index[vertex]
+        raise ValueError("O grafo não possui o vértice: " + vertex)
+
+    def unpack_arc(self, arc: int) -> list[int]:
+        """Substitui um arco, recursivamente, pelos arcos originais que ele representa.
+
+        Args:
+            arc (int): O índice do arco na hierarquia.
+
+        Returns:
+            list[int]: Os índices dos vértices percorridos, sem a origem do arco.
+        """
+        path = []
+        stack = [arc]
+        while stack:
+            current = stack.pop()
+            vertex = self.middles[current]
+            if vertex == -1:
+                path.append(self.targets[current])
+            else:
+                # O segundo trecho é empilhado primeiro, pois é desempilhado por último.
+                stack.append(self.arc_index[(vertex, self.targets[current])])
+                stack.append(self.arc_index[(self.sources[current], vertex)])
+        return path
+
+    def query(self, source: str, destiny: str) -> tuple[int | float, list[str]]:
+        """Calcula o custo e o caminho mínimo entre dois vértices, com a busca bidirecional na hierarquia.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+
+        Returns:
+            tuple[int | float, list[str]]: O custo, infinito caso não seja alcançável, e os rótulos dos vértices do caminho.
+
+        Examples:
+            ContractionHierarchy.build(graph).query("A", "B")
+            ...
+        """
+        s, t = self.get_vertex_index(source), self.get_vertex_index(destiny)
+        weights, targets, sources = self.weights, self.targets, self.sources
+        # Custos e arcos de chegada, da busca a partir da origem e da busca a partir do destino.
+        distances = ({s: 0}, {t: 0})
+        parents = ({}, {})
+        heaps = ([(0, s)], [(0, t)])
+        best, meeting = (0, s) if s == t else (inf, -1)
+        graphs = (
+            (self.up_offsets, self.up_arcs, targets),
+            (self.down_offsets, self.down_arcs, sources),
+        )
+        while heaps[0] or heaps[1]:
+            for direction in (0, 1):
+                heap = heaps[direction]
+                if not heap:
+                    continue
+                cost, vertex = heappop(heap)
+                distance = distances[direction]
+                if cost > distance[vertex]:
+                    continue
+                # A busca, nessa direção, não pode mais melhorar o melhor custo.
+                if cost >= best:
+                    heap.clear()
+                    continue
+                other = distances[1 - direction]
+                if vertex in other and cost + other[vertex] < best:
+                    best, meeting = cost + other[vertex], vertex
+                # Interrompe o vértice (stall-on-demand) caso um vértice mais importante já
+                # visitado o alcance com um custo menor, ele não está em nenhum caminho mínimo.
+                offsets, arcs, ends = graphs[1 - direction]
+                stalled = False
+                for position in range(offsets[vertex], offsets[vertex + 1]):
+                    arc = arcs[position]
+                    if distance.get(ends[arc], inf) + weights[arc] < cost:
+                        stalled = True
+                        break
+                if stalled:
+                    continue
+                offsets, arcs, ends = graphs[direction]
+                for position in range(offsets[vertex], offsets[vertex + 1]):
+                    arc = arcs[position]
+                    neighbor = ends[arc]
+                    new_cost = cost + weights[arc]
+                    if new_cost < distance.get(neighbor, inf):
+                        distance[neighbor] = new_cost
+                        parents[direction][neighbor] = arc
+                        heappush(heap, (new_cost, neighbor))
+                        if neighbor in other and new_cost + other[neighbor] < best:
+                            best, meeting = new_cost + other[neighbor], neighbor
+
+        if meeting == -1:
+            return (inf, [])
+        # Monta o caminho, da origem até o encontro e do encontro até o destino.
+        forward = []
+        vertex = meeting
+        while vertex != s:
+            arc = parents[0][vertex]
+            forward.append(arc)
+            vertex = sources[arc]
+        path = [s]
+        for arc in reversed(forward):
+            path.extend(self.unpack_arc(arc))
+        vertex = meeting
+        while vertex != t:
+            arc = parents[1][vertex]
+            path.extend(self.unpack_arc(arc))
+            vertex = targets[arc]
+        cost = int(best) if self.integral else best
+        return (cost, [self.vertexes[i] for i in path])
+
+    def distance(self, source: str, destiny: str) -> int | float:
+        """Retorna o custo mínimo entre dois vértices.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+
+        Returns:
+            int | float: O custo mínimo, infinito caso o destino não seja alcançável.
+        """
+        return self.query(source, destiny)[0]
+
+    def path(self, source: str, destiny: str) -> list[str]:
+        """Retorna o caminho mínimo entre dois vértices.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+
+        Returns:
+            list[str]: Os rótulos dos vértices do caminho, vazio caso o destino não seja alcançável.
+        """
+        return self.query(source, destiny)[1]
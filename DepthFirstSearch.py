@@ -1,6 +1,8 @@
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 from Graph import Graph
+from TreeView import TreeView
 
 
 @dataclass
@@ -24,31 +26,58 @@ class DepthFirstSearch:
             DepthFirstSearch(...).apply_dfs("1")
             ...
         """
-        
-        def dfs_until(source: str):
-            """Implementação recursiva do Depth-First Search.
-
-            Args:
-                source (str): O rótulo do vértice tomado como ponto de partida.
-            """
-
-            # Marca o vértice atual como visitado.
-            source_index = self.graph.translate_vertex_label_to_index(source)
-            visited[source_index] = True
-            # Visita os vértices adjacentes.
-            for neighbor_index, neighbor in enumerate(self.graph.vertexes):
-                if self.graph.contain_undirected_edge((source, neighbor)):
-                    if not visited[neighbor_index]:
-                        # Adiciona ao caminho percorrido e repete todo o processo.
-                        path.append((source, neighbor))
-                        dfs_until(neighbor)
+        return list(self.iter_dfs(source))
+
+    def iter_dfs(self, source: str) -> Iterator[tuple[str, str]]:
+        """Realiza a Busca em Profundidade, gerando os arcos conforme são descobertos.
+
+        A busca pode ser interrompida a qualquer momento, basta parar a iteração.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Yields:
+            tuple[str, str]: O arco percorrido pelo algoritmo, os rótulos dos vértices.
+
+        Examples:
+            next(DepthFirstSearch(...).iter_dfs("A"))
 
+            for edge in DepthFirstSearch(...).iter_dfs("1"): ...
+        """
+        graph = self.graph.freeze()
+        vertexes = graph.vertexes
+        for parent, child in self.iter_dfs_indexes(graph.translate_vertex_label_to_index(source)):
+            yield (vertexes[parent], vertexes[child])
+
+    def iter_dfs_indexes(self, source: int) -> Iterator[tuple[int, int]]:
+        """Realiza a Busca em Profundidade utilizando somente os índices dos vértices.
+
+        Args:
+            source (int): O índice do vértice tomado como ponto de partida.
+
+        Yields:
+            tuple[int, int]: O arco percorrido pelo algoritmo, os índices dos vértices.
+        """
+        graph = self.graph.freeze()
+        offsets, targets = graph.undirected_offsets, graph.undirected_targets
         # Indica quais vértices foram visitados.
-        visited = [False] * self.graph.vertex_count
-        # Indica o caminho percorrido pelo algoritmo.
-        path = []
-        dfs_until(source)
-        return path
+        visited = bytearray(graph.vertex_count)
+        visited[source] = 1
+        # Pilha com os vértices e os vizinhos que ainda não foram verificados.
+        stack = [(source, iter(range(offsets[source], offsets[source + 1])))]
+        while stack:
+            current_vertex, positions = stack[-1]
+            for position in positions:
+                neighbor = targets[position]
+                if not visited[neighbor]:
+                    # Marca o vizinho como visitado e continua a partir dele.
+                    visited[neighbor] = 1
+                    stack.append((neighbor, iter(range(offsets[neighbor], offsets[neighbor + 1]))))
+                    yield (current_vertex, neighbor)
+                    break
+            else:
+                # Todos os vizinhos foram verificados, retorna ao vértice anterior.
+                stack.pop()
 
     def get_dfs_level(self, source: str) -> dict[str, int]:
         """Retorna o nível de profundidade dos vértices percorridos pelo DFS.
@@ -65,54 +94,37 @@ class DepthFirstSearch:
             DepthFirstSearch(...).get_dfs_level("1")
             ...
         """
+        graph = self.graph.freeze()
         # Nível de profundidade dos vértices.
-        depth = dict.fromkeys(self.graph.vertexes, 0)
-        # Caminho percorrido pelo DFS.
-        path = self.apply_dfs(source)
-        # Atualiza o nível de profundiade dos vértices.
-        for edge in path:
-            # Extrai o rótulo dos arcos.
-            (i, j) = edge
-            # Atualiza o nível.
+        depth = [0] * graph.vertex_count
+        # Atualiza o nível de profundidade dos vértices, percorrendo o caminho do DFS.
+        for i, j in self.iter_dfs_indexes(graph.translate_vertex_label_to_index(source)):
             depth[j] = depth[i] + 1
-        return depth
+        return dict(zip(graph.vertexes, depth))
     
-    def get_dfs_tree(self, source: str) -> Graph:
+    def get_dfs_tree(self, source: str) -> TreeView:
         """Gera a Árvore de Profundidade do DFS.
 
+        A árvore é uma visão, guardada como um vetor de antecessores, sobre a
+        cópia imutável do grafo, e possui os mesmos métodos de leitura do
+        "Graph", o método "materialize" cria o "Graph" da árvore.
+        Os arcos da árvore possuem o custo do arco percorrido no grafo.
+
         Args:
             source (str): O rótulo do vértice tomado como ponto de partida.
 
         Returns:
-            Graph: A Árvore de Profundidade.
+            TreeView: A Árvore de Profundidade.
         
         Examples:
             DepthFirstSearch(...).get_dfs_tree("A")
 
-            DepthFirstSearch(...).get_dfs_tree("1")
+            DepthFirstSearch(...).get_dfs_tree("1").materialize()
             ...
         """
-        # Inicializa a matriz de incidência da árvore de profundidade.
-        tree = Graph()
-        # Caminho percorrido pelo DFS.
-        path = self.apply_dfs(source)
-        # Vértices inclusos no caminho percorrido pelo DFS.
-        vertexes_in_dfs_path = self.get_dfs_vertexes(source)
-        # Adiciona os vértices.
-        for vertex in vertexes_in_dfs_path:
-            tree.add_vertex(vertex)
-        # Adiciona os arcos.
-        for edge in path:
-            # Custo do arco.
-            cost = self.graph.get_edge_weight(edge)
-            # Por fim, adiciona os arcos com os custos.
-            tree.add_edge_undirected(edge, cost)
-        # Monta o grafo.
-        tree.create_graph()
-        # Atualiza o grafo.
-        tree.update_graph()
-        # Retorna o grafo.
-        return tree
+        graph = self.graph.freeze()
+        source_index = graph.translate_vertex_label_to_index(source)
+        return TreeView.from_arcs(graph, source_index, self.iter_dfs_indexes(source_index))
 
     def get_dfs_vertexes(self, source: str) -> list[str]:
         """Indica quais vértices foram percorridos pelo DFS.
@@ -129,6 +141,9 @@ class DepthFirstSearch:
             DepthFirstSearch(...).get_dfs_vertexes("1")
             ...
         """
-        # Caminho percorrido pelo DFS.
-        path = self.apply_dfs(source)
-        return sorted(set([vertex for edge in path for vertex in edge])) 
+        graph = self.graph.freeze()
+        # Vértices inclusos no caminho percorrido pelo DFS.
+        vertexes = set()
+        for edge in self.iter_dfs_indexes(graph.translate_vertex_label_to_index(source)):
+            vertexes.update(edge)
+        return sorted(graph.vertexes[vertex] for vertex in vertexes)
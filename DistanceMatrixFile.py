@@ -0,0 +1,185 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from json import dumps, loads
+from mmap import ACCESS_READ, mmap
+from os import cpu_count
+from struct import calcsize, pack, unpack_from
+from sys import byteorder
+
+from BlockedFloydWarshall import attach_storage, detach_storage, run_blocked_phases
+from FrozenGraph import FrozenGraph
+from Graph import Graph
+from Kernels import dijkstra
+
+# Cabeçalho: identificador, versão, ordem dos bytes, quantidade de vértices,
+# tamanho dos rótulos e posição da matriz de custos no arquivo.
+HEADER_FORMAT = "<4sHcxQQQ"
+HEADER_SIZE = calcsize(HEADER_FORMAT)
+MAGIC = b"GRDM"
+VERSION = 1
+
+
+def write_dijkstra_rows(descriptor: tuple, graph: FrozenGraph, sources: range):
+    """Escreve, no arquivo, as linhas da matriz de custos, aplicando o Dijkstra em cada origem.
+
+    Args:
+        descriptor (tuple): A localização da matriz de custos no arquivo.
+        graph (FrozenGraph): A cópia imutável do grafo.
+        sources (range): Os índices dos vértices de origem.
+    """
+    distances, _ = attach_storage(descriptor)
+    n = graph.vertex_count
+    try:
+        for source in sources:
+            # O Dijkstra do núcleo compilado, caso disponível.
+            distance, _ = dijkstra(graph.offsets, graph.targets, graph.weights, n, source)
+            distances[source * n:(source + 1) * n] = distance
+    finally:
+        detach_storage(descriptor)
+
+
+@dataclass
+class DistanceMatrixFile:
+    """Representa uma matriz de custos mínimos, entre todos os pares de vértices, guardada em arquivo.
+
+    O arquivo é mapeado em memória, sendo assim, cada consulta lê somente
+    o custo solicitado e o arquivo pode ser lido por múltiplos processos.
+    """
+
+    path: str
+    vertexes: tuple[str, ...] = field(init=False, default=())
+    index: dict[str, int] = field(repr=False, init=False, default_factory=dict)
+    data_offset: int = field(repr=False, init=False, default=0)
+    memory: mmap | None = field(repr=False, init=False, default=None)
+
+    @classmethod
+    def write(
+        cls,
+        graph: Graph | FrozenGraph,
+        path: str,
+        method: str = "dijkstra",
+        tile_size: int = 64,
+        workers: int | None = None,
+    ) -> "DistanceMatrixFile":
+        """Calcula os custos mínimos entre todos os pares de vértices, diretamente no arquivo.
+
+        Args:
+            graph (Graph | FrozenGraph): O grafo.
+            path (str): O caminho do arquivo a ser criado.
+            method (str, optional): "dijkstra", uma linha por origem, ou "floyd-warshall", em blocos.
+            tile_size (int, optional): O tamanho dos blocos do Floyd-Warshall.
+            workers (int | None, optional): A quantidade de processos, por padrão, a quantidade de CPUs.
+
+        Returns:
+            DistanceMatrixFile: O arquivo, aberto para consultas.
+
+        Examples:
+            DistanceMatrixFile.write(graph, "Custos.bin")
+
+            DistanceMatrixFile.write(graph, "Custos.bin", "floyd-warshall", 128, 8)
+            ...
+        """
+        frozen = graph.freeze()
+        n = frozen.vertex_count
+        workers = workers or cpu_count() or 1
+        if method == "dijkstra" and any(weight < 0 for weight in frozen.weights):
+            raise ValueError("O Dijkstra não suporta custos negativos, utilize o Floyd-Warshall.")
+        if method not in ("dijkstra", "floyd-warshall"):
+            raise ValueError("O método não é suportado: " + method)
+
+        # Escreve o cabeçalho e os rótulos, alinhando a matriz de custos em 8 bytes.
+        labels = dumps(frozen.vertexes).encode("utf-8")
+        data_offset = HEADER_SIZE + len(labels)
+        data_offset += -data_offset % 8
+        length = n * n * 8
+        with open(path, "wb") as file:
+            file.write(pack(
+                HEADER_FORMAT, MAGIC, VERSION, b"L" if byteorder == "little" else b"B", n, len(labels), data_offset
+            ))
+            file.write(labels)
+            file.truncate(data_offset + length)
+
+        descriptor = ("file", path, data_offset, length)
+        if method == "dijkstra":
+            # As linhas são independentes, sendo assim, são divididas entre os processos.
+            chunk = max(1, -(-n // workers))
+            chunks = [range(start, min(start + chunk, n)) for start in range(0, n, chunk)]
+            if workers > 1 and len(chunks) > 1:
+                with ProcessPoolExecutor(workers) as executor:
+                    for future in [executor.submit(write_dijkstra_rows, descriptor, frozen, rows) for rows in chunks]:
+                        future.result()
+            else:
+                for rows in chunks:
+                    write_dijkstra_rows(descriptor, frozen, rows)
+        else:
+            # Inicializa a matriz, no arquivo, antes das fases do Floyd-Warshall.
+            distances, _ = attach_storage(descriptor)
+            try:
+                infinity_row = array("d", [float("inf")]) * n
+                for i in range(n):
+                    distances[i * n:(i + 1) * n] = infinity_row
+                    distances[i * n + i] = 0
+                for i, j, weight in frozen.iter_edges():
+                    distances[i * n + j] = weight
+            finally:
+                detach_storage(descriptor)
+            if n > 0:
+                run_blocked_phases(descriptor, n, tile_size, workers)
+        return cls(path).open()
+
+    def open(self) -> "DistanceMatrixFile":
+        """Abre o arquivo, somente para leitura, e lê o cabeçalho e os rótulos.
+
+        Returns:
+            DistanceMatrixFile: O próprio arquivo.
+        """
+        with open(self.path, "rb") as file:
+            self.memory = mmap(file.fileno(), 0, access=ACCESS_READ)
+        magic, version, order, n, labels_length, data_offset = unpack_from(HEADER_FORMAT, self.memory)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("O arquivo não é uma matriz de custos válida.")
+        if order != (b"L" if byteorder == "little" else b"B"):
+            self.close()
+            raise ValueError("A ordem dos bytes do arquivo não é suportada.")
+        self.vertexes = tuple(loads(self.memory[HEADER_SIZE:HEADER_SIZE + labels_length].decode("utf-8")))
+        self.index = {vertex: i for i, vertex in enumerate(self.vertexes)}
+        self.data_offset = data_offset
+        return self
+
+    def close(self):
+        """Fecha o arquivo."""
+        if self.memory is not None:
+            self.memory.close()
+            self.memory = None
+
+    def __enter__(self) -> "DistanceMatrixFile":
+        if self.memory is None:
+            self.open()
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def distance(self, source: str, destiny: str) -> float:
+        """Retorna o custo mínimo entre dois vértices, lendo somente esse custo do arquivo.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+
+        Returns:
+            float: O custo mínimo, infinito caso o destino não seja alcançável.
+
+        Examples:
+            DistanceMatrixFile("Custos.bin").open().distance("A", "B")
+            ...
+        """
+        if self.memory is None:
+            raise ValueError("O arquivo não está aberto.")
+        for vertex in (source, destiny):
+            if vertex not in self.index:
+                raise ValueError("O grafo não possui o vértice: " + vertex)
+        position = self.index[source] * len(self.vertexes) + self.index[destiny]
+        return unpack_from("d", self.memory, self.data_offset + position * 8)[0]
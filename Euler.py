@@ -1,36 +1,69 @@
-from copy import deepcopy
 from dataclasses import dataclass, field
 from random import choice
 
-from DepthFirstSearch import DepthFirstSearch
 from Graph import Graph
 
 
 @dataclass
 class Euler:
-    """Responsável por operações Eulerianas."""
+    """Responsável por operações Eulerianas.
+
+    No modo direcionado, os arcos são percorridos somente na sua direção e
+    os teoremas utilizam os graus de entrada e de saída dos vértices.
+    """
 
     graph: Graph = field(repr=False)
+    directed: bool = False
 
     def is_graph_euler(self) -> bool:
         """Verifica se o grafo está de acordo com o Teorema de Euler.
 
+        Todos os vértices devem possuir grau par e os vértices com arcos devem estar conectados.
+
         Returns:
             bool: Se o grafo está de acordo com o Teorema de Euler.
         """
-        return all(
-            degree % 2 == 0 for degree in self.graph.get_vertexes_degree()
-        )
+        properties = self.graph.get_properties()
+        if self.directed:
+            # Os graus de entrada e de saída devem ser iguais e os vértices com arcos fortemente conectados.
+            return properties.degree == properties.in_degree and properties.strongly_connected
+        return properties.odd_count == 0 and properties.connected
     
     def is_graph_semi_euler(self) -> bool:
         """Verifica se o grafo está de acordo com o Teorema Semi-Euleriano.
 
+        Exatamente dois vértices devem possuir grau ímpar e os vértices com arcos devem estar conectados.
+
         Returns:
             bool: Se o grafo está de acordo com o Teorema de Semi-Euleriano.
         """
-        return [
-            degree % 2 != 0 for degree in self.graph.get_vertexes_degree()
-        ].count(True) == 2
+        properties = self.graph.get_properties()
+        if self.directed:
+            return self.get_directed_endpoints() is not None and properties.connected
+        return properties.odd_count == 2 and properties.connected
+
+    def get_directed_endpoints(self) -> tuple[int, int] | None:
+        """Procura o início e o fim de um caminho Euleriano direcionado, que não seja um circuito.
+
+        O início deve possuir um arco de saída a mais, o fim um arco de entrada a
+        mais e os demais vértices a mesma quantidade de arcos de entrada e de saída.
+
+        Returns:
+            tuple[int, int] | None: Os índices do início e do fim, ou None caso não existam.
+        """
+        properties = self.graph.get_properties()
+        start = end = None
+        for vertex, (out_degree, in_degree) in enumerate(zip(properties.degree, properties.in_degree)):
+            difference = out_degree - in_degree
+            if difference == 0:
+                continue
+            if difference == 1 and start is None:
+                start = vertex
+            elif difference == -1 and end is None:
+                end = vertex
+            else:
+                return None
+        return (start, end) if start is not None and end is not None else None
 
     def get_euler_circuit(self) -> dict[str, list[tuple[str, ...] | int]]:
         """Gera o circuito euleriano de um grafo, caso o grafo seja euleriano ou semi-euleriano.
@@ -38,54 +71,95 @@ class Euler:
         Returns:
             dict[str, list[tuple[str, ...] | int]]: As informações do circuito euleriano.
         """
+        if self.directed:
+            return self.get_directed_euler_circuit()
+
+        def contain_edge(source: int, destiny: int) -> bool:
+            """Verifica se um arco não-direcionado existe, com os índices dos vértices.
+
+            Args:
+                source (int): O índice do vértice tomado como ponto de partida.
+                destiny (int): O índice do vértice tomado como destino.
+
+            Returns:
+                bool: Se o arco existe.
+            """
+            return (
+                graph_copy.get_index_weight(source, destiny) is not None
+                and graph_copy.get_index_weight(destiny, source) is not None
+            )
+
+        def set_edge(source: int, destiny: int, cost: int | None):
+            """Adiciona, ou remove, caso o custo seja None, um arco não-direcionado.
+
+            Args:
+                source (int): O índice do vértice tomado como ponto de partida.
+                destiny (int): O índice do vértice tomado como destino.
+                cost (int | None): O custo do arco.
+            """
+            graph_copy.set_index_weight(source, destiny, cost)
+            graph_copy.set_index_weight(destiny, source, cost)
+
+        def get_reachable_vertexes(source: int) -> set[int]:
+            """Indica quais vértices são alcançados pelo DFS.
+
+            Args:
+                source (int): O índice do vértice tomado como ponto de partida.
+
+            Returns:
+                set[int]: Os índices dos vértices percorridos, vazio caso nenhum arco seja percorrido.
+            """
+            visited = {source}
+            stack = [source]
+            while stack:
+                vertex = stack.pop()
+                for neighbor in graph_copy.neighbors(vertex):
+                    if neighbor not in visited and contain_edge(vertex, neighbor):
+                        visited.add(neighbor)
+                        stack.append(neighbor)
+            return visited if len(visited) > 1 else set()
 
-        def is_a_bridge(source: str, destiny: str) -> bool:
+        def is_a_bridge(source: int, destiny: int) -> bool:
             """Verifica se um arco é uma ponte.
 
             Args:
-                source (str): O rótulo do vértice tomado como ponto de partida.
-                destiny (str): O rótulo do vértice tomado como destino.
+                source (int): O índice do vértice tomado como ponto de partida.
+                destiny (int): O índice do vértice tomado como destino.
 
             Returns:
                 bool: Se o arco é uma ponte.
             """
             # Conserva o custo do arco, pois o arco será adicionado a seguir.
-            edge_cost = graph_copy.get_edge_weight((source, destiny))
+            edge_cost = graph_copy.get_index_weight(source, destiny)
             # Remove o arco, para verificação de pontes.
-            graph_copy.remove_edge_undirected((source, destiny))
+            set_edge(source, destiny, None)
             # Vértices percorridos pelo DFS.
-            vertexes_in_dfs_path = dfs.get_dfs_vertexes(source)
+            vertexes_in_dfs_path = get_reachable_vertexes(source)
             # Adiciona o arco removido, com o seu custo original.
-            graph_copy.add_edge_undirected((source, destiny), edge_cost)
-            # Inidica se todos os vértices do grafo foram visitados.
-            visited_vertexes = [vertex in vertexes_in_dfs_path for vertex in graph_copy.vertexes]
-            # Atualiza o grau dos vértices do grafo, pois arcos serão removidos.
-            degree = graph_copy.get_vertexes_degree()
-            # Marca os vértices que não possuem arcos como visitados.
-            for index, vertex_degree in enumerate(degree):
-                if not vertex_degree:
-                    visited_vertexes[index] = True
-            return all(visited_vertexes)
-
-        def is_path_valid(source: str, destiny: str) -> bool:
+            set_edge(source, destiny, edge_cost)
+            # Verifica se todos os vértices foram visitados, os vértices que não possuem arcos são ignorados.
+            return all(
+                vertex in vertexes_in_dfs_path or not vertex_degree
+                for vertex, vertex_degree in enumerate(graph_copy.degree)
+            )
+
+        def is_path_valid(source: int, destiny: int) -> bool:
             """Verifica se o próximo vértice, o destino, é um caminho válido.
 
             Args:
-                source (str): O rótulo do vértice tomado como ponto de partida.
-                destiny (str): O rótulo do vértice tomado como destino.
+                source (int): O índice do vértice tomado como ponto de partida.
+                destiny (int): O índice do vértice tomado como destino.
 
             Returns:
                 bool: Se o próximo vértice, ou seja o destino, é um caminho válido.
             """
-            # Atualiza o grau dos vértices do grafo, pois arcos serão removidos.
-            degree = graph_copy.get_vertexes_degree()
-            if degree[graph_copy.translate_vertex_label_to_index(source)] != 1:
+            if graph_copy.degree[source] != 1:
                 return is_a_bridge(source, destiny)
             return True
 
         def get_next_valid_path(source: str) -> dict[str, list[tuple[str, ...] | int]]:
-            """Percorre todos os vértices, verificando os arcos 
-            e escolhendo aquele que é válido.
+            """Percorre os vizinhos de cada vértice, verificando os arcos
+            e escolhendo aquele que é válido, até que não existam arcos.
 
             Args:
                 source (str): O rótulo do vértice tomado como ponto de partida.
@@ -93,37 +167,92 @@ class Euler:
             Returns:
                 dict[str, list[tuple[str, ...] | int]]: As informações do circuito euleriano.
             """
-            for vertex in graph_copy.vertexes:
-                if graph_copy.contain_undirected_edge((source, vertex)):
-                    if is_path_valid(source, vertex):
+            vertexes = graph_copy.vertexes
+            current = graph_copy.translate_vertex_label_to_index(source)
+            while True:
+                for vertex in graph_copy.neighbors(current):
+                    if contain_edge(current, vertex) and is_path_valid(current, vertex):
                         # Adiciona as informações do circuito euleriano.
-                        euler_circuit["Caminho Euleriano"].append((source, vertex))
-                        euler_circuit["Custo do Caminho"].append(graph_copy.get_edge_weight((source, vertex)))
+                        euler_circuit["Caminho Euleriano"].append((vertexes[current], vertexes[vertex]))
+                        euler_circuit["Custo do Caminho"].append(graph_copy.get_index_weight(current, vertex))
                         # Remove o arco.
-                        graph_copy.remove_edge_undirected((source, vertex))
+                        set_edge(current, vertex, None)
                         # Repete todo o processo.
-                        return get_next_valid_path(vertex)
-            return euler_circuit
+                        current = vertex
+                        break
+                else:
+                    return euler_circuit
 
         # Define as informações do circuito euleriano.
         euler_circuit = {"Caminho Euleriano": [], "Custo do Caminho": []}
 
-        # Copia o grafo e a contagem de graus dos vértices.
-        graph_copy = deepcopy(self.graph)
+        # Cria uma camada mutável sobre o grafo, sem copiá-lo, e a contagem de graus dos vértices.
+        graph_copy = self.graph.freeze().overlay()
         degree = graph_copy.get_vertexes_degree()
 
-        # Inicializa a classe DFS.
-        dfs = DepthFirstSearch(graph_copy)
-
-        # Define o ponto de partida.
+        # Define o ponto de partida, um vértice com arcos ou, no caminho, um dos vértices de grau ímpar.
         if self.is_graph_euler():
-            return get_next_valid_path(choice(graph_copy.vertexes))
+            valid_source = [vertex for vertex, vertex_degree in enumerate(degree) if vertex_degree]
+            if not valid_source:
+                return euler_circuit
         elif self.is_graph_semi_euler():
-            valid_source = list(filter(lambda x: x % 2 != 0, degree))
-            return get_next_valid_path(
-                graph_copy.translate_vertex_index_to_label(
-                    valid_source.index(choice(valid_source))
-                )
-            )
+            valid_source = [vertex for vertex, vertex_degree in enumerate(degree) if vertex_degree % 2 != 0]
+        else:
+            raise ValueError("O grafo não é euleriano ou semi-euleriano.")
+        return get_next_valid_path(graph_copy.translate_vertex_index_to_label(choice(valid_source)))
+
+    def get_directed_euler_circuit(self) -> dict[str, list[tuple[str, ...] | int]]:
+        """Gera o circuito, ou caminho, euleriano de um grafo direcionado, em tempo linear.
+
+        Utiliza o algoritmo de Hierholzer, com uma pilha e a posição do próximo
+        arco, não utilizado, de cada vértice, diretamente sobre os vetores de arcos.
+
+        Returns:
+            dict[str, list[tuple[str, ...] | int]]: As informações do circuito euleriano.
+
+        Examples:
+            Euler(..., directed=True).get_directed_euler_circuit()
+            ...
+        """
+        graph = self.graph.freeze()
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        properties = graph.get_properties()
+
+        # Define o ponto de partida.
+        if properties.degree == properties.in_degree and properties.strongly_connected:
+            source = next((vertex for vertex, degree in enumerate(properties.degree) if degree), None)
+        elif properties.connected and (endpoints := self.get_directed_endpoints()) is not None:
+            source = endpoints[0]
         else:
             raise ValueError("O grafo não é euleriano ou semi-euleriano.")
+
+        euler_circuit = {"Caminho Euleriano": [], "Custo do Caminho": []}
+        if source is None:
+            return euler_circuit
+
+        # Posição do próximo arco, ainda não utilizado, de cada vértice.
+        next_position = list(offsets[:-1])
+        # A pilha guarda o vértice e a posição do arco pelo qual ele foi alcançado.
+        stack = [(source, -1)]
+        positions = []
+        while stack:
+            vertex, _ = stack[-1]
+            position, end = next_position[vertex], offsets[vertex + 1]
+            # Arcos de custo 0 não são contados, assim como na matriz de adjacência.
+            while position < end and weights[position] == 0:
+                position += 1
+            if position < end:
+                next_position[vertex] = position + 1
+                stack.append((targets[position], position))
+            else:
+                next_position[vertex] = position
+                _, arrival = stack.pop()
+                if stack:
+                    positions.append((stack[-1][0], arrival))
+
+        # Os arcos são retirados da pilha na ordem inversa do circuito.
+        vertexes = graph.vertexes
+        for vertex, position in reversed(positions):
+            euler_circuit["Caminho Euleriano"].append((vertexes[vertex], vertexes[targets[position]]))
+            euler_circuit["Custo do Caminho"].append(weights[position])
+        return euler_circuit
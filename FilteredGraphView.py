@@ -0,0 +1,65 @@
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+
+from FrozenGraph import FrozenGraph
+from GraphView import GraphView
+
+
+@dataclass(frozen=True, slots=True)
+class FilteredGraphView(GraphView):
+    """Representa o grafo com somente os arcos que satisfazem uma condição, sem copiar os arcos.
+
+    Todos os vértices pertencem à visão, a condição é verificada a cada leitura.
+    """
+
+    base: FrozenGraph = field(repr=False)
+    condition: Callable[[str, str, int | float], bool] = field(repr=False)
+    cache: dict[str, object] = field(repr=False, compare=False, default_factory=dict)
+
+    @property
+    def members(self) -> Sequence[int]:
+        """Os índices, no grafo base, dos vértices da visão, em ordem crescente."""
+        return range(self.base.vertex_count)
+
+    def has_vertex(self, i: int) -> bool:
+        """Verifica se um vértice, pelo índice no grafo base, pertence à visão.
+
+        Args:
+            i (int): O índice do vértice no grafo base.
+
+        Returns:
+            bool: Se o vértice pertence à visão.
+        """
+        return 0 <= i < self.base.vertex_count
+
+    def iter_arcs(self, i: int) -> Iterator[tuple[int, int | float]]:
+        """Percorre os arcos de saída de um vértice que satisfazem a condição.
+
+        Args:
+            i (int): O índice do vértice no grafo base.
+
+        Yields:
+            tuple[int, int | float]: O índice do vizinho e o custo do arco.
+        """
+        base, condition = self.base, self.condition
+        vertexes = base.vertexes
+        for position in range(base.offsets[i], base.offsets[i + 1]):
+            j, weight = base.targets[position], base.weights[position]
+            if condition(vertexes[i], vertexes[j], weight):
+                yield (j, weight)
+
+    def get_index_weight(self, i: int, j: int) -> int | float | None:
+        """Retorna o custo de um arco da visão, com os índices do grafo base.
+
+        Args:
+            i (int): O índice do vértice de origem.
+            j (int): O índice do vértice de destino.
+
+        Returns:
+            int | float | None: O custo do arco, ou None caso o arco não pertença à visão.
+        """
+        position = self.base.find_edge_position(i, j)
+        if position == -1:
+            return None
+        weight = self.base.weights[position]
+        return weight if self.condition(self.base.vertexes[i], self.base.vertexes[j], weight) else None
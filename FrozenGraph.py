@@ -0,0 +1,461 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenGraph:
+    """Representa uma cópia imutável e compacta de um grafo.
+
+    Os arcos são guardados em vetores (CSR), ordenados pelo índice dos
+    vértices, sendo assim, a cópia pode ser lida por múltiplas threads
+    ao mesmo tempo, sem a necessidade de travas.
+    """
+
+    vertexes: tuple[str, ...]
+    index: dict[str, int] = field(repr=False)
+    offsets: array = field(repr=False)
+    targets: array = field(repr=False)
+    weights: array = field(repr=False)
+    undirected_offsets: array = field(repr=False)
+    undirected_targets: array = field(repr=False)
+    cache: dict[str, object] = field(repr=False, compare=False, default_factory=dict)
+
+    @classmethod
+    def from_edges(cls, vertexes: Iterable[str], edges: Iterable[tuple[int, int, int | float]]) -> "FrozenGraph":
+        """Cria uma cópia imutável a partir dos vértices e dos arcos, com os índices dos vértices.
+
+        Args:
+            vertexes (Iterable[str]): Os rótulos dos vértices.
+            edges (Iterable[tuple[int, int, int | float]]): Os arcos, a origem, o destino e o custo.
+
+        Returns:
+            FrozenGraph: A cópia imutável do grafo.
+
+        Examples:
+            FrozenGraph.from_edges(("A", "B"), [(0, 1, 3)])
+            ...
+        """
+        vertexes = tuple(vertexes)
+        vertex_count = len(vertexes)
+        # Agrupa os arcos pelo vértice de origem.
+        rows = [[] for _ in range(vertex_count)]
+        for i, j, weight in edges:
+            rows[i].append((j, weight))
+
+        offsets = array("q", [0])
+        targets = array("q")
+        weight_list = []
+        for row in rows:
+            row.sort()
+            for j, weight in row:
+                targets.append(j)
+                weight_list.append(weight)
+            offsets.append(len(targets))
+        # Custos inteiros são guardados como inteiros, os demais como reais.
+        if all(isinstance(weight, int) for weight in weight_list):
+            weights = array("q", weight_list)
+        else:
+            weights = array("d", weight_list)
+
+        # Arcos não-direcionados, ou seja, que possuem o arco inverso.
+        undirected_offsets = array("q", [0])
+        undirected_targets = array("q")
+        for i in range(vertex_count):
+            for position in range(offsets[i], offsets[i + 1]):
+                j = targets[position]
+                start, end = offsets[j], offsets[j + 1]
+                reverse = bisect_left(targets, i, start, end)
+                if reverse < end and targets[reverse] == i:
+                    undirected_targets.append(j)
+            undirected_offsets.append(len(undirected_targets))
+
+        return cls(
+            vertexes,
+            {vertex: i for i, vertex in enumerate(vertexes)},
+            offsets,
+            targets,
+            weights,
+            undirected_offsets,
+            undirected_targets,
+        )
+
+    @property
+    def vertex_count(self) -> int:
+        """A quantidade de vértices do grafo."""
+        return len(self.vertexes)
+
+    @property
+    def edge_count(self) -> int:
+        """A quantidade de arcos direcionados do grafo."""
+        return len(self.targets)
+
+    def freeze(self) -> "FrozenGraph":
+        """Retorna a própria cópia, pois ela já é imutável.
+
+        Returns:
+            FrozenGraph: A cópia imutável do grafo.
+        """
+        return self
+
+    def overlay(self) -> "GraphOverlay":
+        """Cria uma camada mutável, copy-on-write, sobre a cópia imutável.
+
+        Returns:
+            GraphOverlay: A camada mutável do grafo.
+
+        Examples:
+            Graph().freeze().overlay()
+            ...
+        """
+        from GraphOverlay import GraphOverlay
+
+        return GraphOverlay(self)
+
+    def permute(self, order: list[int]) -> "FrozenGraph":
+        """Cria uma cópia com os vértices renumerados, mantendo os rótulos, os arcos e os custos.
+
+        Como os algoritmos retornam os rótulos dos vértices, os resultados
+        continuam os mesmos, somente a ordem de visita dos empates pode mudar.
+
+        Args:
+            order (list[int]): Os índices originais dos vértices, na nova ordem.
+
+        Returns:
+            FrozenGraph: A cópia renumerada do grafo.
+
+        Examples:
+            Graph().freeze().permute([2, 0, 1])
+            ...
+        """
+        if sorted(order) != list(range(self.vertex_count)):
+            raise ValueError("A ordem deve conter cada índice dos vértices uma única vez.")
+        position = [0] * self.vertex_count
+        for new_index, old_index in enumerate(order):
+            position[old_index] = new_index
+        return FrozenGraph.from_edges(
+            (self.vertexes[old_index] for old_index in order),
+            ((position[i], position[j], weight) for i, j, weight in self.iter_edges()),
+        )
+
+    def reorder(self, method: str = "rcm") -> "FrozenGraph":
+        """Cria uma cópia com os vértices renumerados, melhorando a localidade dos arcos.
+
+        Args:
+            method (str, optional): "bfs", "rcm" (Cuthill–McKee reverso) ou "degree".
+
+        Returns:
+            FrozenGraph: A cópia renumerada do grafo.
+
+        Examples:
+            Graph().freeze().reorder("rcm")
+            ...
+        """
+        from GraphOrdering import GraphOrdering
+
+        return self.permute(GraphOrdering(self).get_order(method))
+
+    def compress(self) -> "CompressedGraph":
+        """Cria uma cópia somente leitura, com os arcos comprimidos (delta/varint).
+
+        Returns:
+            CompressedGraph: A cópia comprimida do grafo.
+
+        Examples:
+            Graph().freeze().reorder().compress()
+            ...
+        """
+        from CompressedGraph import CompressedGraph
+
+        return CompressedGraph.from_frozen(self)
+
+    def get_properties(self) -> "GraphProperties":
+        """Retorna o perfil de graus e de conectividade do grafo, calculado uma única vez.
+
+        Returns:
+            GraphProperties: O perfil do grafo.
+
+        Examples:
+            Graph().freeze().get_properties().min_degree
+            ...
+        """
+        if "properties" not in self.cache:
+            from GraphProperties import GraphProperties
+
+            self.cache["properties"] = GraphProperties.from_frozen(self)
+        return self.cache["properties"]
+
+    def get_topological_order(self) -> array | None:
+        """Retorna os índices dos vértices em ordem topológica, calculada uma única vez (algoritmo de Kahn).
+
+        Returns:
+            array | None: Os índices dos vértices, ou None caso o grafo possua um ciclo.
+
+        Examples:
+            Graph().freeze().get_topological_order()
+            ...
+        """
+        if "topological_order" not in self.cache:
+            offsets, targets = self.offsets, self.targets
+            in_degree = [0] * self.vertex_count
+            for j in targets:
+                in_degree[j] += 1
+            order = array("q", (i for i in range(self.vertex_count) if in_degree[i] == 0))
+            for i in order:
+                for position in range(offsets[i], offsets[i + 1]):
+                    j = targets[position]
+                    in_degree[j] -= 1
+                    if in_degree[j] == 0:
+                        order.append(j)
+            # Os vértices de um ciclo nunca ficam sem antecessores.
+            self.cache["topological_order"] = order if len(order) == self.vertex_count else None
+        return self.cache["topological_order"]
+
+    def get_reachability_index(self) -> "ReachabilityIndex":
+        """Retorna o índice de alcançabilidade do grafo, calculado uma única vez.
+
+        Returns:
+            ReachabilityIndex: O índice de alcançabilidade.
+
+        Examples:
+            Graph().freeze().get_reachability_index().is_reachable("A", "B")
+            ...
+        """
+        if "reachability" not in self.cache:
+            from ReachabilityIndex import ReachabilityIndex
+
+            self.cache["reachability"] = ReachabilityIndex.build(self)
+        return self.cache["reachability"]
+
+    def get_subgraph_view(self, vertexes: tuple[str, ...]) -> "SubgraphView":
+        """Cria o subgrafo induzido por um conjunto de vértices, sem copiar os arcos.
+
+        Args:
+            vertexes (tuple[str, ...]): Os rótulos dos vértices do subgrafo.
+
+        Returns:
+            SubgraphView: A visão do subgrafo.
+
+        Examples:
+            Graph().freeze().get_subgraph_view(("A", "B", "C"))
+            ...
+        """
+        from SubgraphView import SubgraphView
+
+        return SubgraphView.from_vertexes(self, vertexes)
+
+    def get_filtered_view(self, condition: Callable[[str, str, int | float], bool]) -> "FilteredGraphView":
+        """Cria uma visão com somente os arcos que satisfazem uma condição, sem copiar os arcos.
+
+        Args:
+            condition (Callable[[str, str, int | float], bool]): Recebe a origem, o destino e o custo de cada arco.
+
+        Returns:
+            FilteredGraphView: A visão do grafo.
+
+        Examples:
+            Graph().freeze().get_filtered_view(lambda source, destiny, weight: weight < 10)
+            ...
+        """
+        from FilteredGraphView import FilteredGraphView
+
+        return FilteredGraphView(self, condition)
+
+    def contain_vertex(self, vertex: str) -> bool:
+        """Verifica se um vértice está no grafo.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser procurado.
+
+        Returns:
+            bool: Se o vértice existe no grafo.
+        """
+        return vertex in self.index
+
+    def contain_vertexes(self, vertexes: tuple[str, ...]) -> bool:
+        """Verifica se múltiplos vértices estão no grafo.
+
+        Args:
+            vertexes (tuple[str, ...]): Os rótulos dos vértices a serem procurados.
+
+        Returns:
+            bool: Se os vértices existem no grafo.
+        """
+        return all(vertex in self.index for vertex in vertexes)
+
+    def find_edge_position(self, i: int, j: int) -> int:
+        """Procura a posição de um arco nos vetores do grafo.
+
+        Args:
+            i (int): O índice do vértice de origem.
+            j (int): O índice do vértice de destino.
+
+        Returns:
+            int: A posição do arco, ou -1 caso o arco não exista.
+        """
+        start, end = self.offsets[i], self.offsets[i + 1]
+        position = bisect_left(self.targets, j, start, end)
+        if position < end and self.targets[position] == j:
+            return position
+        return -1
+
+    def contain_directed_edge(self, edge: tuple[str, ...]) -> bool:
+        """Verifica se um arco está no grafo.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            bool: Se o arco existe no grafo.
+        """
+        if len(edge) != 2 or not self.contain_vertexes(edge):
+            return False
+        i, j = (self.index[vertex] for vertex in edge)
+        return self.find_edge_position(i, j) != -1
+
+    def contain_undirected_edge(self, edge: tuple[str, ...]) -> bool:
+        """Verifica se um arco não-direcionado está no grafo.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            bool: Se o arco existe no grafo.
+        """
+        return self.contain_directed_edge(edge) and self.contain_directed_edge(tuple(reversed(edge)))
+
+    def get_edge_weight(self, edge: tuple[str, ...]) -> int | float:
+        """Retorna o custo de um arco do grafo, caso exista.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            int | float: O custo do arco.
+        """
+        if len(edge) != 2 or not self.contain_vertexes(edge):
+            return 0
+        i, j = (self.index[vertex] for vertex in edge)
+        position = self.find_edge_position(i, j)
+        return self.weights[position] if position != -1 else 0
+
+    def iter_edges(self) -> Iterator[tuple[int, int, int | float]]:
+        """Percorre todos os arcos do grafo, com os índices dos vértices.
+
+        Yields:
+            tuple[int, int, int | float]: A origem, o destino e o custo do arco.
+        """
+        for i in range(self.vertex_count):
+            for position in range(self.offsets[i], self.offsets[i + 1]):
+                yield (i, self.targets[position], self.weights[position])
+
+    def get_vertexes_degree(self) -> list[int]:
+        """Faz a contagem de graus, para todos os vértices, do grafo.
+
+        Assim como na matriz de adjacência, arcos de custo 0 não são contados.
+
+        Returns:
+            list[int]: A contagem de graus do grafo.
+        """
+        return [
+            sum(1 for position in range(self.offsets[i], self.offsets[i + 1]) if self.weights[position] != 0)
+            for i in range(self.vertex_count)
+        ]
+
+    def get_vertexes_degree_sum(self) -> int:
+        """Pega a quantidade máxima, a soma, dos graus, dos vértices, do grafo.
+
+        Returns:
+            int: A soma dos graus dos vértices.
+        """
+        return sum(self.get_vertexes_degree())
+
+    def find_adjacent_vertexes(self, vertexes: tuple[str, ...] | str) -> dict[str, list[str]]:
+        """Retorna os vértices adjacentes de um ou mais vértices.
+
+        Args:
+            vertexes (tuple[str, ...] | str): O rótulo de um ou mais vértice, de um grafo.
+
+        Returns:
+            dict[str, list[str]]: Os rótulos dos vértices adjacentes dos vértices fornecidos.
+        """
+        if isinstance(vertexes, str):
+            vertexes = (vertexes,)
+        return {
+            vertex: [self.vertexes[j] for j in self.neighbors(self.translate_vertex_label_to_index(vertex))]
+            for vertex in vertexes
+        }
+
+    def neighbors(self, vertex: int) -> array:
+        """Retorna os índices dos vizinhos de um vértice.
+
+        Args:
+            vertex (int): O índice do vértice.
+
+        Returns:
+            array: Os índices dos vizinhos, em ordem crescente.
+        """
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def get_adjacency_indexes(self, undirected: bool = False) -> list[list[int]]:
+        """Retorna a lista de adjacência do grafo, utilizando os índices dos vértices.
+
+        Args:
+            undirected (bool, optional): Se somente os arcos não-direcionados devem ser considerados.
+
+        Returns:
+            list[list[int]]: Os índices dos vizinhos de cada vértice, em ordem crescente.
+        """
+        offsets, targets = (
+            (self.undirected_offsets, self.undirected_targets) if undirected
+            else (self.offsets, self.targets)
+        )
+        return [
+            targets[offsets[i]:offsets[i + 1]].tolist() for i in range(self.vertex_count)
+        ]
+
+    def get_weighted_adjacency_indexes(self) -> list[list[tuple[int, int | float]]]:
+        """Retorna a lista de adjacência do grafo, com os índices dos vértices e o custo dos arcos.
+
+        Returns:
+            list[list[tuple[int, int | float]]]: Os índices dos vizinhos de cada vértice e o custo dos arcos.
+        """
+        return [
+            list(zip(
+                self.targets[self.offsets[i]:self.offsets[i + 1]],
+                self.weights[self.offsets[i]:self.offsets[i + 1]],
+            ))
+            for i in range(self.vertex_count)
+        ]
+
+    def translate_vertex_index_to_label(self, vertex: int) -> str:
+        """Transforma o índice de um vértice para o rótulo.
+
+        Args:
+            vertex (int): O índice do vértice a ser buscado.
+
+        Returns:
+            str: O rótulo do vértice.
+        """
+        if len(self.vertexes) != 0:
+            if vertex <= len(self.vertexes) - 1:
+                return self.vertexes[vertex]
+            else:
+                raise ValueError("Não existe nenhum vértice com esse índice.")
+        else:
+            raise ValueError("O grafo não possui nenhum vértice.")
+
+    def translate_vertex_label_to_index(self, vertex: str) -> int:
+        """Transforma o rótulo de um vértice para o índice.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser buscado.
+
+        Returns:
+            int: O índice do vértice.
+        """
+        if self.contain_vertex(vertex):
+            return self.index[vertex]
+        else:
+            raise ValueError("O grafo não possui o vértice: " + vertex)
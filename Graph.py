@@ -1,7 +1,13 @@
 from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from json import load
 from os.path import exists
+from sys import intern
+
+from FrozenGraph import FrozenGraph
+from GraphProperties import GraphProperties
 
 # TODO: Método ToString ???? Tem o REPR do dataclass, só precisa pro grafo.
 
@@ -14,6 +20,18 @@ class Graph:
     vertexes: list[str] = field(init=False, default_factory=list)
     vertex_count: int = field(init=False, default_factory=int)
     edges: dict[tuple[str, str], int] = field(init=False, default_factory=dict)
+    index: dict[str, int] = field(repr=False, init=False, compare=False, default_factory=dict)
+    successors: dict[str, set[str]] = field(repr=False, init=False, compare=False, default_factory=dict)
+    predecessors: dict[str, set[str]] = field(repr=False, init=False, compare=False, default_factory=dict)
+    tombstones: set[str] = field(repr=False, init=False, default_factory=set)
+    version: int = field(repr=False, init=False, compare=False, default=0)
+    frozen: FrozenGraph | None = field(repr=False, init=False, compare=False, default=None)
+    frozen_version: int = field(repr=False, init=False, compare=False, default=-1)
+    # Transação em andamento, as alterações desfeitas em caso de erro e os vértices a serem compactados no final.
+    batch_depth: int = field(repr=False, init=False, compare=False, default=0)
+    undo_log: list[tuple] | None = field(repr=False, init=False, compare=False, default=None)
+    pending_compact: set[str] = field(repr=False, init=False, compare=False, default_factory=set)
+    journal: "GraphJournal | None" = field(repr=False, init=False, compare=False, default=None)
 
     def recreate_graph(self):
         """Recria o grafo, a matriz de incidência."""
@@ -31,7 +49,7 @@ class Graph:
             # Percorre todos os arcos existentes.
             for edge, weight in self.edges.items():
                 # Pega ambos os vértices, porém, somente o seus índices.
-                (i, j) = map(self.translate_vertex_label_to_index, edge)
+                (i, j) = (self.index[vertex] for vertex in edge)
                 # Adiciona o arco no grafo.
                 self.graph[i][j] = weight
         else:
@@ -58,16 +76,16 @@ class Graph:
                     # Pega o conteúdo do arquivo .json
                     data = load(file)
 
-                    # Adiciona os vértices.
-                    self.add_vertexes(tuple(map(str, data["Vertexes"][0])))
+                    # Adiciona os vértices e os arcos em uma única transação.
+                    with self.batch():
+                        self.add_vertexes(tuple(map(str, data["Vertexes"][0])))
 
-                    # Adiciona os arcos.
-                    for i, j, *w in data["Edges"]:
-                        if len(w) > 1:
-                            raise ValueError(
-                                "O formato dos arcos do arquivo lido é inválido"
-                            )
-                        self.add_edge_directed((i, j), w[0] if w else 1)
+                        for i, j, *w in data["Edges"]:
+                            if len(w) > 1:
+                                raise ValueError(
+                                    "O formato dos arcos do arquivo lido é inválido"
+                                )
+                            self.add_edge_directed((i, j), w[0] if w else 1)
 
                     # Fecha o arquivo após a sua utilização.
                     file.close()
@@ -79,6 +97,8 @@ class Graph:
     def add_vertex(self, vertex: str):
         """Adiciona um vértice ao grafo.
 
+        Caso o vértice tenha sido removido com "tombstone", o seu índice é reutilizado.
+
         Args:
             vertex (str): O rótulo do vértice a ser adicionado.
 
@@ -89,35 +109,65 @@ class Graph:
             ...
         """
         if not self.contain_vertex(vertex):
-            self.vertexes.append(vertex)
-            self.vertex_count += 1
-            self.recreate_graph()
+            if vertex in self.tombstones:
+                # Reativa o vértice marcado como removido.
+                self.tombstones.discard(vertex)
+                self.pending_compact.discard(vertex)
+                self.record_change(("reactivate", vertex))
+                if self.journal is not None:
+                    self.journal.add_vertex(vertex)
+                self.vertex_count += 1
+                self.version += 1
+            else:
+                self.append_vertex(vertex)
         else:
             raise ValueError("O vértice a ser adicionado já existe no grafo.")
-        
-    def remove_vertex(self, vertex: str):
+
+    def append_vertex(self, vertex: str):
+        """Adiciona o vértice no final do grafo, aumentando a matriz de adjacência.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser adicionado.
+        """
+        # Os rótulos textuais são internalizados, evitando cópias e comparações de textos.
+        if type(vertex) is str:
+            vertex = intern(vertex)
+        self.index[vertex] = len(self.vertexes)
+        self.vertexes.append(vertex)
+        self.vertex_count += 1
+        self.successors[vertex] = set()
+        self.predecessors[vertex] = set()
+        self.record_change(("append", vertex))
+        if self.journal is not None:
+            self.journal.add_vertex(vertex)
+        # Aumenta a matriz de adjacência, sem perder os arcos existentes, ou, em uma transação, no final dela.
+        if not self.batch_depth:
+            for row in self.graph:
+                row.append(0)
+            self.graph.append([0] * len(self.vertexes))
+        self.version += 1
+
+    def remove_vertex(self, vertex: str, tombstone: bool = False):
         """Remove um vértice do grafo.
 
+        Somente os arcos incidentes ao vértice são visitados. Com "tombstone",
+        o vértice é somente marcado como removido, mantendo os índices dos
+        demais vértices, até que o método "compact" seja chamado. O vértice
+        marcado não é contado em "vertex_count" e não aparece na cópia
+        imutável, sendo assim, nem nos resultados dos algoritmos.
+
         Args:
             vertex (str): O rótulo do vértice a ser removido.
+            tombstone (bool, optional): Se o vértice deve ser somente marcado como removido.
 
         Examples:
             Graph().remove_vertex("1")
 
-            Graph().remove_vertex("A")
+            Graph().remove_vertex("A", tombstone=True)
             ...
         """
         if self.contain_vertex(vertex):
-            # Remove todos os arcos que contém tal vértice.
-            for v in self.vertexes:
-                self.remove_edge_undirected((vertex, v))
-            # Remove o vértice do grafo.
-            self.vertexes.remove(vertex)
-            self.vertex_count -= 1
-            # Recria o grafo.
-            self.recreate_graph()
-            # Atualiza o grafo.
-            self.update_graph()
+            self.remove_vertexes((vertex,), tombstone)
         else:
             raise ValueError("O vértice a ser removido não existe.")
 
@@ -133,42 +183,120 @@ class Graph:
             Graph().add_vertexes(("A", "B", "C"))
             ...
         """
-        if not self.contain_vertexes(vertexes):
+        if not any(self.contain_vertex(vertex) for vertex in vertexes):
             for vertex in vertexes:
                 # Adiciona os vértices do grafo.
-                self.vertexes.append(vertex)
-                self.vertex_count += 1
-            self.recreate_graph()
+                self.add_vertex(vertex)
         else:
             raise ValueError("Algum vértice a ser adicionado já existe no grafo.")
     
-    def remove_vertexes(self, vertexes: tuple[str, ...]):
+    def remove_vertexes(self, vertexes: tuple[str, ...], tombstone: bool = False):
         """Remove múltiplos vértices do grafo.
 
+        Somente os arcos incidentes aos vértices são visitados e, caso não
+        seja utilizado "tombstone", o grafo é compactado uma única vez.
+
         Args:
             vertexes (tuple[str, ...]): Os rótulos dos vértices a serem removidos.
+            tombstone (bool, optional): Se os vértices devem ser somente marcados como removidos.
 
         Examples:
             Graph().remove_vertexes(("1", "2", "3"))
 
-            Graph().remove_vertexes(("A", "B", "C"))
+            Graph().remove_vertexes(("A", "B", "C"), tombstone=True)
             ...
         """
         if self.contain_vertexes(vertexes):
-            for vertex in vertexes:
-                # Remove todos os arcos que contém tais vértice.
-                for v in self.vertexes:
-                    self.remove_edge_undirected((vertex, v))
-                # Remove os vértices do grafo.
-                self.vertexes.remove(vertex)
+            # Rótulos repetidos são removidos uma única vez.
+            for vertex in dict.fromkeys(vertexes):
+                # Remove todos os arcos, de saída e de entrada, que contém tal vértice.
+                for v in tuple(self.successors[vertex]):
+                    self.pop_edge((vertex, v))
+                for v in tuple(self.predecessors[vertex]):
+                    self.pop_edge((v, vertex))
+                # Marca o vértice como removido.
+                self.tombstones.add(vertex)
+                self.record_change(("tombstone", vertex))
+                if self.journal is not None:
+                    self.journal.remove_vertex(vertex)
                 self.vertex_count -= 1
-            # Recria o grafo.
-            self.recreate_graph()
-            # Atualiza o grafo.
-            self.update_graph()
+                self.version += 1
+            if not tombstone:
+                self.compact()
         else:
             raise ValueError("Algum vértice a ser removido não existe no grafo.")
 
+    def compact(self):
+        """Remove, definitivamente, os vértices marcados como removidos.
+
+        Os índices dos vértices restantes são atualizados uma única vez e, em
+        uma transação, somente no final dela.
+
+        Examples:
+            Graph().compact()
+            ...
+        """
+        if not self.tombstones:
+            return
+        if self.journal is not None:
+            self.journal.compact()
+        if self.batch_depth:
+            self.pending_compact.update(self.tombstones)
+            return
+        self.compact_vertexes(self.tombstones.copy())
+
+    def compact_vertexes(self, removed: set[str]):
+        """Remove, definitivamente, vértices marcados como removidos.
+
+        Args:
+            removed (set[str]): Os rótulos dos vértices marcados como removidos.
+        """
+        # Índices dos vértices que permanecem no grafo.
+        kept = [i for i, vertex in enumerate(self.vertexes) if vertex not in removed]
+        for vertex in removed:
+            self.index.pop(vertex)
+            self.successors.pop(vertex)
+            self.predecessors.pop(vertex)
+        self.tombstones.difference_update(removed)
+        # Compacta os vértices e a matriz de adjacência.
+        self.vertexes = [self.vertexes[i] for i in kept]
+        self.graph = [[self.graph[i][j] for j in kept] for i in kept]
+        self.vertex_count = len(self.vertexes) - len(self.tombstones)
+        # Atualiza os índices dos vértices.
+        for i, vertex in enumerate(self.vertexes):
+            self.index[vertex] = i
+        self.version += 1
+
+    def reorder(self, method: str = "rcm"):
+        """Renumera os vértices do grafo, melhorando a localidade dos arcos nos algoritmos.
+
+        Os rótulos, os arcos e os custos não mudam, somente a ordem dos vértices
+        e, por consequência, a ordem de visita dos empates nos algoritmos.
+
+        Args:
+            method (str, optional): "bfs", "rcm" (Cuthill–McKee reverso) ou "degree".
+
+        Examples:
+            Graph().reorder()
+
+            Graph().reorder("degree")
+            ...
+        """
+        from GraphOrdering import GraphOrdering
+
+        if self.batch_depth:
+            raise ValueError("O grafo não pode ser renumerado durante uma transação.")
+        # A ordem é calculada sobre a cópia imutável, que não possui os vértices marcados como removidos.
+        self.compact()
+        order = GraphOrdering(self).get_order(method)
+        # Reordena os vértices e a matriz de adjacência.
+        self.vertexes = [self.vertexes[i] for i in order]
+        self.graph = [[self.graph[i][j] for j in order] for i in order]
+        # Atualiza os índices dos vértices.
+        for i, vertex in enumerate(self.vertexes):
+            self.index[vertex] = i
+        self.version += 1
+
     def contain_vertex(self, vertex: str) -> bool:
         """Verifica se um vértice está no grafo.
 
@@ -184,7 +312,7 @@ class Graph:
             Graph().contain_vertex("A")
             ...
         """
-        return vertex in self.vertexes
+        return vertex in self.index and vertex not in self.tombstones
 
     def contain_vertexes(self, vertexes: tuple[str, ...]) -> bool:
         """Verifica se múltiplos vértices estão no grafo.
@@ -201,7 +329,152 @@ class Graph:
             Graph().contain_vertexes(("A", "B", "C"))
             ...
         """
-        return all([v in self.vertexes for v in vertexes])
+        return all(self.contain_vertex(v) for v in vertexes)
+
+    def set_edge(self, edge: tuple[str, str], weight: int):
+        """Define um arco, atualizando a adjacência reversa e a matriz de adjacência.
+
+        Args:
+            edge (tuple[str, str]): Os rótulos dos vértices do arco.
+            weight (int): O peso do arco.
+        """
+        (i, j) = edge
+        self.record_change(("edge", edge, self.edges.get(edge)))
+        if self.journal is not None:
+            self.journal.set_edge(edge, weight)
+        self.edges[edge] = weight
+        self.successors[i].add(j)
+        self.predecessors[j].add(i)
+        if self.graph and not self.batch_depth:
+            self.graph[self.index[i]][self.index[j]] = weight
+        self.version += 1
+
+    def pop_edge(self, edge: tuple[str, str]):
+        """Remove um arco, atualizando a adjacência reversa e a matriz de adjacência.
+
+        Args:
+            edge (tuple[str, str]): Os rótulos dos vértices do arco.
+        """
+        (i, j) = edge
+        weight = self.edges.pop(edge, None)
+        if weight is not None:
+            self.record_change(("edge", edge, weight))
+            if self.journal is not None:
+                self.journal.remove_edge(edge)
+            self.successors[i].discard(j)
+            self.predecessors[j].discard(i)
+            if self.graph and not self.batch_depth:
+                self.graph[self.index[i]][self.index[j]] = 0
+            self.version += 1
+
+    def record_change(self, change: tuple):
+        """Guarda uma alteração, para que ela possa ser desfeita caso a transação falhe.
+
+        Args:
+            change (tuple): O tipo da alteração e os dados anteriores a ela.
+        """
+        if self.undo_log is not None:
+            self.undo_log.append(change)
+
+    def undo_changes(self, start: int = 0):
+        """Desfaz, em ordem inversa, as alterações da transação em andamento.
+
+        Args:
+            start (int, optional): A posição da primeira alteração a ser desfeita.
+        """
+        for change in reversed(self.undo_log[start:]):
+            kind, vertex = change[0], change[1]
+            if kind == "append":
+                # O vértice adicionado é sempre o último, pois a compactação só ocorre no final.
+                self.vertexes.pop()
+                self.vertex_count -= 1
+                del self.index[vertex], self.successors[vertex], self.predecessors[vertex]
+            elif kind == "reactivate":
+                self.tombstones.add(vertex)
+                self.vertex_count -= 1
+            elif kind == "tombstone":
+                self.tombstones.discard(vertex)
+                self.vertex_count += 1
+            else:
+                (i, j), weight = vertex, change[2]
+                if weight is None:
+                    self.edges.pop(vertex, None)
+                    self.successors[i].discard(j)
+                    self.predecessors[j].discard(i)
+                else:
+                    self.edges[vertex] = weight
+                    self.successors[i].add(j)
+                    self.predecessors[j].add(i)
+        del self.undo_log[start:]
+
+    @contextmanager
+    def batch(self) -> Iterator["Graph"]:
+        """Agrupa múltiplas alterações em uma transação.
+
+        Durante a transação, a matriz de adjacência e a compactação dos
+        vértices removidos não são atualizadas, sendo reconstruídas uma única
+        vez no final. Caso ocorra um erro, todas as alterações são desfeitas e,
+        caso exista um diário, elas são escritas somente no final, de uma vez.
+        Uma transação aninhada que falha desfaz somente as suas alterações,
+        mantendo as da transação externa, caso o erro seja tratado nela.
+
+        Yields:
+            Graph: O próprio grafo.
+
+        Examples:
+            with graph.batch():
+                graph.add_vertex("A")
+                graph.add_edge_directed(("A", "B"))
+            ...
+        """
+        self.batch_depth += 1
+        if self.batch_depth == 1:
+            self.undo_log = []
+            if self.journal is not None:
+                self.journal.begin()
+        # Ponto de retorno, para que uma transação aninhada desfaça somente as suas alterações.
+        undo_start = len(self.undo_log)
+        pending_compact = set(self.pending_compact)
+        savepoint = self.journal.savepoint() if self.journal is not None else None
+        try:
+            yield self
+        except BaseException:
+            self.undo_changes(undo_start)
+            self.pending_compact = pending_compact
+            if self.journal is not None:
+                if self.batch_depth == 1:
+                    self.journal.abort()
+                else:
+                    self.journal.rollback(savepoint)
+            raise
+        else:
+            if self.batch_depth == 1:
+                self.apply_changes()
+                if self.journal is not None:
+                    self.journal.commit()
+        finally:
+            self.batch_depth -= 1
+            if self.batch_depth == 0:
+                self.undo_log = None
+                self.version += 1
+
+    def apply_changes(self):
+        """Atualiza a matriz de adjacência e compacta os vértices removidos, uma única vez, no final da transação."""
+        # Aumenta a matriz com os vértices adicionados e atualiza somente os arcos alterados.
+        size = len(self.vertexes)
+        added = size - len(self.graph)
+        if added:
+            for row in self.graph:
+                row.extend([0] * added)
+            self.graph.extend([0] * size for _ in range(added))
+        for change in self.undo_log:
+            if change[0] == "edge":
+                (i, j) = edge = change[1]
+                self.graph[self.index[i]][self.index[j]] = self.edges.get(edge, 0)
+        if self.pending_compact:
+            # Somente os vértices que ainda estão marcados como removidos.
+            self.compact_vertexes(self.pending_compact & self.tombstones)
+            self.pending_compact.clear()
 
     def add_edge_directed(self, edge: tuple[str, ...], weight: int = 1):
         """Adiciona um arco direcionado ao grafo.
@@ -221,9 +494,7 @@ class Graph:
             # Verifica se os rótulos existem no grafo.
             if self.contain_vertexes(edge):
                 # Adiciona o arco direcionado.
-                self.edges[edge] = weight
-                # Atualiza o grafo.
-                self.update_graph()
+                self.set_edge(tuple(edge), weight)
             else:
                 raise ValueError("Os rótulos fornecidos não existem no grafo.")
         else:
@@ -248,11 +519,7 @@ class Graph:
                 # Verifica se o arco existe no grafo.
                 if self.contain_directed_edge(edge):
                     # Remove o arco.
-                    self.edges.pop(edge)
-                    # Recria o grafo.
-                    self.recreate_graph()
-                    # Atualiza o grafo.
-                    self.update_graph()
+                    self.pop_edge(tuple(edge))
             else:
                 raise ValueError("Os rótulos fornecidos não existem no grafo.")
         else:
@@ -276,10 +543,8 @@ class Graph:
             # Verifica se os rótulos existem no grafo.
             if self.contain_vertexes(edge):
                 # Adiciona o arco não-direcionado.
-                self.edges[edge] = weight
-                self.edges[tuple(reversed(edge))] = weight
-                # Atualiza o grafo.
-                self.update_graph()
+                self.set_edge(tuple(edge), weight)
+                self.set_edge(tuple(reversed(edge)), weight)
             else:
                 raise ValueError("Os rótulos fornecidos não existem no grafo.")
         else:
@@ -304,12 +569,8 @@ class Graph:
                 # Verifica se o arco existe no grafo.
                 if self.contain_undirected_edge(edge):
                     # Remove o arco.
-                    self.edges.pop(edge)
-                    self.edges.pop(tuple(reversed(edge)))
-                    # Recria o grafo.
-                    self.recreate_graph()
-                    # Atualiza o grafo.
-                    self.update_graph()
+                    self.pop_edge(tuple(edge))
+                    self.pop_edge(tuple(reversed(edge)))
             else:
                 raise ValueError("Os rótulos fornecidos não existem no grafo.")
         else:
@@ -371,11 +632,15 @@ class Graph:
     def get_vertexes_degree(self) -> list[int]:
         """Faz a contagem de graus, para todos os vértices, do grafo.
 
+        Os vértices marcados como removidos (tombstone) não são contados.
+
         Returns:
             list[int]: A contagem de graus do grafo.
         """
         return [
-            self.vertex_count - self.graph[i].count(0) for i, _ in enumerate(self.graph)
+            len(row) - row.count(0)
+            for vertex, row in zip(self.vertexes, self.graph)
+            if vertex not in self.tombstones
         ]
 
     def get_vertexes_degree_sum(self) -> int:
@@ -428,9 +693,10 @@ class Graph:
             list[str]: Os rótulos dos vértices com tal grau.
         """
         graph_degree = self.get_vertexes_degree()
+        vertexes = [vertex for vertex in self.vertexes if vertex not in self.tombstones]
         return [
-            self.vertexes[vertex]
-            for vertex, deg in enumerate(graph_degree)
+            vertex
+            for vertex, deg in zip(vertexes, graph_degree)
             if deg == degree
         ]
 
@@ -468,7 +734,131 @@ class Graph:
 
         # Retorna os vizinhos.
         return neighbors
-    
+
+    def get_adjacency_indexes(self, undirected: bool = False) -> list[list[int]]:
+        """Retorna a lista de adjacência do grafo, utilizando os índices dos vértices.
+
+        Args:
+            undirected (bool, optional): Se somente os arcos não-direcionados devem ser considerados.
+
+        Returns:
+            list[list[int]]: Os índices dos vizinhos de cada vértice, em ordem crescente.
+
+        Examples:
+            Graph().get_adjacency_indexes()
+
+            Graph().get_adjacency_indexes(True)
+            ...
+        """
+        return self.freeze().get_adjacency_indexes(undirected)
+
+    def get_weighted_adjacency_indexes(self) -> list[list[tuple[int, int]]]:
+        """Retorna a lista de adjacência do grafo, com os índices dos vértices e o custo dos arcos.
+
+        Returns:
+            list[list[tuple[int, int]]]: Os índices dos vizinhos de cada vértice e o custo dos arcos.
+
+        Examples:
+            Graph().get_weighted_adjacency_indexes()
+            ...
+        """
+        return self.freeze().get_weighted_adjacency_indexes()
+
+    def freeze(self) -> FrozenGraph:
+        """Cria uma cópia imutável e compacta do grafo.
+
+        A cópia pode ser lida por múltiplas threads sem travas e, por meio do
+        método "overlay", alterada sem que o grafo seja copiado.
+
+        A cópia é reaproveitada enquanto o grafo não for alterado, sendo assim,
+        os algoritmos podem utilizá-la para trabalhar somente com os índices dos vértices.
+
+        Returns:
+            FrozenGraph: A cópia imutável do grafo.
+
+        Examples:
+            Graph().freeze()
+
+            Graph().freeze().overlay()
+            ...
+        """
+        if self.frozen is None or self.frozen_version != self.version:
+            # Os vértices marcados como removidos não fazem parte da cópia.
+            vertexes = [vertex for vertex in self.vertexes if vertex not in self.tombstones]
+            index = {vertex: i for i, vertex in enumerate(vertexes)} if self.tombstones else self.index
+            self.frozen = FrozenGraph.from_edges(
+                vertexes,
+                ((index[i], index[j], weight) for (i, j), weight in self.edges.items()),
+            )
+            self.frozen_version = self.version
+        return self.frozen
+
+    def get_properties(self) -> GraphProperties:
+        """Retorna o perfil de graus e de conectividade do grafo.
+
+        O perfil é guardado na cópia imutável, sendo assim, é recalculado
+        somente depois que o grafo for alterado.
+
+        Returns:
+            GraphProperties: O perfil do grafo.
+
+        Examples:
+            Graph().get_properties().odd_count
+            ...
+        """
+        return self.freeze().get_properties()
+
+    def get_reachability_index(self) -> "ReachabilityIndex":
+        """Retorna o índice de alcançabilidade do grafo, seguindo a direção dos arcos.
+
+        O índice é guardado na cópia imutável, sendo assim, é recalculado
+        somente depois que o grafo for alterado.
+
+        Returns:
+            ReachabilityIndex: O índice de alcançabilidade.
+
+        Examples:
+            Graph().get_reachability_index().is_reachable("A", "B")
+            ...
+        """
+        return self.freeze().get_reachability_index()
+
+    def get_subgraph_view(self, vertexes: tuple[str, ...]) -> "SubgraphView":
+        """Cria o subgrafo induzido por um conjunto de vértices, sem copiar os arcos.
+
+        A visão é criada sobre a cópia imutável, sendo assim, ela não
+        acompanha as alterações feitas no grafo depois da sua criação.
+
+        Args:
+            vertexes (tuple[str, ...]): Os rótulos dos vértices do subgrafo.
+
+        Returns:
+            SubgraphView: A visão do subgrafo.
+
+        Examples:
+            Graph().get_subgraph_view(("A", "B", "C")).materialize()
+            ...
+        """
+        return self.freeze().get_subgraph_view(vertexes)
+
+    def get_filtered_view(self, condition: Callable[[str, str, int | float], bool]) -> "FilteredGraphView":
+        """Cria uma visão com somente os arcos que satisfazem uma condição, sem copiar os arcos.
+
+        A visão é criada sobre a cópia imutável, sendo assim, ela não
+        acompanha as alterações feitas no grafo depois da sua criação.
+
+        Args:
+            condition (Callable[[str, str, int | float], bool]): Recebe a origem, o destino e o custo de cada arco.
+
+        Returns:
+            FilteredGraphView: A visão do grafo.
+
+        Examples:
+            Graph().get_filtered_view(lambda source, destiny, weight: weight < 10)
+            ...
+        """
+        return self.freeze().get_filtered_view(condition)
+
     def translate_vertex_index_to_label(self, vertex: int) -> str:
         """Transforma o índice de um vértice para o rótulo.
 
@@ -479,7 +869,7 @@ class Graph:
             str: O rótulo do vértice.
         """
         if len(self.vertexes) != 0:
-            if vertex <= len(self.vertexes) - 1:
+            if vertex <= len(self.vertexes) - 1 and self.vertexes[vertex] not in self.tombstones:
                 return self.vertexes[vertex]
             else:
                 raise ValueError("Não existe nenhum vértice com esse índice.")
@@ -496,6 +886,6 @@ class Graph:
             int: O índice do vértice.
         """
         if self.contain_vertex(vertex):
-            return self.vertexes.index(vertex)
+            return self.index[vertex]
         else:
             raise ValueError("O grafo não possui o vértice: " + vertex)
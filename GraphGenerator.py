@@ -0,0 +1,318 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from math import floor, isqrt, log
+from random import Random
+
+from FrozenGraph import FrozenGraph
+
+
+@dataclass
+class GraphGenerator:
+    """Responsável por gerar grafos, diretamente na cópia imutável e compacta (CSR).
+
+    Os vértices são rotulados pelos seus índices ("0", "1", ...), os grafos
+    não-direcionados possuem ambos os arcos e os custos são sorteados no
+    intervalo "weight_range", sendo assim, a mesma semente gera sempre o mesmo grafo.
+    """
+
+    seed: int | None = None
+    weight_range: tuple[int, int] = (1, 1)
+    random: Random = field(repr=False, init=False, default_factory=Random)
+
+    def __post_init__(self):
+        self.random.seed(self.seed)
+        if self.weight_range[0] > self.weight_range[1]:
+            raise ValueError("O intervalo dos custos não é válido.")
+
+    def get_weight(self) -> int:
+        """Sorteia o custo de um arco.
+
+        Returns:
+            int: O custo do arco.
+        """
+        low, high = self.weight_range
+        return low if low == high else self.random.randint(low, high)
+
+    def build(self, vertex_count: int, edges: Iterator[tuple[int, int]], directed: bool = False) -> FrozenGraph:
+        """Cria a cópia imutável do grafo, a partir dos índices dos arcos.
+
+        Args:
+            vertex_count (int): A quantidade de vértices.
+            edges (Iterator[tuple[int, int]]): Os arcos, a origem e o destino.
+            directed (bool, optional): Se os arcos não devem possuir o arco inverso.
+
+        Returns:
+            FrozenGraph: A cópia imutável do grafo.
+        """
+        if vertex_count < 0:
+            raise ValueError("A quantidade de vértices não pode ser negativa.")
+
+        def weighted_edges() -> Iterator[tuple[int, int, int]]:
+            for i, j in edges:
+                weight = self.get_weight()
+                yield (i, j, weight)
+                if not directed:
+                    yield (j, i, weight)
+
+        return FrozenGraph.from_edges(map(str, range(vertex_count)), weighted_edges())
+
+    def iter_skipped_positions(self, total: int, p: float) -> Iterator[int]:
+        """Sorteia as posições, de 0 até "total", escolhidas com probabilidade "p".
+
+        Ao invés de sortear cada posição, o salto até a próxima posição escolhida
+        é sorteado (distribuição geométrica), sendo assim, o custo é proporcional
+        somente à quantidade de posições escolhidas.
+
+        Args:
+            total (int): A quantidade de posições.
+            p (float): A probabilidade de cada posição ser escolhida.
+
+        Returns:
+            Iterator[int]: As posições escolhidas, em ordem crescente.
+        """
+        if p <= 0:
+            return
+        if p >= 1:
+            yield from range(total)
+            return
+        log_q = log(1 - p)
+        position = -1
+        while True:
+            position += 1 + floor(log(1 - self.random.random()) / log_q)
+            if position >= total:
+                return
+            yield position
+
+    @staticmethod
+    def decode_pair(position: int) -> tuple[int, int]:
+        """Transforma a posição de um par, na lista de pares (i, j) com j < i, nos índices dos vértices.
+
+        Args:
+            position (int): A posição do par.
+
+        Returns:
+            tuple[int, int]: Os índices dos vértices.
+        """
+        i = (1 + isqrt(1 + 8 * position)) // 2
+        return (i, position - i * (i - 1) // 2)
+
+    @staticmethod
+    def decode_arc(position: int, vertex_count: int) -> tuple[int, int]:
+        """Transforma a posição de um arco, na lista de arcos sem laços, nos índices dos vértices.
+
+        Args:
+            position (int): A posição do arco.
+            vertex_count (int): A quantidade de vértices.
+
+        Returns:
+            tuple[int, int]: Os índices dos vértices.
+        """
+        i, j = divmod(position, vertex_count - 1)
+        return (i, j + (j >= i))
+
+    def complete(self, vertex_count: int) -> FrozenGraph:
+        """Gera um grafo completo.
+
+        Args:
+            vertex_count (int): A quantidade de vértices.
+
+        Returns:
+            FrozenGraph: O grafo gerado.
+
+        Examples:
+            GraphGenerator(seed=1).complete(100)
+            ...
+        """
+        return self.build(vertex_count, ((i, j) for i in range(vertex_count) for j in range(i)))
+
+    def cycle(self, vertex_count: int) -> FrozenGraph:
+        """Gera um ciclo.
+
+        Args:
+            vertex_count (int): A quantidade de vértices.
+
+        Returns:
+            FrozenGraph: O grafo gerado.
+
+        Examples:
+            GraphGenerator(seed=1).cycle(100)
+            ...
+        """
+        if 0 < vertex_count < 3:
+            raise ValueError("Um ciclo deve possuir, no mínimo, 3 vértices.")
+        return self.build(vertex_count, ((i, (i + 1) % vertex_count) for i in range(vertex_count)))
+
+    def grid(self, rows: int, columns: int) -> FrozenGraph:
+        """Gera uma grade, cada vértice ligado aos seus vizinhos na horizontal e na vertical.
+
+        O vértice da linha "r" e coluna "c" possui o índice "r * columns + c".
+
+        Args:
+            rows (int): A quantidade de linhas.
+            columns (int): A quantidade de colunas.
+
+        Returns:
+            FrozenGraph: O grafo gerado.
+
+        Examples:
+            GraphGenerator(seed=1).grid(100, 100)
+            ...
+        """
+
+        def edges() -> Iterator[tuple[int, int]]:
+            for r in range(rows):
+                for c in range(columns):
+                    vertex = r * columns + c
+                    if c + 1 < columns:
+                        yield (vertex, vertex + 1)
+                    if r + 1 < rows:
+                        yield (vertex, vertex + columns)
+
+        return self.build(rows * columns, edges())
+
+    def gnp(self, vertex_count: int, p: float, directed: bool = False) -> FrozenGraph:
+        """Gera um grafo aleatório G(n, p), cada arco existe com probabilidade "p".
+
+        Args:
+            vertex_count (int): A quantidade de vértices.
+            p (float): A probabilidade de cada arco existir.
+            directed (bool, optional): Se o grafo é direcionado.
+
+        Returns:
+            FrozenGraph: O grafo gerado.
+
+        Examples:
+            GraphGenerator(seed=1).gnp(100000, 0.0001)
+            ...
+        """
+        if directed:
+            positions = self.iter_skipped_positions(vertex_count * (vertex_count - 1), p)
+            return self.build(vertex_count, (self.decode_arc(k, vertex_count) for k in positions), True)
+        positions = self.iter_skipped_positions(vertex_count * (vertex_count - 1) // 2, p)
+        return self.build(vertex_count, map(self.decode_pair, positions))
+
+    def gnm(self, vertex_count: int, edge_count: int, directed: bool = False) -> FrozenGraph:
+        """Gera um grafo aleatório G(n, m), com exatamente "m" arcos sorteados.
+
+        Args:
+            vertex_count (int): A quantidade de vértices.
+            edge_count (int): A quantidade de arcos (ou de arestas, caso não seja direcionado).
+            directed (bool, optional): Se o grafo é direcionado.
+
+        Returns:
+            FrozenGraph: O grafo gerado.
+
+        Examples:
+            GraphGenerator(seed=1).gnm(100000, 500000)
+            ...
+        """
+        total = vertex_count * (vertex_count - 1) // (1 if directed else 2)
+        if not 0 <= edge_count <= total:
+            raise ValueError("A quantidade de arcos não é válida para a quantidade de vértices.")
+        positions = sorted(self.random.sample(range(total), edge_count))
+        if directed:
+            return self.build(vertex_count, (self.decode_arc(k, vertex_count) for k in positions), True)
+        return self.build(vertex_count, map(self.decode_pair, positions))
+
+    def barabasi_albert(self, vertex_count: int, m: int) -> FrozenGraph:
+        """Gera um grafo de Barabási–Albert, cada novo vértice se liga a "m" vértices, proporcionalmente ao grau.
+
+        Args:
+            vertex_count (int): A quantidade de vértices.
+            m (int): A quantidade de arestas de cada novo vértice.
+
+        Returns:
+            FrozenGraph: O grafo gerado.
+
+        Examples:
+            GraphGenerator(seed=1).barabasi_albert(100000, 3)
+            ...
+        """
+        if not 1 <= m < vertex_count:
+            raise ValueError("A quantidade de arestas de cada vértice deve estar entre 1 e a quantidade de vértices.")
+        edges = []
+        # Cada vértice aparece uma vez para cada aresta, ou seja, proporcionalmente ao grau.
+        repeated = []
+        targets = list(range(m))
+        for vertex in range(m, vertex_count):
+            for target in targets:
+                edges.append((vertex, target))
+            repeated.extend(targets)
+            repeated.extend([vertex] * m)
+            chosen = set()
+            while len(chosen) < m:
+                chosen.add(self.random.choice(repeated))
+            targets = list(chosen)
+        return self.build(vertex_count, iter(edges))
+
+    def random_regular(self, vertex_count: int, degree: int, attempts: int = 100) -> FrozenGraph:
+        """Gera um grafo regular aleatório, todos os vértices com o mesmo grau, sem laços ou arestas múltiplas.
+
+        As pontas das arestas são pareadas aleatoriamente, os pares inválidos são
+        sorteados novamente e, caso não seja possível completar o pareamento, recomeça.
+
+        Args:
+            vertex_count (int): A quantidade de vértices.
+            degree (int): O grau de todos os vértices.
+            attempts (int, optional): A quantidade máxima de recomeços.
+
+        Returns:
+            FrozenGraph: O grafo gerado.
+
+        Examples:
+            GraphGenerator(seed=1).random_regular(100000, 4)
+            ...
+        """
+        if not 0 <= degree < max(vertex_count, 1) or vertex_count * degree % 2 != 0:
+            raise ValueError("Não existe um grafo regular com essa quantidade de vértices e esse grau.")
+        for _ in range(attempts):
+            edges = set()
+            stubs = [vertex for vertex in range(vertex_count) for _ in range(degree)]
+            while stubs:
+                self.random.shuffle(stubs)
+                remaining = []
+                for k in range(0, len(stubs), 2):
+                    i, j = stubs[k], stubs[k + 1]
+                    pair = (i, j) if i > j else (j, i)
+                    if i != j and pair not in edges:
+                        edges.add(pair)
+                    else:
+                        remaining.extend(pair)
+                if len(remaining) == len(stubs):
+                    # Verifica se ainda existe algum par válido entre as pontas restantes.
+                    candidates = set(remaining)
+                    if not any(
+                        (i if i > j else j, j if i > j else i) not in edges
+                        for i in candidates for j in candidates if i != j
+                    ):
+                        break
+                stubs = remaining
+            if not stubs:
+                return self.build(vertex_count, iter(sorted(edges)))
+        raise ValueError("Não foi possível gerar o grafo regular, tente outra semente.")
+
+    def random_dag(self, vertex_count: int, p: float) -> FrozenGraph:
+        """Gera um grafo acíclico direcionado aleatório, cada arco existe com probabilidade "p".
+
+        Os arcos seguem uma ordem topológica sorteada, e não a ordem dos índices.
+
+        Args:
+            vertex_count (int): A quantidade de vértices.
+            p (float): A probabilidade de cada arco, compatível com a ordem, existir.
+
+        Returns:
+            FrozenGraph: O grafo gerado.
+
+        Examples:
+            GraphGenerator(seed=1, weight_range=(1, 100)).random_dag(100000, 0.0001)
+            ...
+        """
+        order = list(range(vertex_count))
+        self.random.shuffle(order)
+        positions = self.iter_skipped_positions(vertex_count * (vertex_count - 1) // 2, p)
+        # O par (i, j), com j < i, se torna o arco do j-ésimo para o i-ésimo vértice da ordem.
+        return self.build(
+            vertex_count,
+            ((order[j], order[i]) for i, j in map(self.decode_pair, positions)),
+            True,
+        )
@@ -0,0 +1,370 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from io import BufferedRandom
+from os import SEEK_END
+from struct import calcsize, pack, unpack
+
+from CompressedGraph import write_varint, zigzag
+from Graph import Graph
+
+# Cabeçalho: identificador e versão.
+HEADER_FORMAT = "<4sH"
+HEADER_SIZE = calcsize(HEADER_FORMAT)
+MAGIC = b"GRJL"
+VERSION = 1
+
+# Tipos dos registros, seguidos dos números dos rótulos e, nos arcos, do custo.
+LABEL = 1
+ADD_VERTEX = 2
+REMOVE_VERTEX = 3
+COMPACT = 4
+SET_EDGE = 5
+SET_EDGE_FLOAT = 6
+REMOVE_EDGE = 7
+BEGIN = 8
+COMMIT = 9
+
+
+def read_varint(data: bytes, cursor: int) -> tuple[int, int]:
+    """Lê um inteiro não negativo, escrito com 7 bits por byte.
+
+    Args:
+        data (bytes): Os bytes no qual o inteiro foi escrito.
+        cursor (int): A posição do primeiro byte do inteiro.
+
+    Returns:
+        tuple[int, int]: O inteiro lido e a posição do próximo byte.
+    """
+    value = shift = 0
+    while True:
+        byte = data[cursor]
+        cursor += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return (value, cursor)
+        shift += 7
+
+
+@dataclass
+class GraphJournal:
+    """Representa um diário das alterações de um grafo, em um arquivo binário somente de acréscimo.
+
+    Cada alteração é um registro compacto, com os rótulos numerados na
+    primeira vez em que aparecem. As alterações de uma transação ("batch")
+    são escritas de uma única vez, entre um registro de início e outro de
+    fim, sendo assim, transações incompletas, de um processo interrompido,
+    são ignoradas ao reproduzir o diário.
+
+    Examples:
+        with GraphJournal("Grafo.journal") as journal:
+            graph.journal = journal
+            ...
+    """
+
+    path: str
+    file: BufferedRandom = field(repr=False, init=False)
+    labels: dict[str, int] = field(repr=False, init=False, default_factory=dict)
+    # Registros da transação em andamento, escritos somente no fim da transação.
+    pending: bytearray | None = field(repr=False, init=False, default=None)
+    pending_labels: dict[str, int] = field(repr=False, init=False, default_factory=dict)
+    # Posição e rótulos da última leitura, a partir dos quais a próxima leitura continua.
+    read_position: int = field(repr=False, init=False, default=HEADER_SIZE)
+    read_labels: list[str] = field(repr=False, init=False, default_factory=list)
+    read_label_count: int = field(repr=False, init=False, default=0)
+
+    def __post_init__(self):
+        self.file = open(self.path, "a+b")
+        self.file.seek(0, SEEK_END)
+        if self.file.tell() == 0:
+            self.file.write(pack(HEADER_FORMAT, MAGIC, VERSION))
+            self.file.flush()
+            return
+        self.file.seek(0)
+        magic, version = unpack(HEADER_FORMAT, self.file.read(HEADER_SIZE))
+        if magic != MAGIC or version != VERSION:
+            self.file.close()
+            raise ValueError("O arquivo não é um diário de grafo válido.")
+        # Recupera os rótulos já numerados e descarta um final incompleto.
+        for _ in self.iter_records(HEADER_SIZE):
+            pass
+        self.labels = {label: number for number, label in enumerate(self.read_labels[:self.read_label_count])}
+        self.file.truncate(self.read_position)
+
+    def __enter__(self) -> "GraphJournal":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """Fecha o arquivo do diário."""
+        self.file.close()
+
+    def iter_records(self, offset: int) -> Iterator[tuple[int, tuple, int]]:
+        """Lê os registros do diário, a partir de uma posição do arquivo.
+
+        A leitura termina no primeiro registro incompleto e os registros de
+        uma transação só são retornados depois que o seu fim for lido. Os
+        rótulos já lidos são guardados, sendo assim, uma nova leitura continua
+        de onde a anterior parou, sem ler o diário desde o início.
+
+        Args:
+            offset (int): A posição do primeiro registro.
+
+        Yields:
+            tuple[int, tuple, int]: O tipo, os argumentos e a posição do final de cada registro.
+        """
+        start, labels = HEADER_SIZE, []
+        if self.read_position <= offset:
+            start, labels = self.read_position, self.read_labels[:self.read_label_count]
+        self.file.flush()
+        self.file.seek(start)
+        data = self.file.read()
+        cursor = 0
+        # Registros da transação em andamento.
+        transaction = None
+        try:
+            while cursor < len(data):
+                kind = data[cursor]
+                cursor += 1
+                if kind == LABEL:
+                    length, cursor = read_varint(data, cursor)
+                    if cursor + length > len(data):
+                        break
+                    labels.append(data[cursor:cursor + length].decode("utf-8"))
+                    cursor += length
+                    arguments = (labels[-1],)
+                elif kind in (ADD_VERTEX, REMOVE_VERTEX):
+                    number, cursor = read_varint(data, cursor)
+                    arguments = (labels[number],)
+                elif kind in (SET_EDGE, SET_EDGE_FLOAT, REMOVE_EDGE):
+                    i, cursor = read_varint(data, cursor)
+                    j, cursor = read_varint(data, cursor)
+                    arguments = (labels[i], labels[j])
+                    if kind == SET_EDGE:
+                        weight, cursor = read_varint(data, cursor)
+                        arguments += ((weight >> 1) ^ -(weight & 1),)
+                    elif kind == SET_EDGE_FLOAT:
+                        if cursor + 8 > len(data):
+                            break
+                        arguments += unpack("<d", data[cursor:cursor + 8])
+                        cursor += 8
+                elif kind in (COMPACT, BEGIN, COMMIT):
+                    arguments = ()
+                else:
+                    raise ValueError("O diário possui um registro inválido.")
+
+                record = (kind, arguments, start + cursor)
+                if kind == BEGIN:
+                    transaction = [record]
+                    continue
+                if transaction is not None:
+                    transaction.append(record)
+                    if kind != COMMIT:
+                        continue
+                    records, transaction = transaction, None
+                else:
+                    records = (record,)
+                # Um registro, ou uma transação, completo.
+                self.read_position, self.read_labels, self.read_label_count = start + cursor, labels, len(labels)
+                for record in records:
+                    if record[2] > offset:
+                        yield record
+        except IndexError:
+            # O último registro foi escrito pela metade.
+            pass
+
+    def write(self, record: bytearray):
+        """Escreve um registro, ou o guarda até o fim da transação em andamento.
+
+        Args:
+            record (bytearray): Os bytes do registro.
+        """
+        if self.pending is not None:
+            self.pending += record
+        else:
+            self.file.write(record)
+            self.file.flush()
+
+    def get_label_number(self, record: bytearray, vertex: str) -> int:
+        """Retorna o número de um rótulo, numerando-o na primeira vez em que aparece.
+
+        Args:
+            record (bytearray): O registro, no qual a numeração do rótulo é escrita antes.
+            vertex (str): O rótulo do vértice.
+
+        Returns:
+            int: O número do rótulo.
+        """
+        if vertex not in self.labels:
+            self.labels[vertex] = len(self.labels)
+            encoded = vertex.encode("utf-8")
+            record.append(LABEL)
+            write_varint(record, len(encoded))
+            record += encoded
+        return self.labels[vertex]
+
+    def write_vertex(self, kind: int, vertex: str):
+        """Escreve um registro de vértice.
+
+        Args:
+            kind (int): O tipo do registro.
+            vertex (str): O rótulo do vértice.
+        """
+        record = bytearray()
+        number = self.get_label_number(record, vertex)
+        record.append(kind)
+        write_varint(record, number)
+        self.write(record)
+
+    def add_vertex(self, vertex: str):
+        """Registra a adição, ou a reativação, de um vértice.
+
+        Args:
+            vertex (str): O rótulo do vértice.
+        """
+        self.write_vertex(ADD_VERTEX, vertex)
+
+    def remove_vertex(self, vertex: str):
+        """Registra a remoção lógica (tombstone) de um vértice, cujos arcos já foram removidos.
+
+        Args:
+            vertex (str): O rótulo do vértice.
+        """
+        self.write_vertex(REMOVE_VERTEX, vertex)
+
+    def compact(self):
+        """Registra a remoção definitiva dos vértices marcados como removidos."""
+        self.write(bytearray((COMPACT,)))
+
+    def set_edge(self, edge: tuple[str, str], weight: int | float):
+        """Registra a definição de um arco.
+
+        Args:
+            edge (tuple[str, str]): Os rótulos dos vértices do arco.
+            weight (int | float): O peso do arco.
+        """
+        record = bytearray()
+        i, j = (self.get_label_number(record, vertex) for vertex in edge)
+        record.append(SET_EDGE if isinstance(weight, int) else SET_EDGE_FLOAT)
+        write_varint(record, i)
+        write_varint(record, j)
+        if isinstance(weight, int):
+            write_varint(record, zigzag(weight))
+        else:
+            record += pack("<d", weight)
+        self.write(record)
+
+    def remove_edge(self, edge: tuple[str, str]):
+        """Registra a remoção de um arco.
+
+        Args:
+            edge (tuple[str, str]): Os rótulos dos vértices do arco.
+        """
+        record = bytearray()
+        i, j = (self.get_label_number(record, vertex) for vertex in edge)
+        record.append(REMOVE_EDGE)
+        write_varint(record, i)
+        write_varint(record, j)
+        self.write(record)
+
+    def begin(self):
+        """Inicia uma transação, os registros são guardados até o seu fim."""
+        self.pending = bytearray((BEGIN,))
+        self.pending_labels = dict(self.labels)
+
+    def commit(self):
+        """Escreve, de uma única vez, os registros da transação em andamento."""
+        record, self.pending = self.pending, None
+        record.append(COMMIT)
+        self.write(record)
+
+    def abort(self):
+        """Descarta os registros da transação em andamento."""
+        self.pending = None
+        self.labels = self.pending_labels
+
+    def savepoint(self) -> tuple[int, int]:
+        """Marca a posição atual da transação em andamento, para uma transação aninhada.
+
+        Returns:
+            tuple[int, int]: O tamanho dos registros guardados e a quantidade de rótulos numerados.
+        """
+        return len(self.pending), len(self.labels)
+
+    def rollback(self, savepoint: tuple[int, int]):
+        """Descarta os registros da transação em andamento feitos depois de uma posição marcada.
+
+        Args:
+            savepoint (tuple[int, int]): A posição marcada por "savepoint".
+        """
+        size, label_count = savepoint
+        del self.pending[size:]
+        # Os rótulos são numerados em ordem, sendo assim, os mais recentes são descartados.
+        self.labels = {label: number for label, number in self.labels.items() if number < label_count}
+
+    def replay(self, graph: Graph, offset: int = HEADER_SIZE) -> int:
+        """Reproduz, em um grafo, as alterações registradas a partir de uma posição do diário.
+
+        As alterações são aplicadas em uma única transação do grafo, sendo
+        assim, as estruturas derivadas são reconstruídas uma única vez.
+
+        Args:
+            graph (Graph): O grafo, vazio ou no estado da posição fornecida.
+            offset (int, optional): A posição do primeiro registro, por padrão, o início do diário.
+
+        Returns:
+            int: A posição do final do último registro aplicado, para continuar a reprodução depois.
+
+        Examples:
+            GraphJournal("Grafo.journal").replay(Graph())
+
+            offset = journal.replay(graph, offset)
+            ...
+        """
+        records = list(self.iter_records(offset))
+        with graph.batch():
+            for kind, arguments, position in records:
+                if kind == ADD_VERTEX:
+                    graph.add_vertex(*arguments)
+                elif kind == REMOVE_VERTEX:
+                    graph.remove_vertex(*arguments, tombstone=True)
+                elif kind == COMPACT:
+                    graph.compact()
+                elif kind in (SET_EDGE, SET_EDGE_FLOAT):
+                    graph.add_edge_directed(arguments[:2], arguments[2])
+                elif kind == REMOVE_EDGE:
+                    graph.remove_edge_directed(arguments)
+                offset = position
+        return offset
+
+    @classmethod
+    def create_snapshot(cls, graph: Graph, path: str) -> "GraphJournal":
+        """Cria um novo diário, com o estado atual do grafo, em uma única transação.
+
+        Reproduzir o novo diário é mais rápido que reproduzir todo o histórico
+        de alterações, as próximas alterações podem ser acrescentadas a ele.
+
+        Args:
+            graph (Graph): O grafo.
+            path (str): O caminho do novo diário, que não deve existir.
+
+        Returns:
+            GraphJournal: O novo diário, aberto para novos registros.
+
+        Examples:
+            GraphJournal.create_snapshot(graph, "Grafo.journal")
+            ...
+        """
+        journal = cls(path)
+        if journal.file.tell() != HEADER_SIZE:
+            journal.close()
+            raise ValueError("O diário já existe: " + path)
+        journal.begin()
+        for vertex in graph.vertexes:
+            if graph.contain_vertex(vertex):
+                journal.add_vertex(vertex)
+        for edge, weight in graph.edges.items():
+            journal.set_edge(edge, weight)
+        journal.commit()
+        return journal
@@ -0,0 +1,154 @@
+from collections import deque
+from dataclasses import dataclass, field
+
+from FrozenGraph import FrozenGraph
+from Graph import Graph
+
+
+@dataclass
+class GraphOrdering:
+    """Responsável por calcular novas ordens para os vértices, melhorando a localidade dos arcos.
+
+    Todas as ordens são listas onde a posição é o novo índice e o valor
+    é o índice original do vértice, a direção dos arcos é ignorada.
+    """
+
+    graph: Graph | FrozenGraph = field(repr=False)
+
+    def get_symmetric_adjacency(self) -> list[list[int]]:
+        """Retorna os vizinhos de cada vértice, ignorando a direção dos arcos.
+
+        Returns:
+            list[list[int]]: Os índices dos vizinhos de cada vértice.
+        """
+        graph = self.graph.freeze()
+        adjacency = [[] for _ in range(graph.vertex_count)]
+        for i, j, _ in graph.iter_edges():
+            if i != j:
+                adjacency[i].append(j)
+                adjacency[j].append(i)
+        # Remove os vizinhos repetidos, dos arcos que possuem o arco inverso.
+        return [sorted(set(neighbors)) for neighbors in adjacency]
+
+    def get_bfs_order(self) -> list[int]:
+        """Ordena os vértices pela Busca em Largura, componente por componente.
+
+        Returns:
+            list[int]: Os índices originais dos vértices, na nova ordem.
+
+        Examples:
+            GraphOrdering(...).get_bfs_order()
+            ...
+        """
+        adjacency = self.get_symmetric_adjacency()
+        n = len(adjacency)
+        visited = bytearray(n)
+        order = []
+        for source in range(n):
+            if visited[source]:
+                continue
+            visited[source] = 1
+            queue = deque([source])
+            while queue:
+                vertex = queue.popleft()
+                order.append(vertex)
+                for neighbor in adjacency[vertex]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        queue.append(neighbor)
+        return order
+
+    def get_rcm_order(self) -> list[int]:
+        """Ordena os vértices pelo algoritmo de Cuthill–McKee reverso (RCM).
+
+        Cada componente começa por um vértice pseudo-periférico e os vizinhos
+        são visitados em ordem crescente de grau, reduzindo a largura de banda
+        da matriz de adjacência, ou seja, a distância entre os índices dos vizinhos.
+
+        Returns:
+            list[int]: Os índices originais dos vértices, na nova ordem.
+
+        Examples:
+            GraphOrdering(...).get_rcm_order()
+            ...
+        """
+        adjacency = self.get_symmetric_adjacency()
+        n = len(adjacency)
+        degree = [len(neighbors) for neighbors in adjacency]
+        visited = bytearray(n)
+        order = []
+
+        def get_last_level(source: int) -> list[int]:
+            """Retorna o último nível da Busca em Largura, sem marcar os vértices."""
+            seen = {source}
+            level = [source]
+            while True:
+                next_level = [
+                    neighbor for vertex in level for neighbor in adjacency[vertex] if neighbor not in seen
+                ]
+                next_level = list(dict.fromkeys(next_level))
+                if not next_level:
+                    return level
+                seen.update(next_level)
+                level = next_level
+
+        # Os componentes são iniciados pelos vértices de menor grau.
+        for candidate in sorted(range(n), key=degree.__getitem__):
+            if visited[candidate]:
+                continue
+            # Vértice pseudo-periférico, o de menor grau no nível mais distante.
+            source = min(get_last_level(candidate), key=degree.__getitem__)
+            visited[source] = 1
+            queue = deque([source])
+            while queue:
+                vertex = queue.popleft()
+                order.append(vertex)
+                neighbors = [neighbor for neighbor in adjacency[vertex] if not visited[neighbor]]
+                neighbors.sort(key=degree.__getitem__)
+                for neighbor in neighbors:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+        order.reverse()
+        return order
+
+    def get_degree_order(self) -> list[int]:
+        """Ordena os vértices pelo grau, do maior para o menor, agrupando os vértices mais acessados.
+
+        Returns:
+            list[int]: Os índices originais dos vértices, na nova ordem.
+
+        Examples:
+            GraphOrdering(...).get_degree_order()
+            ...
+        """
+        degree = [len(neighbors) for neighbors in self.get_symmetric_adjacency()]
+        return sorted(range(len(degree)), key=lambda vertex: -degree[vertex])
+
+    def get_order(self, method: str) -> list[int]:
+        """Calcula a nova ordem dos vértices, de acordo com o método.
+
+        Args:
+            method (str): "bfs", "rcm" ou "degree".
+
+        Returns:
+            list[int]: Os índices originais dos vértices, na nova ordem.
+
+        Examples:
+            GraphOrdering(...).get_order("rcm")
+            ...
+        """
+        if method == "bfs":
+            return self.get_bfs_order()
+        if method == "rcm":
+            return self.get_rcm_order()
+        if method == "degree":
+            return self.get_degree_order()
+        raise ValueError("O método de ordenação não é suportado: " + method)
+
+    def get_bandwidth(self) -> int:
+        """Retorna a maior distância entre os índices de dois vértices vizinhos.
+
+        Returns:
+            int: A largura de banda da matriz de adjacência.
+        """
+        return max((abs(i - j) for i, j, _ in self.graph.freeze().iter_edges()), default=0)
@@ -0,0 +1,309 @@
+from dataclasses import dataclass, field
+
+from FrozenGraph import FrozenGraph
+
+
+@dataclass
+class GraphOverlay:
+    """Representa uma camada mutável, copy-on-write, sobre uma cópia imutável do grafo.
+
+    Somente os arcos adicionados e removidos são guardados, o grafo base
+    nunca é copiado ou modificado.
+    """
+
+    base: FrozenGraph = field(repr=False)
+    added: dict[tuple[int, int], int | float] = field(init=False, default_factory=dict)
+    removed: set[tuple[int, int]] = field(init=False, default_factory=set)
+    added_neighbors: dict[int, set[int]] = field(repr=False, init=False, default_factory=dict)
+    degree: list[int] = field(repr=False, init=False, default_factory=list)
+
+    def __post_init__(self):
+        self.degree = self.base.get_vertexes_degree()
+
+    @property
+    def vertexes(self) -> tuple[str, ...]:
+        """Os rótulos dos vértices do grafo."""
+        return self.base.vertexes
+
+    @property
+    def vertex_count(self) -> int:
+        """A quantidade de vértices do grafo."""
+        return self.base.vertex_count
+
+    def reset(self):
+        """Descarta todas as alterações feitas sobre o grafo base."""
+        self.added.clear()
+        self.removed.clear()
+        self.added_neighbors.clear()
+        self.degree = self.base.get_vertexes_degree()
+
+    def get_index_weight(self, i: int, j: int) -> int | float | None:
+        """Retorna o custo de um arco, com os índices dos vértices.
+
+        Args:
+            i (int): O índice do vértice de origem.
+            j (int): O índice do vértice de destino.
+
+        Returns:
+            int | float | None: O custo do arco, ou None caso o arco não exista.
+        """
+        if (i, j) in self.added:
+            return self.added[(i, j)]
+        if (i, j) in self.removed:
+            return None
+        position = self.base.find_edge_position(i, j)
+        return self.base.weights[position] if position != -1 else None
+
+    def set_index_weight(self, i: int, j: int, weight: int | float | None):
+        """Define, ou remove, caso o custo seja None, um arco com os índices dos vértices.
+
+        Args:
+            i (int): O índice do vértice de origem.
+            j (int): O índice do vértice de destino.
+            weight (int | float | None): O novo custo do arco.
+        """
+        previous = self.get_index_weight(i, j)
+        # Atualiza o grau, arcos de custo 0 não são contados.
+        self.degree[i] += (weight not in (None, 0)) - (previous not in (None, 0))
+        if weight is None:
+            self.added.pop((i, j), None)
+            self.added_neighbors.get(i, set()).discard(j)
+            if self.base.find_edge_position(i, j) != -1:
+                self.removed.add((i, j))
+        else:
+            self.added[(i, j)] = weight
+            self.added_neighbors.setdefault(i, set()).add(j)
+            self.removed.discard((i, j))
+
+    def neighbors(self, vertex: int) -> list[int]:
+        """Retorna os índices dos vizinhos de um vértice, com as alterações aplicadas.
+
+        Args:
+            vertex (int): O índice do vértice.
+
+        Returns:
+            list[int]: Os índices dos vizinhos, em ordem crescente.
+        """
+        neighbors = {j for j in self.base.neighbors(vertex) if (vertex, j) not in self.removed}
+        neighbors.update(self.added_neighbors.get(vertex, ()))
+        return sorted(neighbors)
+
+    def validate_edge(self, edge: tuple[str, ...]) -> tuple[int, int]:
+        """Valida um arco e retorna os índices dos seus vértices.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            tuple[int, int]: Os índices dos vértices do arco.
+        """
+        # Verifica se é um arco apropriado.
+        if len(edge) == 2:
+            # Verifica se os rótulos existem no grafo.
+            if self.base.contain_vertexes(edge):
+                return (self.base.index[edge[0]], self.base.index[edge[1]])
+            else:
+                raise ValueError("Os rótulos fornecidos não existem no grafo.")
+        else:
+            raise ValueError("O tamanho do arco não é válido.")
+
+    def add_edge_directed(self, edge: tuple[str, ...], weight: int = 1):
+        """Adiciona um arco direcionado ao grafo.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices no qual será criado o arco.
+            weight (int, optional): O peso do arco, se nenhum valor for fornecido, o peso será 1.
+        """
+        i, j = self.validate_edge(edge)
+        self.set_index_weight(i, j, weight)
+
+    def remove_edge_directed(self, edge: tuple[str, ...]):
+        """Remove um arco direcionado do grafo.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices no qual será removido o arco.
+        """
+        i, j = self.validate_edge(edge)
+        self.set_index_weight(i, j, None)
+
+    def add_edge_undirected(self, edge: tuple[str, ...], weight: int = 1):
+        """Adiciona um arco não-direcionado ao grafo.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices no qual será criado o arco.
+            weight (int, optional): O peso do arco, se nenhum valor for fornecido, o peso será 1.
+        """
+        i, j = self.validate_edge(edge)
+        self.set_index_weight(i, j, weight)
+        self.set_index_weight(j, i, weight)
+
+    def remove_edge_undirected(self, edge: tuple[str, ...]):
+        """Remove um arco não-direcionado do grafo.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices no qual será removido o arco.
+        """
+        i, j = self.validate_edge(edge)
+        # Assim como no grafo, somente remove caso ambos os arcos existam.
+        if self.get_index_weight(i, j) is not None and self.get_index_weight(j, i) is not None:
+            self.set_index_weight(i, j, None)
+            self.set_index_weight(j, i, None)
+
+    def contain_vertex(self, vertex: str) -> bool:
+        """Verifica se um vértice está no grafo.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser procurado.
+
+        Returns:
+            bool: Se o vértice existe no grafo.
+        """
+        return self.base.contain_vertex(vertex)
+
+    def contain_vertexes(self, vertexes: tuple[str, ...]) -> bool:
+        """Verifica se múltiplos vértices estão no grafo.
+
+        Args:
+            vertexes (tuple[str, ...]): Os rótulos dos vértices a serem procurados.
+
+        Returns:
+            bool: Se os vértices existem no grafo.
+        """
+        return self.base.contain_vertexes(vertexes)
+
+    def contain_directed_edge(self, edge: tuple[str, ...]) -> bool:
+        """Verifica se um arco está no grafo.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            bool: Se o arco existe no grafo.
+        """
+        if len(edge) != 2 or not self.contain_vertexes(edge):
+            return False
+        return self.get_index_weight(self.base.index[edge[0]], self.base.index[edge[1]]) is not None
+
+    def contain_undirected_edge(self, edge: tuple[str, ...]) -> bool:
+        """Verifica se um arco não-direcionado está no grafo.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            bool: Se o arco existe no grafo.
+        """
+        return self.contain_directed_edge(edge) and self.contain_directed_edge(tuple(reversed(edge)))
+
+    def get_edge_weight(self, edge: tuple[str, ...]) -> int | float:
+        """Retorna o custo de um arco do grafo, caso exista.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            int | float: O custo do arco.
+        """
+        if len(edge) != 2 or not self.contain_vertexes(edge):
+            return 0
+        weight = self.get_index_weight(self.base.index[edge[0]], self.base.index[edge[1]])
+        return weight if weight is not None else 0
+
+    def get_vertexes_degree(self) -> list[int]:
+        """Faz a contagem de graus, para todos os vértices, do grafo.
+
+        Returns:
+            list[int]: A contagem de graus do grafo.
+        """
+        return list(self.degree)
+
+    def get_weighted_adjacency_indexes(self) -> list[list[tuple[int, int | float]]]:
+        """Retorna a lista de adjacência do grafo, com os índices dos vértices e o custo dos arcos.
+
+        Returns:
+            list[list[tuple[int, int | float]]]: Os índices dos vizinhos de cada vértice e o custo dos arcos.
+        """
+        adjacency = [
+            [(j, weight) for j, weight in row if (i, j) not in self.removed and (i, j) not in self.added]
+            for i, row in enumerate(self.base.get_weighted_adjacency_indexes())
+        ]
+        for (i, j), weight in self.added.items():
+            adjacency[i].append((j, weight))
+        # Mantém a mesma ordem de visita da matriz de adjacência.
+        for neighbors in adjacency:
+            neighbors.sort()
+        return adjacency
+
+    def get_adjacency_indexes(self, undirected: bool = False) -> list[list[int]]:
+        """Retorna a lista de adjacência do grafo, utilizando os índices dos vértices.
+
+        Args:
+            undirected (bool, optional): Se somente os arcos não-direcionados devem ser considerados.
+
+        Returns:
+            list[list[int]]: Os índices dos vizinhos de cada vértice, em ordem crescente.
+        """
+        adjacency = [
+            [j for j, _ in neighbors] for neighbors in self.get_weighted_adjacency_indexes()
+        ]
+        if undirected:
+            # Ignora os arcos que não possuem o arco inverso.
+            edges = {(i, j) for i, neighbors in enumerate(adjacency) for j in neighbors}
+            adjacency = [
+                [j for j in neighbors if (j, i) in edges] for i, neighbors in enumerate(adjacency)
+            ]
+        return adjacency
+
+    def find_adjacent_vertexes(self, vertexes: tuple[str, ...] | str) -> dict[str, list[str]]:
+        """Retorna os vértices adjacentes de um ou mais vértices.
+
+        Args:
+            vertexes (tuple[str, ...] | str): O rótulo de um ou mais vértice, de um grafo.
+
+        Returns:
+            dict[str, list[str]]: Os rótulos dos vértices adjacentes dos vértices fornecidos.
+        """
+        if isinstance(vertexes, str):
+            vertexes = (vertexes,)
+        adjacency = self.get_adjacency_indexes()
+        return {
+            vertex: [self.vertexes[j] for j in adjacency[self.translate_vertex_label_to_index(vertex)]]
+            for vertex in vertexes
+        }
+
+    def freeze(self) -> FrozenGraph:
+        """Cria uma nova cópia imutável, com as alterações aplicadas.
+
+        Returns:
+            FrozenGraph: A cópia imutável do grafo.
+        """
+        return FrozenGraph.from_edges(
+            self.vertexes,
+            (
+                (i, j, weight)
+                for i, neighbors in enumerate(self.get_weighted_adjacency_indexes())
+                for j, weight in neighbors
+            ),
+        )
+
+    def translate_vertex_index_to_label(self, vertex: int) -> str:
+        """Transforma o índice de um vértice para o rótulo.
+
+        Args:
+            vertex (int): O índice do vértice a ser buscado.
+
+        Returns:
+            str: O rótulo do vértice.
+        """
+        return self.base.translate_vertex_index_to_label(vertex)
+
+    def translate_vertex_label_to_index(self, vertex: str) -> int:
+        """Transforma o rótulo de um vértice para o índice.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser buscado.
+
+        Returns:
+            int: O índice do vértice.
+        """
+        return self.base.translate_vertex_label_to_index(vertex)
@@ -0,0 +1,196 @@
+"""Executa um algoritmo em um grafo lido de um arquivo, medindo o tempo e a memória.
+
+Examples:
+    python -m GraphProfiler Data/Example1.json dijkstra --source 1 --source 2
+
+    python -m GraphProfiler Grafo.journal bfs --profile Perfil.pstats --sample Perfil.folded
+"""
+
+from argparse import ArgumentParser
+from cProfile import Profile
+from collections.abc import Callable
+from io import StringIO
+from pstats import Stats
+from sys import platform
+from time import perf_counter
+
+from BreadthFirstSearch import BreadthFirstSearch
+from DepthFirstSearch import DepthFirstSearch
+from Euler import Euler
+from Graph import Graph
+from GraphJournal import MAGIC, GraphJournal
+from Hamiltonian import Hamiltonian
+from ShortestMinimumPath import ShortestMinimumPath
+from StackSampler import StackSampler
+
+# O módulo "resource" não existe no Windows, a memória não é informada nesse caso.
+try:
+    from resource import RUSAGE_SELF, getrusage
+except ImportError:
+    getrusage = None
+
+# Algoritmos executados a partir de cada ponto de partida.
+SOURCE_ALGORITHMS: dict[str, Callable[[Graph, str], object]] = {
+    "bfs": lambda graph, source: BreadthFirstSearch(graph).apply_bfs(source),
+    "dfs": lambda graph, source: DepthFirstSearch(graph).apply_dfs(source),
+    "dijkstra": lambda graph, source: ShortestMinimumPath(graph).apply_dijkstra_algorithm(source),
+    "bellman-ford": lambda graph, source: ShortestMinimumPath(graph).apply_bellman_ford_algorithm(source),
+}
+
+# Algoritmos executados uma única vez, sobre todo o grafo.
+GRAPH_ALGORITHMS: dict[str, Callable[[Graph], object]] = {
+    "floyd-warshall": lambda graph: ShortestMinimumPath(graph).apply_floyd_warshall_algorithm(),
+    "euler": lambda graph: (Euler(graph).is_graph_euler(), Euler(graph).is_graph_semi_euler()),
+    "hamiltonian": lambda graph: (
+        Hamiltonian(graph).is_graph_dirac(),
+        Hamiltonian(graph).is_graph_ore(),
+        Hamiltonian(graph).is_graph_bondy(),
+    ),
+}
+
+
+def load_graph(file_path: str) -> Graph:
+    """Lê um grafo de um arquivo JSON ou de um diário binário, identificado pelo cabeçalho.
+
+    Args:
+        file_path (str): O caminho do arquivo.
+
+    Returns:
+        Graph: O grafo lido.
+    """
+    with open(file_path, "rb") as file:
+        magic = file.read(len(MAGIC))
+    graph = Graph()
+    if magic == MAGIC:
+        with GraphJournal(file_path) as journal:
+            journal.replay(graph)
+    else:
+        graph.create_graph_from_file(file_path)
+    return graph
+
+
+def get_peak_memory() -> float | None:
+    """Retorna o pico de memória residente (RSS) do processo, em MiB.
+
+    Returns:
+        float | None: O pico de memória, ou None caso não seja possível medi-lo.
+    """
+    if getrusage is None:
+        return None
+    peak = getrusage(RUSAGE_SELF).ru_maxrss
+    # O macOS informa o pico em bytes, os demais sistemas em KiB.
+    return peak / (1 << 20) if platform == "darwin" else peak / (1 << 10)
+
+
+def run_algorithm(graph: Graph, algorithm: str, sources: list[str], repeat: int = 1) -> list[float]:
+    """Executa um algoritmo, medindo o tempo de cada execução.
+
+    Args:
+        graph (Graph): O grafo.
+        algorithm (str): O nome do algoritmo.
+        sources (list[str]): Os pontos de partida, para os algoritmos que os utilizam.
+        repeat (int, optional): A quantidade de execuções.
+
+    Returns:
+        list[float]: O tempo, em segundos, de cada execução, para todos os pontos de partida.
+    """
+    if algorithm in SOURCE_ALGORITHMS:
+        function = SOURCE_ALGORITHMS[algorithm]
+        job = lambda: [function(graph, source) for source in sources]
+    else:
+        function = GRAPH_ALGORITHMS[algorithm]
+        job = lambda: function(graph)
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        job()
+        times.append(perf_counter() - start)
+    return times
+
+
+def main(arguments: list[str] | None = None):
+    """Lê os argumentos da linha de comando, executa o algoritmo e imprime o relatório.
+
+    Args:
+        arguments (list[str] | None, optional): Os argumentos, por padrão, os da linha de comando.
+    """
+    parser = ArgumentParser(
+        prog="python -m GraphProfiler",
+        description="Executa um algoritmo em um grafo lido de um arquivo, medindo o tempo e a memória.",
+    )
+    parser.add_argument(
+        "file",
+        help="o arquivo do grafo, somente JSON (create_graph_from_file) ou diário binário (GraphJournal), "
+        "as hierarquias de contração e os grafos comprimidos não guardam o grafo original",
+    )
+    parser.add_argument("algorithm", choices=[*SOURCE_ALGORITHMS, *GRAPH_ALGORITHMS], help="o algoritmo")
+    parser.add_argument(
+        "-s", "--source", action="append", default=[],
+        help="um ponto de partida, pode ser repetido, por padrão, o primeiro vértice",
+    )
+    parser.add_argument("--all-sources", action="store_true", help="utiliza todos os vértices como pontos de partida")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="a quantidade de execuções")
+    parser.add_argument("--profile", metavar="ARQUIVO", help="escreve as estatísticas do cProfile (pstats)")
+    parser.add_argument("--top", type=int, default=15, help="a quantidade de funções do cProfile impressas")
+    parser.add_argument("--sample", metavar="ARQUIVO", help="escreve as pilhas amostradas, para flame graphs")
+    parser.add_argument("--interval", type=float, default=0.001, help="o intervalo entre as amostras, em segundos")
+    options = parser.parse_args(arguments)
+    if options.repeat < 1:
+        parser.error("a quantidade de execuções deve ser positiva")
+
+    start = perf_counter()
+    graph = load_graph(options.file)
+    load_time = perf_counter() - start
+
+    # Os vértices removidos (tombstone) por um diário não são pontos de partida.
+    vertexes = [vertex for vertex in graph.vertexes if graph.contain_vertex(vertex)]
+    sources = options.source
+    if options.all_sources:
+        sources = vertexes
+    elif not sources and vertexes:
+        sources = [vertexes[0]]
+    if options.algorithm in SOURCE_ALGORITHMS:
+        if not sources:
+            parser.error("o grafo não possui vértices")
+        # Valida os pontos de partida antes das medições.
+        for source in sources:
+            if not graph.contain_vertex(source):
+                parser.error("o grafo não possui o vértice: " + source)
+
+    profiler = Profile() if options.profile else None
+    sampler = StackSampler(options.interval) if options.sample else None
+    if sampler is not None:
+        sampler.start()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        times = run_algorithm(graph, options.algorithm, sources, options.repeat)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        if sampler is not None:
+            sampler.stop()
+
+    print(f"grafo: {options.file} ({len(vertexes)} vértices, {len(graph.edges)} arcos)")
+    print(f"  leitura: {load_time:.4f} s")
+    if options.algorithm in SOURCE_ALGORITHMS:
+        print(f"  {options.algorithm}: {len(sources)} ponto(s) de partida, {options.repeat} execução(ões)")
+    else:
+        print(f"  {options.algorithm}: {options.repeat} execução(ões)")
+    print(f"  cálculo: mínimo {min(times):.4f} s, máximo {max(times):.4f} s, total {sum(times):.4f} s")
+    peak = get_peak_memory()
+    print(f"  pico de memória (RSS): {peak:.1f} MiB" if peak is not None else "  pico de memória (RSS): indisponível")
+
+    if profiler is not None:
+        profiler.dump_stats(options.profile)
+        report = StringIO()
+        Stats(profiler, stream=report).sort_stats("cumulative").print_stats(options.top)
+        print(f"  cProfile: {options.profile}")
+        print(report.getvalue())
+    if sampler is not None:
+        sampler.write_folded(options.sample)
+        print(f"  amostras: {sum(sampler.counts.values())} em {options.sample}")
+
+
+if __name__ == "__main__":
+    main()
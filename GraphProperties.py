@@ -0,0 +1,116 @@
+from dataclasses import dataclass, field
+
+from FrozenGraph import FrozenGraph
+
+
+@dataclass(frozen=True, slots=True)
+class GraphProperties:
+    """Representa o perfil de graus e de conectividade de um grafo.
+
+    O perfil é calculado em uma única passada sobre os arcos e guardado
+    na cópia imutável do grafo, sendo assim, ele é reaproveitado por todos
+    os teoremas até que o grafo seja alterado.
+    """
+
+    degree: tuple[int, ...] = field(repr=False)
+    in_degree: tuple[int, ...] = field(repr=False)
+    degree_sum: int
+    min_degree: int
+    max_degree: int
+    odd_count: int
+    connected: bool
+    strongly_connected: bool
+
+    @classmethod
+    def from_frozen(cls, graph: FrozenGraph) -> "GraphProperties":
+        """Calcula o perfil a partir da cópia imutável do grafo.
+
+        Assim como na matriz de adjacência, arcos de custo 0 não são contados.
+        A conectividade considera somente os vértices com algum arco, ignorando
+        a direção dos arcos, já a conectividade forte considera a direção.
+
+        Args:
+            graph (FrozenGraph): A cópia imutável do grafo.
+
+        Returns:
+            GraphProperties: O perfil do grafo.
+
+        Examples:
+            GraphProperties.from_frozen(Graph().freeze())
+            ...
+        """
+        n = graph.vertex_count
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        degree = [0] * n
+        in_degree = [0] * n
+        incident = bytearray(n)
+        # Conjuntos disjuntos, unindo os vértices de cada arco.
+        parent = list(range(n))
+
+        def find(vertex: int) -> int:
+            while parent[vertex] != vertex:
+                parent[vertex] = parent[parent[vertex]]
+                vertex = parent[vertex]
+            return vertex
+
+        for i in range(n):
+            for position in range(offsets[i], offsets[i + 1]):
+                if weights[position] == 0:
+                    continue
+                j = targets[position]
+                degree[i] += 1
+                in_degree[j] += 1
+                incident[i] = incident[j] = 1
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[root_i] = root_j
+
+        roots = {find(i) for i in range(n) if incident[i]}
+
+        # Conectividade forte, todos os vértices com arcos devem ser alcançados
+        # a partir de um deles, seguindo os arcos e seguindo os arcos invertidos.
+        strongly_connected = len(roots) <= 1
+        start = next((i for i in range(n) if incident[i]), None)
+        if strongly_connected and start is not None:
+            reverse = [[] for _ in range(n)]
+            for i in range(n):
+                for position in range(offsets[i], offsets[i + 1]):
+                    if weights[position] != 0:
+                        reverse[targets[position]].append(i)
+            forward = [
+                [targets[position] for position in range(offsets[i], offsets[i + 1]) if weights[position] != 0]
+                for i in range(n)
+            ]
+            for adjacency in (forward, reverse):
+                visited = bytearray(n)
+                visited[start] = 1
+                stack = [start]
+                while stack:
+                    for neighbor in adjacency[stack.pop()]:
+                        if not visited[neighbor]:
+                            visited[neighbor] = 1
+                            stack.append(neighbor)
+                if visited != incident:
+                    strongly_connected = False
+                    break
+
+        return cls(
+            tuple(degree),
+            tuple(in_degree),
+            sum(degree),
+            min(degree, default=0),
+            max(degree, default=0),
+            sum(value & 1 for value in degree),
+            len(roots) <= 1,
+            strongly_connected,
+        )
+
+    @property
+    def vertex_count(self) -> int:
+        """A quantidade de vértices do grafo."""
+        return len(self.degree)
+
+    @property
+    def even_count(self) -> int:
+        """A quantidade de vértices de grau par."""
+        return self.vertex_count - self.odd_count
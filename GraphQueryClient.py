@@ -0,0 +1,48 @@
+import asyncio
+from dataclasses import dataclass, field
+
+from GraphQueryService import GraphQueryService
+
+
+@dataclass
+class GraphQueryClient:
+    """Cliente do serviço de consultas no mesmo processo, sem rede, para testes e scripts locais.
+
+    As requisições são os mesmos dicionários recebidos pelo serviço web,
+    sendo assim, o comportamento do serviço, inclusive a unificação e o
+    agrupamento das consultas simultâneas, pode ser verificado localmente.
+
+    Examples:
+        async with GraphQueryService(graph) as service:
+            client = GraphQueryClient(service)
+            await client.request("route", source="A", destiny="B")
+            ...
+    """
+
+    service: GraphQueryService = field(repr=False)
+
+    async def request(self, kind: str, **arguments: str) -> object:
+        """Envia uma requisição e retorna o seu resultado.
+
+        Args:
+            kind (str): O tipo da consulta, "bfs", "dfs", "dijkstra", "route" ou "distance".
+            **arguments (str): Os argumentos da consulta, "source" e, nas consultas ponto a ponto, "destiny".
+
+        Returns:
+            object: O resultado da consulta.
+        """
+        response = await self.service.handle({"kind": kind, **arguments})
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    async def request_many(self, requests: list[dict[str, str]]) -> list[dict[str, object]]:
+        """Envia várias requisições simultaneamente, como vários usuários do serviço.
+
+        Args:
+            requests (list[dict[str, str]]): As requisições.
+
+        Returns:
+            list[dict[str, object]]: As respostas, na mesma ordem das requisições.
+        """
+        return list(await asyncio.gather(*(self.service.handle(request) for request in requests)))
@@ -0,0 +1,277 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from BreadthFirstSearch import BreadthFirstSearch
+from DepthFirstSearch import DepthFirstSearch
+from FrozenGraph import FrozenGraph
+from Graph import Graph
+from ShortestMinimumPath import ShortestMinimumPath
+from ShortestPathResult import ShortestPathResult
+
+
+def run_bfs(graph: FrozenGraph, source: str) -> list[tuple[str, ...]]:
+    """Realiza a Busca em Largura, fora do event loop.
+
+    Args:
+        graph (FrozenGraph): A cópia imutável do grafo.
+        source (str): O rótulo do vértice tomado como ponto de partida.
+
+    Returns:
+        list[tuple[str, ...]]: O caminho percorrido pelo algoritmo.
+    """
+    return BreadthFirstSearch(graph).apply_bfs(source)
+
+
+def run_dfs(graph: FrozenGraph, source: str) -> list[tuple[str, ...]]:
+    """Realiza a Busca em Profundidade, fora do event loop.
+
+    Args:
+        graph (FrozenGraph): A cópia imutável do grafo.
+        source (str): O rótulo do vértice tomado como ponto de partida.
+
+    Returns:
+        list[tuple[str, ...]]: O caminho percorrido pelo algoritmo.
+    """
+    return DepthFirstSearch(graph).apply_dfs(source)
+
+
+def run_dijkstra(graph: FrozenGraph, source: str, destinies: tuple[str, ...] | None = None) -> ShortestPathResult:
+    """Aplica o algoritmo de Dijkstra, fora do event loop.
+
+    Args:
+        graph (FrozenGraph): A cópia imutável do grafo.
+        source (str): O rótulo do vértice tomado como ponto de partida.
+        destinies (tuple[str, ...] | None, optional): Os rótulos dos vértices de destino.
+
+    Returns:
+        ShortestPathResult: Os custos e os antecessores.
+    """
+    return ShortestMinimumPath(graph).get_dijkstra_result(source, destinies)
+
+
+@dataclass
+class GraphQueryService:
+    """Responsável por consultas assíncronas ao grafo, sem bloquear o event loop.
+
+    As buscas são executadas em um pool de workers, consultas simultâneas
+    para a mesma origem são unificadas em uma única execução e consultas
+    ponto a ponto, para a mesma origem, são agrupadas em um único Dijkstra.
+    """
+
+    graph: Graph | FrozenGraph = field(repr=False)
+    executor: Executor | None = field(repr=False, default=None)
+    batch_delay: float = 0.0
+    # Execuções em andamento, junto da cópia imutável consultada, para cada tipo de consulta e origem.
+    in_flight: dict[tuple[str, str], tuple[FrozenGraph, asyncio.Future]] = field(
+        repr=False, init=False, default_factory=dict
+    )
+    pending: dict[str, dict[str, list[asyncio.Future]]] = field(repr=False, init=False, default_factory=dict)
+    # Referências dos lotes agendados, para que não sejam coletados antes de terminar.
+    tasks: set[asyncio.Task] = field(repr=False, init=False, default_factory=set)
+    owns_executor: bool = field(repr=False, init=False, default=False)
+
+    def __post_init__(self):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor()
+            self.owns_executor = True
+
+    async def __aenter__(self) -> "GraphQueryService":
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+    async def close(self):
+        """Finaliza o pool de workers, caso ele tenha sido criado pelo serviço."""
+        if self.owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+            self.owns_executor = False
+
+    def run_coalesced(self, kind: str, source: str, function, *args) -> asyncio.Future:
+        """Executa uma consulta no pool, reaproveitando a execução em andamento da mesma consulta.
+
+        Args:
+            kind (str): O tipo da consulta.
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            function: A função a ser executada no pool.
+
+        Returns:
+            asyncio.Future: O resultado da consulta.
+        """
+        graph = self.graph.freeze()
+        # A cópia imutável muda a cada versão do grafo e é guardada junto da execução,
+        # sendo assim, uma consulta feita depois de uma alteração nunca recebe o
+        # resultado do grafo anterior, mesmo que a nova cópia ocupe o mesmo endereço.
+        key = (kind, source)
+        entry = self.in_flight.get(key)
+        if entry is None or entry[0] is not graph:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, function, graph, source, *args)
+            entry = self.in_flight[key] = (graph, future)
+
+            def forget(_: asyncio.Future):
+                """Esquece a execução terminada, caso não tenha sido substituída por uma mais recente."""
+                if self.in_flight.get(key) is entry:
+                    del self.in_flight[key]
+
+            future.add_done_callback(forget)
+        # Protege a execução compartilhada caso um dos solicitantes seja cancelado.
+        return asyncio.shield(entry[1])
+
+    async def bfs(self, source: str) -> list[tuple[str, ...]]:
+        """Realiza a Busca em Largura.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Returns:
+            list[tuple[str, ...]]: O caminho percorrido pelo algoritmo.
+
+        Examples:
+            await GraphQueryService(...).bfs("A")
+            ...
+        """
+        return await self.run_coalesced("bfs", source, run_bfs)
+
+    async def dfs(self, source: str) -> list[tuple[str, ...]]:
+        """Realiza a Busca em Profundidade.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Returns:
+            list[tuple[str, ...]]: O caminho percorrido pelo algoritmo.
+
+        Examples:
+            await GraphQueryService(...).dfs("A")
+            ...
+        """
+        return await self.run_coalesced("dfs", source, run_dfs)
+
+    async def dijkstra(self, source: str) -> ShortestPathResult:
+        """Aplica o algoritmo de Dijkstra.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Returns:
+            ShortestPathResult: Os custos e os antecessores.
+
+        Examples:
+            await GraphQueryService(...).dijkstra("A")
+            ...
+        """
+        return await self.run_coalesced("dijkstra", source, run_dijkstra)
+
+    async def route(self, source: str, destiny: str) -> tuple[int | float, list[str]]:
+        """Retorna o custo e o caminho mínimo entre dois vértices.
+
+        As consultas para a mesma origem, feitas no mesmo ciclo do event loop
+        (ou dentro de "batch_delay" segundos), são respondidas por um único Dijkstra.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+
+        Returns:
+            tuple[int | float, list[str]]: O custo e os rótulos dos vértices do caminho.
+
+        Examples:
+            await GraphQueryService(...).route("A", "B")
+            ...
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if source not in self.pending:
+            self.pending[source] = {}
+            # Agenda a execução do lote, para a origem, após as demais consultas serem recebidas.
+            task = loop.create_task(self.flush(source))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+        self.pending[source].setdefault(destiny, []).append(future)
+        return await future
+
+    async def distance(self, source: str, destiny: str) -> int | float:
+        """Retorna o custo mínimo entre dois vértices.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+
+        Returns:
+            int | float: O custo mínimo, infinito caso o destino não seja alcançável.
+
+        Examples:
+            await GraphQueryService(...).distance("A", "B")
+            ...
+        """
+        return (await self.route(source, destiny))[0]
+
+    async def handle(self, request: dict[str, str]) -> dict[str, object]:
+        """Responde uma requisição, como as recebidas por um serviço web, sem lançar os erros das consultas.
+
+        Args:
+            request (dict[str, str]): O tipo da consulta ("kind") e os seus argumentos ("source" e "destiny").
+
+        Returns:
+            dict[str, object]: O resultado ("result") ou a mensagem de erro ("error").
+
+        Examples:
+            await GraphQueryService(...).handle({"kind": "route", "source": "A", "destiny": "B"})
+            ...
+        """
+        queries = {
+            "bfs": self.bfs,
+            "dfs": self.dfs,
+            "dijkstra": self.dijkstra,
+            "route": self.route,
+            "distance": self.distance,
+        }
+        arguments = dict(request)
+        kind = arguments.pop("kind", None)
+        if kind not in queries:
+            return {"error": f"A consulta não existe: {kind}"}
+        try:
+            return {"result": await queries[kind](**arguments)}
+        except (TypeError, ValueError) as error:
+            return {"error": str(error)}
+
+    async def flush(self, source: str):
+        """Executa um único Dijkstra, para todas as consultas pendentes de uma origem.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+        """
+        await asyncio.sleep(self.batch_delay)
+        requests = self.pending.pop(source)
+        graph = self.graph.freeze()
+
+        def reject(futures: list[asyncio.Future], error: Exception):
+            """Finaliza as consultas com um erro."""
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+
+        # Os destinos inexistentes falham somente as suas próprias consultas.
+        destinies = []
+        for destiny, futures in requests.items():
+            if graph.contain_vertex(destiny):
+                destinies.append(destiny)
+            else:
+                reject(futures, ValueError("O grafo não possui o vértice: " + destiny))
+        if not destinies:
+            return
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self.executor, run_dijkstra, graph, source, tuple(destinies)
+            )
+        except Exception as error:
+            for destiny in destinies:
+                reject(requests[destiny], error)
+            return
+        for destiny in destinies:
+            answer = (result.distance_to(destiny), result.path_to(destiny))
+            for future in requests[destiny]:
+                if not future.done():
+                    future.set_result(answer)
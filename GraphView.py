@@ -0,0 +1,351 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterator, Sequence
+
+from FrozenGraph import FrozenGraph
+from Graph import Graph
+
+
+class GraphView(ABC):
+    """Representa uma visão somente leitura sobre a cópia imutável de um grafo, sem copiar os arcos.
+
+    As visões possuem os mesmos métodos de leitura do "Graph" e podem ser
+    fornecidas diretamente aos algoritmos, que utilizam a cópia imutável
+    da própria visão (freeze). O método "materialize" cria um "Graph" com
+    os vértices e arcos da visão, somente quando ele for necessário.
+
+    As subclasses definem o grafo base, os índices (no grafo base) dos
+    vértices da visão e quais arcos pertencem à visão.
+    """
+
+    # Os atributos são definidos pelas subclasses.
+    __slots__ = ()
+
+    base: FrozenGraph
+    cache: dict[str, object]
+
+    @property
+    @abstractmethod
+    def members(self) -> Sequence[int]:
+        """Os índices, no grafo base, dos vértices da visão, em ordem crescente."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def has_vertex(self, i: int) -> bool:
+        """Verifica se um vértice, pelo índice no grafo base, pertence à visão.
+
+        Args:
+            i (int): O índice do vértice no grafo base.
+
+        Returns:
+            bool: Se o vértice pertence à visão.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_arcs(self, i: int) -> Iterator[tuple[int, int | float]]:
+        """Percorre os arcos de saída de um vértice da visão, com os índices do grafo base.
+
+        Args:
+            i (int): O índice do vértice no grafo base.
+
+        Yields:
+            tuple[int, int | float]: O índice do vizinho e o custo do arco.
+        """
+        raise NotImplementedError
+
+    def get_index_weight(self, i: int, j: int) -> int | float | None:
+        """Retorna o custo de um arco da visão, com os índices do grafo base.
+
+        Args:
+            i (int): O índice do vértice de origem.
+            j (int): O índice do vértice de destino.
+
+        Returns:
+            int | float | None: O custo do arco, ou None caso o arco não pertença à visão.
+        """
+        for neighbor, weight in self.iter_arcs(i):
+            if neighbor == j:
+                return weight
+        return None
+
+    @property
+    def vertexes(self) -> tuple[str, ...]:
+        """Os rótulos dos vértices da visão."""
+        if "vertexes" not in self.cache:
+            self.cache["vertexes"] = tuple(self.base.vertexes[i] for i in self.members)
+        return self.cache["vertexes"]
+
+    @property
+    def vertex_count(self) -> int:
+        """A quantidade de vértices da visão."""
+        return len(self.members)
+
+    @property
+    def index(self) -> dict[str, int]:
+        """O índice, na visão, de cada rótulo."""
+        if "index" not in self.cache:
+            self.cache["index"] = {vertex: i for i, vertex in enumerate(self.vertexes)}
+        return self.cache["index"]
+
+    @property
+    def edges(self) -> dict[tuple[str, str], int | float]:
+        """Os arcos da visão, com os rótulos dos vértices, e os seus custos."""
+        vertexes = self.base.vertexes
+        return {
+            (vertexes[i], vertexes[j]): weight for i in self.members for j, weight in self.iter_arcs(i)
+        }
+
+    def get_base_index(self, vertex: str) -> int | None:
+        """Transforma o rótulo de um vértice para o índice no grafo base.
+
+        Args:
+            vertex (str): O rótulo do vértice.
+
+        Returns:
+            int | None: O índice no grafo base, ou None caso o vértice não pertença à visão.
+        """
+        i = self.base.index.get(vertex)
+        return i if i is not None and self.has_vertex(i) else None
+
+    def contain_vertex(self, vertex: str) -> bool:
+        """Verifica se um vértice está na visão.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser procurado.
+
+        Returns:
+            bool: Se o vértice existe na visão.
+        """
+        return self.get_base_index(vertex) is not None
+
+    def contain_vertexes(self, vertexes: tuple[str, ...]) -> bool:
+        """Verifica se múltiplos vértices estão na visão.
+
+        Args:
+            vertexes (tuple[str, ...]): Os rótulos dos vértices a serem procurados.
+
+        Returns:
+            bool: Se os vértices existem na visão.
+        """
+        return all(self.contain_vertex(vertex) for vertex in vertexes)
+
+    def contain_directed_edge(self, edge: tuple[str, ...]) -> bool:
+        """Verifica se um arco está na visão.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            bool: Se o arco existe na visão.
+        """
+        if len(edge) != 2:
+            return False
+        i, j = (self.get_base_index(vertex) for vertex in edge)
+        return i is not None and j is not None and self.get_index_weight(i, j) is not None
+
+    def contain_undirected_edge(self, edge: tuple[str, ...]) -> bool:
+        """Verifica se um arco não-direcionado está na visão.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            bool: Se o arco existe na visão.
+        """
+        return self.contain_directed_edge(edge) and self.contain_directed_edge(tuple(reversed(edge)))
+
+    def get_edge_weight(self, edge: tuple[str, ...]) -> int | float:
+        """Retorna o custo de um arco da visão, caso exista.
+
+        Args:
+            edge (tuple[str, ...]): Os rótulos dos vértices, ou seja, o arco.
+
+        Returns:
+            int | float: O custo do arco, 0 caso não exista.
+        """
+        if not self.contain_directed_edge(edge):
+            return 0
+        i, j = (self.base.index[vertex] for vertex in edge)
+        return self.get_index_weight(i, j)
+
+    def iter_edges(self) -> Iterator[tuple[int, int, int | float]]:
+        """Percorre todos os arcos da visão, com os índices dos vértices na visão.
+
+        Yields:
+            tuple[int, int, int | float]: A origem, o destino e o custo do arco.
+        """
+        index, vertexes = self.index, self.base.vertexes
+        for i in self.members:
+            source = index[vertexes[i]]
+            for j, weight in self.iter_arcs(i):
+                yield (source, index[vertexes[j]], weight)
+
+    def get_vertexes_degree(self) -> list[int]:
+        """Faz a contagem de graus, para todos os vértices, da visão.
+
+        Assim como na matriz de adjacência, arcos de custo 0 não são contados.
+
+        Returns:
+            list[int]: A contagem de graus da visão.
+        """
+        return [sum(1 for _, weight in self.iter_arcs(i) if weight != 0) for i in self.members]
+
+    def get_vertexes_degree_sum(self) -> int:
+        """Pega a quantidade máxima, a soma, dos graus, dos vértices, da visão.
+
+        Returns:
+            int: A soma dos graus dos vértices.
+        """
+        return sum(self.get_vertexes_degree())
+
+    def get_graph_density(self) -> float:
+        """Pega a densidade da visão.
+
+        Returns:
+            float: A densidade da visão.
+        """
+        return self.get_vertexes_degree_sum() / self.vertex_count
+
+    def get_graph_frequency(self) -> dict[int, int]:
+        """Pega a frequência dos vértices da visão.
+
+        Returns:
+            dict[int, int]: A frequência dos vértices da visão.
+        """
+        return dict(Counter(sorted(self.get_vertexes_degree())))
+
+    def find_vertexes_with_degree(self, degree: int) -> list[str]:
+        """Retorna todos os vértices com determinado grau na visão.
+
+        Args:
+            degree (int): O grau a ser procurado nos vértices da visão.
+
+        Returns:
+            list[str]: Os rótulos dos vértices com tal grau.
+        """
+        return [vertex for vertex, value in zip(self.vertexes, self.get_vertexes_degree()) if value == degree]
+
+    def find_vertexes_with_max_degree(self) -> list[str]:
+        """Retorna todos os vértices de grau máximo na visão.
+
+        Returns:
+            list[str]: Os rótulos dos vértices de grau máximo.
+        """
+        return self.find_vertexes_with_degree(max(self.get_vertexes_degree()))
+
+    def find_vertexes_with_min_degree(self) -> list[str]:
+        """Retorna todos os vértices de grau mínimo na visão.
+
+        Returns:
+            list[str]: Os rótulos dos vértices de grau mínimo.
+        """
+        return self.find_vertexes_with_degree(min(self.get_vertexes_degree()))
+
+    def find_adjacent_vertexes(self, vertexes: tuple[str, ...] | str) -> dict[str, list[str]]:
+        """Retorna os vértices adjacentes de um ou mais vértices.
+
+        Args:
+            vertexes (tuple[str, ...] | str): O rótulo de um ou mais vértice, da visão.
+
+        Returns:
+            dict[str, list[str]]: Os rótulos dos vértices adjacentes dos vértices fornecidos.
+        """
+        if isinstance(vertexes, str):
+            vertexes = (vertexes,)
+        labels = self.base.vertexes
+        adjacent = {}
+        for vertex in vertexes:
+            i = self.get_base_index(vertex)
+            if i is None:
+                raise ValueError("O grafo não possui o vértice: " + vertex)
+            adjacent[vertex] = [labels[j] for j, _ in self.iter_arcs(i)]
+        return adjacent
+
+    def get_adjacency_indexes(self, undirected: bool = False) -> list[list[int]]:
+        """Retorna a lista de adjacência da visão, utilizando os índices dos vértices na visão.
+
+        Args:
+            undirected (bool, optional): Se somente os arcos não-direcionados devem ser considerados.
+
+        Returns:
+            list[list[int]]: Os índices dos vizinhos de cada vértice, em ordem crescente.
+        """
+        return self.freeze().get_adjacency_indexes(undirected)
+
+    def get_weighted_adjacency_indexes(self) -> list[list[tuple[int, int | float]]]:
+        """Retorna a lista de adjacência, com os custos, utilizando os índices dos vértices na visão.
+
+        Returns:
+            list[list[tuple[int, int | float]]]: Os índices dos vizinhos e os custos dos arcos.
+        """
+        return self.freeze().get_weighted_adjacency_indexes()
+
+    def freeze(self) -> FrozenGraph:
+        """Cria, uma única vez, a cópia imutável da visão, utilizada pelos algoritmos.
+
+        Returns:
+            FrozenGraph: A cópia imutável da visão.
+        """
+        if "frozen" not in self.cache:
+            self.cache["frozen"] = FrozenGraph.from_edges(self.vertexes, self.iter_edges())
+        return self.cache["frozen"]
+
+    def get_properties(self) -> "GraphProperties":
+        """Retorna o perfil de graus e de conectividade da visão.
+
+        Returns:
+            GraphProperties: O perfil da visão.
+        """
+        return self.freeze().get_properties()
+
+    def get_reachability_index(self) -> "ReachabilityIndex":
+        """Retorna o índice de alcançabilidade da visão.
+
+        Returns:
+            ReachabilityIndex: O índice de alcançabilidade.
+        """
+        return self.freeze().get_reachability_index()
+
+    def translate_vertex_index_to_label(self, vertex: int) -> str:
+        """Transforma o índice, na visão, de um vértice para o rótulo.
+
+        Args:
+            vertex (int): O índice do vértice a ser buscado.
+
+        Returns:
+            str: O rótulo do vértice.
+        """
+        if 0 <= vertex < self.vertex_count:
+            return self.vertexes[vertex]
+        raise ValueError("Não existe nenhum vértice com esse índice.")
+
+    def translate_vertex_label_to_index(self, vertex: str) -> int:
+        """Transforma o rótulo de um vértice para o índice na visão.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser buscado.
+
+        Returns:
+            int: O índice do vértice.
+        """
+        if vertex in self.index:
+            return self.index[vertex]
+        raise ValueError("O grafo não possui o vértice: " + vertex)
+
+    def materialize(self) -> Graph:
+        """Cria um "Graph", com a matriz de adjacência, contendo os vértices e os arcos da visão.
+
+        Returns:
+            Graph: O novo grafo.
+
+        Examples:
+            graph.freeze().get_subgraph_view(("A", "B")).materialize()
+            ...
+        """
+        graph = Graph()
+        with graph.batch():
+            graph.add_vertexes(self.vertexes)
+            for edge, weight in self.edges.items():
+                graph.add_edge_directed(edge, weight)
+        return graph
@@ -1,7 +1,8 @@
-from copy import deepcopy
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from Graph import Graph
+from ParallelHamiltonianSearch import ParallelHamiltonianSearch
 
 
 @dataclass
@@ -21,7 +22,7 @@ class Hamiltonian:
         """
         # Usa o valor padrão dos graus, se nenhum for fornecido.
         if len(degree) == 0:
-            degree = self.graph.get_vertexes_degree()
+            degree = self.graph.get_properties().degree
         max_edges_possible = (self.graph.vertex_count * (self.graph.vertex_count - 1)) // 2
         max_edges_in_parent = sum([v - i for i, v in enumerate(degree)])
         return max_edges_in_parent == max_edges_possible
@@ -33,10 +34,7 @@ class Hamiltonian:
             bool: Se o grafo está de acordo com o teorema.
         """
         if self.graph.vertex_count >= 3:
-            return all(
-                degree > self.graph.vertex_count // 2
-                for degree in self.graph.get_vertexes_degree()
-            )
+            return self.graph.get_properties().min_degree > self.graph.vertex_count // 2
         return False
 
     def is_graph_ore(self) -> bool:
@@ -45,16 +43,19 @@ class Hamiltonian:
         Returns:
             bool: Se o grafo está de acordo com o teorema.
         """
+        graph = self.graph.freeze()
+        n = graph.vertex_count
         # Grau dos vértices do grafo.
-        degree = self.graph.get_vertexes_degree()
+        degree = graph.get_properties().degree
+        # Vizinhos, não-direcionados, de cada vértice.
+        adjacent = [set(neighbors) for neighbors in graph.get_adjacency_indexes(True)]
         # Itera sobre os vértices não-adjacentes.
-        for i_index, i in enumerate(self.graph.vertexes):
-            for j_index, j in enumerate(self.graph.vertexes):
-                if i != j:
-                    if not self.graph.contain_undirected_edge((i, j)):
-                        # Verifica se não é possível ligar os vértices não-adjacentes.
-                        if not (degree[i_index] + degree[j_index]) >= self.graph.vertex_count:
-                            return False
+        for i in range(n):
+            for j in range(n):
+                if i != j and j not in adjacent[i]:
+                    # Verifica se não é possível ligar os vértices não-adjacentes.
+                    if not (degree[i] + degree[j]) >= n:
+                        return False
         return True
 
     def is_graph_bondy(self) -> bool:
@@ -63,29 +64,71 @@ class Hamiltonian:
         Returns:
             bool: Se o grafo está de acordo com o teorema.
         """
-        
+
+        def contain_edge(i: int, j: int) -> bool:
+            """Verifica se um arco não-direcionado existe, com os índices dos vértices.
+
+            Args:
+                i (int): O índice do primeiro vértice.
+                j (int): O índice do segundo vértice.
+
+            Returns:
+                bool: Se o arco existe.
+            """
+            return graph_copy.get_index_weight(i, j) is not None and graph_copy.get_index_weight(j, i) is not None
+
         def connect_vertexes_until() -> list[int]:
             """Conecta vértices não-adjacentes até que não seja mais possível.
 
+            Como os graus só aumentam, os pares já verificados não precisam
+            ser verificados novamente, sendo assim, uma única passada é suficiente.
+
             Returns:
                 list[int]: O grau dos vértices do grafo.
             """
-            # Grau dos vértices do grafo.
-            degree = graph_copy.get_vertexes_degree()
+            n = graph_copy.vertex_count
+            # Grau dos vértices do grafo, atualizado conforme os arcos são adicionados.
+            degree = graph_copy.degree
             # Itera sobre os vértices não-adjacentes.
-            for i_index, i in enumerate(graph_copy.vertexes):
-                for j_index, j in enumerate(graph_copy.vertexes):
-                    if i != j:
-                        if not graph_copy.contain_undirected_edge((i, j)):
-                            # Verifica se não é possível ligar os vértices não-adjacentes.
-                            if not (degree[i_index] + degree[j_index]) >= self.graph.vertex_count:
-                                # Adiciona um arco.
-                                graph_copy.add_edge_undirected((i, j))
-                                # Repete todo o processo.
-                                return connect_vertexes_until()
+            for i in range(n):
+                for j in range(n):
+                    if i != j and not contain_edge(i, j):
+                        # Verifica se não é possível ligar os vértices não-adjacentes.
+                        if not (degree[i] + degree[j]) >= n:
+                            # Adiciona um arco.
+                            graph_copy.set_index_weight(i, j, 1)
+                            graph_copy.set_index_weight(j, i, 1)
             return graph_copy.get_vertexes_degree()
         
-        # Cria uma cópia do grafo e aplica o teorema.
-        graph_copy = deepcopy(self.graph)
+        # Cria uma camada mutável sobre o grafo, sem copiá-lo, e aplica o teorema.
+        graph_copy = self.graph.freeze().overlay()
         return self.graph_has_closure(connect_vertexes_until())
 
+    def find_hamiltonian_cycle(
+        self,
+        prefix_length: int = 3,
+        workers: int | None = None,
+        time_limit: float | None = None,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> list[str] | None:
+        """Procura, de forma exata, um ciclo Hamiltoniano no grafo, distribuindo a busca entre processos.
+
+        A busca é dividida pelos primeiros "prefix_length" vértices do caminho,
+        quanto maior o prefixo, mais subproblemas (e menores) são criados.
+
+        Args:
+            prefix_length (int, optional): A quantidade de vértices, além do início, que define cada subproblema.
+            workers (int | None, optional): A quantidade de processos, por padrão, a quantidade de CPUs.
+            time_limit (float | None, optional): O tempo limite da busca, em segundos.
+            progress (Callable[[int, int], None] | None, optional): Chamada com os subproblemas concluídos e o total.
+
+        Returns:
+            list[str] | None: Os rótulos dos vértices do ciclo, o primeiro repetido no final, ou None caso não exista.
+
+        Examples:
+            Hamiltonian(...).find_hamiltonian_cycle()
+
+            Hamiltonian(...).find_hamiltonian_cycle(4, 8, 300, lambda done, total: print(done, "/", total))
+            ...
+        """
+        return ParallelHamiltonianSearch(self.graph, prefix_length, workers, time_limit, progress).apply()
@@ -0,0 +1,187 @@
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from math import inf
+
+from FrozenGraph import FrozenGraph
+from Graph import Graph
+
+
+@dataclass
+class KShortestPaths:
+    """Responsável por calcular os "k" caminhos mínimos, sem vértices repetidos, entre dois vértices (Yen).
+
+    Cada novo caminho desvia de um caminho já aceito a partir de um de seus
+    vértices (desvio), mantendo o trecho anterior (raiz). As buscas dos
+    desvios ignoram vértices e arcos mascarados, sem alterar o grafo, e são
+    guiadas pela árvore de caminhos mínimos até o destino, calculada uma
+    única vez, que também fornece o desvio diretamente quando ele não passa
+    por nenhum vértice mascarado.
+    """
+
+    graph: Graph | FrozenGraph = field(repr=False)
+    source: str
+    destiny: str
+    k: int = 10
+    frozen: FrozenGraph = field(repr=False, init=False)
+    # Custo até o destino e próximo vértice, na árvore de caminhos mínimos invertida.
+    remaining: list[float] = field(repr=False, init=False)
+    following: list[int] = field(repr=False, init=False)
+
+    def __post_init__(self):
+        if self.k < 1:
+            raise ValueError("A quantidade de caminhos deve ser positiva.")
+        self.frozen = self.graph.freeze()
+        if any(weight < 0 for weight in self.frozen.weights):
+            raise ValueError("O grafo não pode possuir custos negativos.")
+
+    def get_reverse_tree(self, destiny: int):
+        """Calcula a árvore de caminhos mínimos de todos os vértices até o destino, pelos arcos invertidos.
+
+        Args:
+            destiny (int): O índice do vértice de destino.
+        """
+        graph = self.frozen
+        n = graph.vertex_count
+        incoming = [[] for _ in range(n)]
+        for i, j, weight in graph.iter_edges():
+            incoming[j].append((i, weight))
+        remaining = [inf] * n
+        following = [-1] * n
+        remaining[destiny] = 0
+        heap = [(0, destiny)]
+        while heap:
+            cost, vertex = heappop(heap)
+            if cost > remaining[vertex]:
+                continue
+            for neighbor, weight in incoming[vertex]:
+                new_cost = cost + weight
+                if new_cost < remaining[neighbor]:
+                    remaining[neighbor] = new_cost
+                    following[neighbor] = vertex
+                    heappush(heap, (new_cost, neighbor))
+        self.remaining, self.following = remaining, following
+
+    def get_spur_path(
+        self, spur: int, destiny: int, blocked: bytearray, blocked_next: set[int]
+    ) -> tuple[float, list[int]] | None:
+        """Busca o caminho mínimo, a partir do vértice de desvio, ignorando os vértices e arcos mascarados.
+
+        Args:
+            spur (int): O índice do vértice de desvio.
+            destiny (int): O índice do vértice de destino.
+            blocked (bytearray): Os vértices mascarados, os vértices da raiz.
+            blocked_next (set[int]): Os vizinhos do vértice de desvio que não podem ser o próximo vértice.
+
+        Returns:
+            tuple[float, list[int]] | None: O custo e os índices dos vértices do desvio, ou None caso não exista.
+        """
+        remaining, following = self.remaining, self.following
+        if remaining[spur] == inf:
+            return None
+
+        # Caso o caminho da árvore não passe por nenhum vértice ou arco mascarado, ele é o mínimo.
+        path = [spur]
+        vertex = spur
+        while vertex != destiny:
+            vertex = following[vertex]
+            if blocked[vertex] or (len(path) == 1 and vertex in blocked_next):
+                break
+            path.append(vertex)
+        else:
+            return (remaining[spur], path)
+
+        # Caso contrário, uma busca A*, com o custo até o destino na árvore como estimativa.
+        offsets, targets, weights = self.frozen.offsets, self.frozen.targets, self.frozen.weights
+        distance = {spur: 0}
+        previous = {spur: -1}
+        # Nos empates da estimativa, os vértices mais próximos do destino (maior custo) saem primeiro.
+        heap = [(remaining[spur], 0, spur)]
+        while heap:
+            _, cost, vertex = heappop(heap)
+            cost = -cost
+            if cost > distance[vertex]:
+                continue
+            if vertex == destiny:
+                path = []
+                while vertex != -1:
+                    path.append(vertex)
+                    vertex = previous[vertex]
+                path.reverse()
+                return (cost, path)
+            for position in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = targets[position]
+                if blocked[neighbor] or remaining[neighbor] == inf:
+                    continue
+                if vertex == spur and neighbor in blocked_next:
+                    continue
+                new_cost = cost + weights[position]
+                if new_cost < distance.get(neighbor, inf):
+                    distance[neighbor] = new_cost
+                    previous[neighbor] = vertex
+                    heappush(heap, (new_cost + remaining[neighbor], -new_cost, neighbor))
+        return None
+
+    def apply(self) -> list[tuple[int | float, list[str]]]:
+        """Calcula os "k" caminhos mínimos, em ordem crescente de custo.
+
+        Com a otimização de Lawler, cada caminho só é desviado a partir do
+        vértice onde ele mesmo desviou, pois os desvios anteriores já foram
+        calculados para o caminho de onde ele veio.
+
+        Returns:
+            list[tuple[int | float, list[str]]]: O custo e os rótulos dos vértices de cada caminho, até "k" caminhos.
+
+        Examples:
+            KShortestPaths(graph, "A", "B", 3).apply()
+            ...
+        """
+        graph = self.frozen
+        source = graph.translate_vertex_label_to_index(self.source)
+        destiny = graph.translate_vertex_label_to_index(self.destiny)
+        self.get_reverse_tree(destiny)
+        integral = graph.weights.typecode == "q"
+
+        def get_cost(u: int, v: int) -> int | float:
+            """Retorna o custo do arco entre dois vértices."""
+            return graph.weights[graph.find_edge_position(u, v)]
+
+        first = self.get_spur_path(source, destiny, bytearray(graph.vertex_count), set())
+        if first is None:
+            return []
+        # Os caminhos aceitos, com o índice do vértice de desvio de cada um.
+        accepted = [(first[0], first[1], 0)]
+        candidates = []
+        seen = {tuple(first[1])}
+        blocked = bytearray(graph.vertex_count)
+        while len(accepted) < self.k:
+            _, path, deviation = accepted[-1]
+            root_cost = sum(get_cost(u, v) for u, v in zip(path[:deviation], path[1:deviation + 1]))
+            for i in range(deviation, len(path) - 1):
+                spur = path[i]
+                root = path[:i + 1]
+                # Os arcos já utilizados, a partir da mesma raiz, são mascarados.
+                blocked_next = {
+                    other[i + 1] for _, other, _ in accepted if len(other) > i + 1 and other[:i + 1] == root
+                }
+                for vertex in path[:i]:
+                    blocked[vertex] = 1
+                spur_path = self.get_spur_path(spur, destiny, blocked, blocked_next)
+                for vertex in path[:i]:
+                    blocked[vertex] = 0
+                if spur_path is not None:
+                    candidate = root[:-1] + spur_path[1]
+                    key = tuple(candidate)
+                    # O mesmo caminho pode ser encontrado a partir de desvios diferentes.
+                    if key not in seen:
+                        seen.add(key)
+                        heappush(candidates, (root_cost + spur_path[0], len(candidate), key, i))
+                root_cost += get_cost(spur, path[i + 1])
+            if not candidates:
+                break
+            cost, _, key, deviation = heappop(candidates)
+            accepted.append((cost, list(key), deviation))
+
+        return [
+            (int(cost) if integral else cost, [graph.vertexes[vertex] for vertex in path])
+            for cost, path, _ in accepted
+        ]
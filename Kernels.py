@@ -0,0 +1,371 @@
+from array import array
+from heapq import heappop, heappush
+from math import inf
+from os import environ
+
+# Os laços principais são compilados com o Numba, caso ele esteja instalado,
+# caso contrário, ou com GRAFOS_KERNELS=python, são executados em Python puro.
+try:
+    import numpy
+    from numba import njit
+except ImportError:
+    numpy = njit = None
+
+BACKEND = "numba" if njit is not None and environ.get("GRAFOS_KERNELS", "numba") != "python" else "python"
+
+
+def bfs_levels_kernel(offsets, targets, source, level, visited, queue):
+    """Calcula o nível dos vértices, a partir da origem, pela Busca em Largura.
+
+    Args:
+        offsets: O início dos vizinhos de cada vértice.
+        targets: Os índices dos vizinhos.
+        source: O índice do vértice tomado como ponto de partida.
+        level: O nível dos vértices, preenchido pelo algoritmo.
+        visited: Os vértices descobertos, preenchido pelo algoritmo.
+        queue: A fila, com espaço para todos os vértices.
+    """
+    head, tail = 0, 1
+    queue[0] = source
+    visited[source] = 1
+    while head < tail:
+        vertex = queue[head]
+        head += 1
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[position]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                level[neighbor] = level[vertex] + 1
+                queue[tail] = neighbor
+                tail += 1
+
+
+def dijkstra_kernel(offsets, targets, weights, source, distance, previous, settled, wanted, remaining):
+    """Aplica o algoritmo de Dijkstra, com fila de prioridade.
+
+    Args:
+        offsets: O início dos vizinhos de cada vértice.
+        targets: Os índices dos vizinhos.
+        weights: O custo dos arcos.
+        source: O índice do vértice tomado como ponto de partida.
+        distance: O custo dos vértices, preenchido pelo algoritmo.
+        previous: Os antecessores dos vértices, preenchido pelo algoritmo.
+        settled: Os vértices finalizados, preenchido pelo algoritmo.
+        wanted: Os vértices de destino, a busca é interrompida quando todos forem finalizados.
+        remaining: A quantidade de destinos, negativa caso não existam destinos.
+    """
+    distance[source] = 0
+    heap = [(0.0, source)]
+    while heap:
+        cost, vertex = heappop(heap)
+        if settled[vertex]:
+            continue
+        settled[vertex] = 1
+        if wanted[vertex]:
+            remaining -= 1
+            if remaining == 0:
+                break
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[position]
+            new_cost = cost + weights[position]
+            if new_cost < distance[neighbor]:
+                distance[neighbor] = new_cost
+                previous[neighbor] = vertex
+                heappush(heap, (new_cost, neighbor))
+
+
+def bellman_ford_kernel(offsets, targets, weights, distance, previous) -> bool:
+    """Aplica o algoritmo de Bellman-Ford, interrompendo as iterações quando nenhum custo é atualizado.
+
+    Args:
+        offsets: O início dos vizinhos de cada vértice.
+        targets: Os índices dos vizinhos.
+        weights: O custo dos arcos.
+        distance: O custo dos vértices, com a origem já definida.
+        previous: Os antecessores dos vértices, preenchido pelo algoritmo.
+
+    Returns:
+        bool: Se um ciclo negativo foi encontrado.
+    """
+    n = len(distance)
+    # São feitas, no máximo, "n - 1" iterações e uma última para detectar ciclos negativos.
+    for iteration in range(n):
+        updated = False
+        for u in range(n):
+            if distance[u] == inf:
+                continue
+            for position in range(offsets[u], offsets[u + 1]):
+                v = targets[position]
+                if distance[v] > distance[u] + weights[position]:
+                    distance[v] = distance[u] + weights[position]
+                    previous[v] = u
+                    updated = True
+        if not updated:
+            return False
+    return n > 0
+
+
+def dag_kernel(order, offsets, targets, weights, distance, previous, sign):
+    """Relaxa os arcos de um grafo acíclico, uma única vez, seguindo a ordem topológica.
+
+    Args:
+        order: Os índices dos vértices, em ordem topológica.
+        offsets: O início dos vizinhos de cada vértice.
+        targets: Os índices dos vizinhos.
+        weights: O custo dos arcos.
+        distance: O custo dos vértices, com as origens já definidas.
+        previous: Os antecessores dos vértices, preenchido pelo algoritmo.
+        sign: 1 para os caminhos mínimos, -1 para os caminhos máximos.
+    """
+    for u in order:
+        if distance[u] == inf:
+            continue
+        for position in range(offsets[u], offsets[u + 1]):
+            v = targets[position]
+            new_cost = distance[u] + sign * weights[position]
+            if new_cost < distance[v]:
+                distance[v] = new_cost
+                previous[v] = u
+
+
+def floyd_warshall_kernel(n, distances, successors, row):
+    """Aplica o algoritmo de Floyd-Warshall, sobre as matrizes guardadas linha por linha.
+
+    Args:
+        n: A quantidade de vértices.
+        distances: Os custos, atualizados pelo algoritmo.
+        successors: Os próximos vértices, atualizados pelo algoritmo.
+        row: Espaço para uma cópia da linha do vértice intermediário.
+    """
+    for k in range(n):
+        for j in range(n):
+            row[j] = distances[k * n + j]
+        for i in range(n):
+            base = i * n
+            distance_ik = distances[base + k]
+            if distance_ik == inf:
+                continue
+            successor_ik = successors[base + k]
+            for j in range(n):
+                new_cost = distance_ik + row[j]
+                if distances[base + j] > new_cost:
+                    distances[base + j] = new_cost
+                    successors[base + j] = successor_ik
+
+
+def floyd_warshall_tile_kernel(n, distances, successors, rows, columns, middles):
+    """Atualiza um bloco da matriz de custos, utilizando os vértices intermediários de outro bloco.
+
+    Args:
+        n: A quantidade de vértices.
+        distances: Os custos, atualizados pelo algoritmo.
+        successors: Os próximos vértices, atualizados pelo algoritmo, vazio caso não sejam guardados.
+        rows: O início e o fim das linhas do bloco.
+        columns: O início e o fim das colunas do bloco.
+        middles: O início e o fim dos vértices intermediários.
+    """
+    with_successors = len(successors) > 0
+    for k in range(middles[0], middles[1]):
+        base_k = k * n
+        for i in range(rows[0], rows[1]):
+            base_i = i * n
+            distance_ik = distances[base_i + k]
+            if distance_ik == inf:
+                continue
+            successor_ik = successors[base_i + k] if with_successors else 0
+            for j in range(columns[0], columns[1]):
+                new_cost = distance_ik + distances[base_k + j]
+                if distances[base_i + j] > new_cost:
+                    distances[base_i + j] = new_cost
+                    if with_successors:
+                        successors[base_i + j] = successor_ik
+
+
+if BACKEND == "numba":
+    bfs_levels_kernel = njit(cache=True)(bfs_levels_kernel)
+    dijkstra_kernel = njit(cache=True)(dijkstra_kernel)
+    bellman_ford_kernel = njit(cache=True)(bellman_ford_kernel)
+    dag_kernel = njit(cache=True)(dag_kernel)
+    floyd_warshall_kernel = njit(cache=True)(floyd_warshall_kernel)
+    floyd_warshall_tile_kernel = njit(cache=True)(floyd_warshall_tile_kernel)
+
+
+def as_buffer(values: array | memoryview):
+    """Prepara um vetor para os algoritmos, sem cópias, como um vetor do NumPy caso o Numba seja utilizado.
+
+    Args:
+        values (array | memoryview): O vetor, ou uma visão sobre a memória compartilhada.
+
+    Returns:
+        O próprio vetor, ou uma visão do NumPy sobre a mesma memória.
+    """
+    if BACKEND == "numba":
+        typecode = values.typecode if isinstance(values, array) else values.format
+        return numpy.frombuffer(values, dtype=typecode) if len(values) else numpy.zeros(0, typecode)
+    return values
+
+
+def bfs_levels(offsets: array, targets: array, vertex_count: int, source: int) -> array:
+    """Calcula o nível dos vértices pela Busca em Largura, os vértices não alcançados possuem nível 0.
+
+    Args:
+        offsets (array): O início dos vizinhos de cada vértice.
+        targets (array): Os índices dos vizinhos.
+        vertex_count (int): A quantidade de vértices.
+        source (int): O índice do vértice tomado como ponto de partida.
+
+    Returns:
+        array: O nível dos vértices.
+    """
+    level = array("q", [0]) * vertex_count
+    bfs_levels_kernel(
+        as_buffer(offsets),
+        as_buffer(targets),
+        source,
+        as_buffer(level),
+        as_buffer(array("b", [0]) * vertex_count),
+        as_buffer(array("q", [0]) * vertex_count),
+    )
+    return level
+
+
+def dijkstra(
+    offsets: array, targets: array, weights: array, vertex_count: int, source: int, destinies: set[int] | None = None
+) -> tuple[array, array]:
+    """Aplica o algoritmo de Dijkstra, interrompendo a busca quando todos os destinos forem finalizados.
+
+    Args:
+        offsets (array): O início dos vizinhos de cada vértice.
+        targets (array): Os índices dos vizinhos.
+        weights (array): O custo dos arcos.
+        vertex_count (int): A quantidade de vértices.
+        source (int): O índice do vértice tomado como ponto de partida.
+        destinies (set[int] | None, optional): Os índices dos vértices de destino.
+
+    Returns:
+        tuple[array, array]: O custo e os antecessores dos vértices.
+    """
+    distance = array("d", [inf]) * vertex_count
+    previous = array("q", [-1]) * vertex_count
+    wanted = array("b", [0]) * vertex_count
+    for destiny in destinies or ():
+        wanted[destiny] = 1
+    dijkstra_kernel(
+        as_buffer(offsets),
+        as_buffer(targets),
+        as_buffer(weights),
+        source,
+        as_buffer(distance),
+        as_buffer(previous),
+        as_buffer(array("b", [0]) * vertex_count),
+        as_buffer(wanted),
+        len(destinies) if destinies is not None else -1,
+    )
+    return distance, previous
+
+
+def bellman_ford(
+    offsets: array, targets: array, weights: array, vertex_count: int, source: int
+) -> tuple[array, array, bool]:
+    """Aplica o algoritmo de Bellman-Ford.
+
+    Args:
+        offsets (array): O início dos vizinhos de cada vértice.
+        targets (array): Os índices dos vizinhos.
+        weights (array): O custo dos arcos.
+        vertex_count (int): A quantidade de vértices.
+        source (int): O índice do vértice tomado como ponto de partida.
+
+    Returns:
+        tuple[array, array, bool]: O custo e os antecessores dos vértices e se um ciclo negativo foi encontrado.
+    """
+    distance = array("d", [inf]) * vertex_count
+    previous = array("q", [-1]) * vertex_count
+    distance[source] = 0
+    negative_cycle = bellman_ford_kernel(
+        as_buffer(offsets), as_buffer(targets), as_buffer(weights), as_buffer(distance), as_buffer(previous)
+    )
+    return distance, previous, bool(negative_cycle)
+
+
+def dag_paths(
+    order: array,
+    offsets: array,
+    targets: array,
+    weights: array,
+    vertex_count: int,
+    sources: list[int],
+    longest: bool = False,
+) -> tuple[array, array]:
+    """Calcula os caminhos mínimos, ou máximos, em um grafo acíclico, em tempo linear.
+
+    Args:
+        order (array): Os índices dos vértices, em ordem topológica.
+        offsets (array): O início dos vizinhos de cada vértice.
+        targets (array): Os índices dos vizinhos.
+        weights (array): O custo dos arcos.
+        vertex_count (int): A quantidade de vértices.
+        sources (list[int]): Os índices dos vértices tomados como ponto de partida.
+        longest (bool, optional): Se os caminhos máximos devem ser calculados.
+
+    Returns:
+        tuple[array, array]: O custo, menos infinito caso não seja alcançável nos caminhos máximos, e os antecessores dos vértices.
+    """
+    distance = array("d", [inf]) * vertex_count
+    previous = array("q", [-1]) * vertex_count
+    for source in sources:
+        distance[source] = 0
+    # Os caminhos máximos são os caminhos mínimos com os custos negados.
+    dag_kernel(
+        as_buffer(order),
+        as_buffer(offsets),
+        as_buffer(targets),
+        as_buffer(weights),
+        as_buffer(distance),
+        as_buffer(previous),
+        -1 if longest else 1,
+    )
+    if longest:
+        distance = array("d", (0.0 - cost for cost in distance))
+    return distance, previous
+
+
+def floyd_warshall(vertex_count: int, distances: array, successors: array):
+    """Aplica o algoritmo de Floyd-Warshall, atualizando as matrizes fornecidas.
+
+    Args:
+        vertex_count (int): A quantidade de vértices.
+        distances (array): Os custos, linha por linha.
+        successors (array): Os próximos vértices, linha por linha.
+    """
+    floyd_warshall_kernel(
+        vertex_count, as_buffer(distances), as_buffer(successors), as_buffer(array("d", [0]) * vertex_count)
+    )
+
+
+def floyd_warshall_tile(
+    n: int,
+    distances: array | memoryview,
+    successors: array | memoryview | None,
+    rows: tuple[int, int],
+    columns: tuple[int, int],
+    middles: tuple[int, int],
+):
+    """Atualiza um bloco do Floyd-Warshall em blocos, diretamente sobre as matrizes fornecidas.
+
+    Args:
+        n (int): A quantidade de vértices.
+        distances (array | memoryview): Os custos, linha por linha.
+        successors (array | memoryview | None): Os próximos vértices, linha por linha, caso sejam guardados.
+        rows (tuple[int, int]): O início e o fim das linhas do bloco.
+        columns (tuple[int, int]): O início e o fim das colunas do bloco.
+        middles (tuple[int, int]): O início e o fim dos vértices intermediários.
+    """
+    floyd_warshall_tile_kernel(
+        n,
+        as_buffer(distances),
+        as_buffer(successors if successors is not None else array("q")),
+        rows,
+        columns,
+        middles,
+    )
@@ -0,0 +1,250 @@
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from os import cpu_count
+from time import time
+
+from FrozenGraph import FrozenGraph
+from Graph import Graph
+
+# Sinal de cancelamento, compartilhado entre os processos.
+cancel_event = None
+
+# Quantidade de passos entre as verificações de cancelamento e do tempo limite.
+CHECK_INTERVAL = 1024
+
+
+def set_cancel_event(event):
+    """Guarda o sinal de cancelamento no processo atual.
+
+    Args:
+        event: O sinal de cancelamento, compartilhado entre os processos.
+    """
+    global cancel_event
+    cancel_event = event
+
+
+def get_candidates(masks: list[int], vertex: int, visited: int) -> list[int]:
+    """Retorna os vizinhos não visitados de um vértice, os mais restritos por último.
+
+    Args:
+        masks (list[int]): Os vizinhos de cada vértice, em bits.
+        vertex (int): O índice do vértice.
+        visited (int): Os vértices visitados, em bits.
+
+    Returns:
+        list[int]: Os índices dos vizinhos, na ordem inversa em que devem ser visitados.
+    """
+    options = masks[vertex] & ~visited
+    candidates = []
+    while options:
+        lowest = options & -options
+        candidates.append(lowest.bit_length() - 1)
+        options ^= lowest
+    # Os vizinhos com menos saídas são visitados primeiro, ou seja, retirados do final.
+    candidates.sort(key=lambda u: (masks[u] & ~visited).bit_count(), reverse=True)
+    return candidates
+
+
+def is_feasible(masks: list[int], visited: int, full: int, start: int, end: int) -> bool:
+    """Verifica se o caminho atual ainda pode ser completado em um ciclo.
+
+    Cada vértice não visitado precisa de, no mínimo, dois vizinhos disponíveis
+    (não visitados ou nas pontas do caminho) e o início precisa de um vizinho livre.
+
+    Args:
+        masks (list[int]): Os vizinhos de cada vértice, em bits.
+        visited (int): Os vértices visitados, em bits.
+        full (int): Todos os vértices, em bits.
+        start (int): O índice do primeiro vértice do caminho.
+        end (int): O índice do último vértice do caminho.
+
+    Returns:
+        bool: Se o caminho ainda pode ser completado.
+    """
+    free = full & ~visited
+    if not masks[start] & free:
+        return False
+    available = free | (1 << start) | (1 << end)
+    remaining = free
+    while remaining:
+        lowest = remaining & -remaining
+        if (masks[lowest.bit_length() - 1] & available).bit_count() < 2:
+            return False
+        remaining ^= lowest
+    return True
+
+
+def search_prefix(masks: list[int], prefix: list[int], deadline: float | None) -> tuple[list[int] | None, bool]:
+    """Procura, com backtracking, um ciclo Hamiltoniano que comece pelo caminho fornecido.
+
+    Args:
+        masks (list[int]): Os vizinhos de cada vértice, em bits.
+        prefix (list[int]): Os índices dos primeiros vértices do caminho.
+        deadline (float | None): O horário limite da busca, caso exista.
+
+    Returns:
+        tuple[list[int] | None, bool]: O ciclo, caso encontrado, e se a busca foi concluída.
+    """
+    n = len(masks)
+    full = (1 << n) - 1
+    start = prefix[0]
+    path = list(prefix)
+    visited = 0
+    for vertex in path:
+        visited |= 1 << vertex
+    if visited == full:
+        return (path + [start], True) if masks[path[-1]] >> start & 1 else (None, True)
+    if not is_feasible(masks, visited, full, start, path[-1]):
+        return (None, True)
+
+    # Cada nível da pilha guarda os vizinhos ainda não tentados do último vértice do caminho.
+    stack = [get_candidates(masks, path[-1], visited)]
+    steps = 0
+    while stack:
+        steps += 1
+        if steps % CHECK_INTERVAL == 0:
+            if (cancel_event is not None and cancel_event.is_set()) or (deadline is not None and time() > deadline):
+                return (None, False)
+        candidates = stack[-1]
+        if not candidates:
+            # Retorna um nível, desfazendo o último vértice do caminho.
+            stack.pop()
+            if stack:
+                visited ^= 1 << path.pop()
+            continue
+        vertex = candidates.pop()
+        visited |= 1 << vertex
+        path.append(vertex)
+        if visited == full:
+            # Verifica se é possível fechar o ciclo.
+            if masks[vertex] >> start & 1:
+                return (path + [start], True)
+        elif is_feasible(masks, visited, full, start, vertex):
+            stack.append(get_candidates(masks, vertex, visited))
+            continue
+        visited ^= 1 << path.pop()
+    return (None, True)
+
+
+@dataclass
+class ParallelHamiltonianSearch:
+    """Responsável pela busca exata de um ciclo Hamiltoniano, distribuída entre processos.
+
+    A árvore de busca é dividida pelos primeiros vértices do caminho, cada
+    prefixo é um subproblema independente e, assim que um processo encontra
+    um ciclo, os demais são cancelados.
+    """
+
+    graph: Graph | FrozenGraph = field(repr=False)
+    prefix_length: int = 3
+    workers: int | None = None
+    time_limit: float | None = None
+    progress: Callable[[int, int], None] | None = field(repr=False, default=None)
+
+    def get_prefixes(self, masks: list[int]) -> list[list[int]]:
+        """Gera os caminhos simples, a partir do vértice 0, com "prefix_length" vértices além do início.
+
+        Como todo ciclo passa pelo vértice 0, somente os caminhos que começam nele são necessários.
+
+        Args:
+            masks (list[int]): Os vizinhos de cada vértice, em bits.
+
+        Returns:
+            list[list[int]]: Os caminhos, ou seja, os subproblemas.
+        """
+        n = len(masks)
+        length = min(self.prefix_length, n - 1)
+        prefixes = []
+        stack = [[0]]
+        while stack:
+            path = stack.pop()
+            if len(path) == length + 1:
+                prefixes.append(path)
+                continue
+            visited = 0
+            for vertex in path:
+                visited |= 1 << vertex
+            # Os vizinhos mais restritos são empilhados por último, ou seja, expandidos primeiro.
+            for vertex in get_candidates(masks, path[-1], visited):
+                stack.append(path + [vertex])
+        return prefixes
+
+    def report(self, completed: int, total: int):
+        """Informa o progresso da busca, caso exista um observador.
+
+        Args:
+            completed (int): A quantidade de subproblemas concluídos.
+            total (int): A quantidade de subproblemas.
+        """
+        if self.progress is not None:
+            self.progress(completed, total)
+
+    def apply(self) -> list[str] | None:
+        """Procura um ciclo Hamiltoniano, considerando somente os arcos não-direcionados.
+
+        Returns:
+            list[str] | None: Os rótulos dos vértices do ciclo, o primeiro repetido no final, ou None caso não exista.
+
+        Raises:
+            TimeoutError: Caso o tempo limite seja atingido antes da busca ser concluída.
+
+        Examples:
+            ParallelHamiltonianSearch(...).apply()
+
+            ParallelHamiltonianSearch(..., prefix_length=4, workers=8, time_limit=300).apply()
+            ...
+        """
+        if self.prefix_length < 1:
+            raise ValueError("O tamanho dos prefixos deve ser positivo.")
+        graph = self.graph.freeze()
+        n = graph.vertex_count
+        if n < 3:
+            return None
+        masks = [0] * n
+        for i, neighbors in enumerate(graph.get_adjacency_indexes(True)):
+            for j in neighbors:
+                if i != j:
+                    masks[i] |= 1 << j
+        deadline = time() + self.time_limit if self.time_limit is not None else None
+
+        prefixes = self.get_prefixes(masks)
+        total = len(prefixes)
+        completed = 0
+        self.report(completed, total)
+        workers = self.workers or cpu_count() or 1
+        cycle = None
+        if workers == 1 or total <= 1:
+            for prefix in prefixes:
+                cycle, finished = search_prefix(masks, prefix, deadline)
+                if not finished:
+                    raise TimeoutError("O tempo limite foi atingido sem que a busca fosse concluída.")
+                completed += 1
+                self.report(completed, total)
+                if cycle is not None:
+                    break
+        else:
+            context = get_context()
+            event = context.Event()
+            executor = ProcessPoolExecutor(workers, context, set_cancel_event, (event,))
+            try:
+                pending = {executor.submit(search_prefix, masks, prefix, deadline) for prefix in prefixes}
+                while pending and cycle is None:
+                    timeout = max(0.0, deadline - time()) if deadline is not None else None
+                    done, pending = wait(pending, timeout, FIRST_COMPLETED)
+                    if not done:
+                        raise TimeoutError("O tempo limite foi atingido sem que a busca fosse concluída.")
+                    # Os ciclos encontrados são tratados antes das buscas interrompidas.
+                    for result, finished in sorted((future.result() for future in done), key=lambda r: r[0] is None):
+                        if not finished and cycle is None:
+                            raise TimeoutError("O tempo limite foi atingido sem que a busca fosse concluída.")
+                        completed += 1
+                        self.report(completed, total)
+                        if result is not None:
+                            cycle = result
+            finally:
+                # Cancela os subproblemas restantes e interrompe os que estão em execução.
+                event.set()
+                executor.shutdown(wait=True, cancel_futures=True)
+        return [graph.vertexes[vertex] for vertex in cycle] if cycle is not None else None
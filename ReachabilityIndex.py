@@ -0,0 +1,394 @@
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from random import Random
+from sys import getsizeof
+
+from FrozenGraph import FrozenGraph
+from Graph import Graph
+
+
+@dataclass(frozen=True, slots=True)
+class ReachabilityIndex:
+    """Representa um índice de alcançabilidade, respondendo se existe um caminho entre dois vértices.
+
+    Os componentes fortemente conexos são condensados em um grafo acíclico
+    (DAG), pois todos os vértices de um componente alcançam os mesmos
+    vértices. Para cada componente é guardado um conjunto de bits com os
+    componentes alcançados (fecho transitivo), calculado em ordem topológica
+    reversa, e as consultas são feitas em O(1). Caso o fecho ultrapasse o
+    limite de memória, cada componente recebe intervalos de pós-ordem (GRAIL),
+    que descartam a maioria das consultas negativas sem nenhuma busca.
+    """
+
+    vertexes: tuple[str, ...]
+    index: dict[str, int] = field(repr=False)
+    component: array = field(repr=False)
+    member_offsets: array = field(repr=False)
+    members: array = field(repr=False)
+    dag_offsets: array = field(repr=False)
+    dag_targets: array = field(repr=False)
+    method: str
+    closure: tuple[int, ...] | None = field(repr=False, default=None)
+    labels: array | None = field(repr=False, default=None)
+    label_count: int = 0
+
+    @classmethod
+    def build(
+        cls, graph: Graph | FrozenGraph, memory_limit: int = 1 << 28, method: str = "auto", label_count: int = 3
+    ) -> "ReachabilityIndex":
+        """Cria o índice de alcançabilidade do grafo, seguindo a direção dos arcos.
+
+        Args:
+            graph (Graph | FrozenGraph): O grafo.
+            memory_limit (int, optional): A quantidade máxima de bytes do fecho transitivo, no modo "auto".
+            method (str, optional): "auto", "bitset" (fecho transitivo) ou "interval" (intervalos de pós-ordem).
+            label_count (int, optional): A quantidade de intervalos por componente, no modo "interval".
+
+        Returns:
+            ReachabilityIndex: O índice de alcançabilidade.
+
+        Examples:
+            ReachabilityIndex.build(graph)
+
+            ReachabilityIndex.build(graph, memory_limit=1 << 20)
+            ...
+        """
+        if method not in ("auto", "bitset", "interval"):
+            raise ValueError("O método deve ser: auto, bitset ou interval.")
+        if label_count < 1:
+            raise ValueError("A quantidade de intervalos deve ser positiva.")
+        frozen = graph.freeze()
+        n = frozen.vertex_count
+        offsets, targets = frozen.offsets, frozen.targets
+
+        # Algoritmo de Tarjan, iterativo, os componentes são numerados em
+        # ordem topológica reversa, ou seja, um componente só alcança
+        # componentes de número menor.
+        component = array("q", [-1]) * n
+        order = [-1] * n
+        low = [0] * n
+        on_stack = bytearray(n)
+        stack = []
+        members = array("q")
+        member_offsets = array("q", [0])
+        counter = 0
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            calls = [(root, offsets[root])]
+            while calls:
+                vertex, position = calls[-1]
+                if position < offsets[vertex + 1]:
+                    calls[-1] = (vertex, position + 1)
+                    neighbor = targets[position]
+                    if order[neighbor] == -1:
+                        order[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        calls.append((neighbor, offsets[neighbor]))
+                    elif on_stack[neighbor] and order[neighbor] < low[vertex]:
+                        low[vertex] = order[neighbor]
+                    continue
+                calls.pop()
+                if calls and low[vertex] < low[calls[-1][0]]:
+                    low[calls[-1][0]] = low[vertex]
+                if low[vertex] == order[vertex]:
+                    # O vértice é a raiz de um componente, que é desempilhado.
+                    number = len(member_offsets) - 1
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component[member] = number
+                        members.append(member)
+                        if member == vertex:
+                            break
+                    member_offsets.append(len(members))
+
+        # Grafo condensado, sem arcos repetidos e sem laços.
+        component_count = len(member_offsets) - 1
+        dag_offsets = array("q", [0])
+        dag_targets = array("q")
+        for c in range(component_count):
+            successors = set()
+            for position in range(member_offsets[c], member_offsets[c + 1]):
+                vertex = members[position]
+                for arc in range(offsets[vertex], offsets[vertex + 1]):
+                    successors.add(component[targets[arc]])
+            successors.discard(c)
+            dag_targets.extend(sorted(successors))
+            dag_offsets.append(len(dag_targets))
+
+        arguments = (frozen.vertexes, frozen.index, component, member_offsets, members, dag_offsets, dag_targets)
+        if method != "interval":
+            closure = cls.get_closure(dag_offsets, dag_targets, memory_limit if method == "auto" else None)
+            if closure is not None:
+                return cls(*arguments, "bitset", closure)
+        labels = cls.get_interval_labels(dag_offsets, dag_targets, label_count)
+        return cls(*arguments, "interval", None, labels, label_count)
+
+    @staticmethod
+    def get_closure(dag_offsets: array, dag_targets: array, memory_limit: int | None) -> tuple[int, ...] | None:
+        """Calcula o fecho transitivo do grafo condensado, em ordem topológica reversa.
+
+        Args:
+            dag_offsets (array): O início dos sucessores de cada componente.
+            dag_targets (array): Os sucessores dos componentes.
+            memory_limit (int | None): A quantidade máxima de bytes, sem limite caso seja None.
+
+        Returns:
+            tuple[int, ...] | None: Os componentes alcançados por cada componente, um bit por componente, ou None caso o limite seja ultrapassado.
+        """
+        closure = []
+        size = 0
+        for c in range(len(dag_offsets) - 1):
+            # Os sucessores possuem número menor, logo, já foram calculados.
+            bits = 1 << c
+            for position in range(dag_offsets[c], dag_offsets[c + 1]):
+                bits |= closure[dag_targets[position]]
+            closure.append(bits)
+            size += getsizeof(bits)
+            if memory_limit is not None and size > memory_limit:
+                return None
+        return tuple(closure)
+
+    @staticmethod
+    def get_interval_labels(dag_offsets: array, dag_targets: array, label_count: int) -> array:
+        """Calcula os intervalos de pós-ordem dos componentes, com buscas em profundidade aleatórias.
+
+        Para cada busca, o intervalo de um componente vai do menor número de
+        pós-ordem entre os componentes alcançados até o seu próprio número,
+        sendo assim, o intervalo de um componente alcançado está contido no
+        intervalo de quem o alcança.
+
+        Args:
+            dag_offsets (array): O início dos sucessores de cada componente.
+            dag_targets (array): Os sucessores dos componentes.
+            label_count (int): A quantidade de intervalos por componente.
+
+        Returns:
+            array: O início e o fim dos intervalos, "label_count" pares por componente.
+        """
+        component_count = len(dag_offsets) - 1
+        has_predecessor = bytearray(component_count)
+        for target in dag_targets:
+            has_predecessor[target] = 1
+        roots = [c for c in range(component_count) if not has_predecessor[c]]
+        labels = array("q", [0]) * (2 * label_count * component_count)
+        random = Random(0)
+        for label in range(label_count):
+            visited = bytearray(component_count)
+            begin = [0] * component_count
+            counter = 0
+            random.shuffle(roots)
+            calls = []
+
+            def visit(c: int):
+                """Marca um componente como visitado, sorteando a ordem dos sucessores."""
+                visited[c] = 1
+                begin[c] = component_count
+                successors = dag_targets[dag_offsets[c]:dag_offsets[c + 1]].tolist()
+                random.shuffle(successors)
+                calls.append((c, successors))
+
+            for root in roots:
+                visit(root)
+                while calls:
+                    c, successors = calls[-1]
+                    if successors:
+                        successor = successors.pop()
+                        if visited[successor]:
+                            begin[c] = min(begin[c], begin[successor])
+                        else:
+                            visit(successor)
+                        continue
+                    calls.pop()
+                    begin[c] = min(begin[c], counter)
+                    base = 2 * (c * label_count + label)
+                    labels[base], labels[base + 1] = begin[c], counter
+                    counter += 1
+                    if calls:
+                        parent = calls[-1][0]
+                        begin[parent] = min(begin[parent], begin[c])
+        return labels
+
+    @property
+    def vertex_count(self) -> int:
+        """A quantidade de vértices do grafo."""
+        return len(self.vertexes)
+
+    @property
+    def component_count(self) -> int:
+        """A quantidade de componentes fortemente conexos do grafo."""
+        return len(self.member_offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """A quantidade de bytes utilizada pelo índice, sem contar os rótulos dos vértices."""
+        size = sum(
+            getsizeof(values)
+            for values in (self.component, self.member_offsets, self.members, self.dag_offsets, self.dag_targets)
+        )
+        if self.closure is not None:
+            size += getsizeof(self.closure) + sum(getsizeof(bits) for bits in self.closure)
+        if self.labels is not None:
+            size += getsizeof(self.labels)
+        return size
+
+    def get_vertex_index(self, vertex: str) -> int:
+        """Transforma o rótulo de um vértice para o índice.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser buscado.
+
+        Returns:
+            int: O índice do vértice.
+        """
+        if vertex in self.index:
+            return self.index[vertex]
+        raise ValueError("O grafo não possui o vértice: " + vertex)
+
+    def may_reach(self, source: int, destiny: int) -> bool:
+        """Verifica, pelos intervalos, se um componente pode alcançar outro.
+
+        Args:
+            source (int): O componente de origem.
+            destiny (int): O componente de destino.
+
+        Returns:
+            bool: False caso, com certeza, o destino não seja alcançado.
+        """
+        labels, base_source, base_destiny = self.labels, 2 * source * self.label_count, 2 * destiny * self.label_count
+        for offset in range(0, 2 * self.label_count, 2):
+            if labels[base_destiny + offset] < labels[base_source + offset]:
+                return False
+            if labels[base_destiny + offset + 1] > labels[base_source + offset + 1]:
+                return False
+        return True
+
+    def reach_component(self, source: int, destiny: int) -> bool:
+        """Verifica se um componente alcança outro.
+
+        Args:
+            source (int): O componente de origem.
+            destiny (int): O componente de destino.
+
+        Returns:
+            bool: Se o destino é alcançado.
+        """
+        if self.closure is not None:
+            return (self.closure[source] >> destiny) & 1 == 1
+        if source == destiny:
+            return True
+        # Componentes de número menor ou igual ao destino nunca o alcançam.
+        if source < destiny or not self.may_reach(source, destiny):
+            return False
+        dag_offsets, dag_targets = self.dag_offsets, self.dag_targets
+        visited = {source}
+        stack = [source]
+        while stack:
+            c = stack.pop()
+            for position in range(dag_offsets[c], dag_offsets[c + 1]):
+                successor = dag_targets[position]
+                if successor == destiny:
+                    return True
+                if successor not in visited and successor > destiny and self.may_reach(successor, destiny):
+                    visited.add(successor)
+                    stack.append(successor)
+        return False
+
+    def is_reachable(self, source: str, destiny: str) -> bool:
+        """Verifica se existe um caminho, seguindo a direção dos arcos, entre dois vértices.
+
+        Todo vértice alcança a si mesmo.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+
+        Returns:
+            bool: Se o destino é alcançado a partir da origem.
+
+        Examples:
+            ReachabilityIndex.build(graph).is_reachable("A", "B")
+            ...
+        """
+        component = self.component
+        return self.reach_component(
+            component[self.get_vertex_index(source)], component[self.get_vertex_index(destiny)]
+        )
+
+    def iter_reachable_components(self, sources: tuple[str, ...]) -> Iterator[int]:
+        """Percorre os componentes alcançados a partir de um conjunto de vértices.
+
+        Args:
+            sources (tuple[str, ...]): Os rótulos dos vértices tomados como ponto de partida.
+
+        Yields:
+            int: O número de cada componente alcançado.
+        """
+        starts = {self.component[self.get_vertex_index(source)] for source in sources}
+        if self.closure is not None:
+            bits = 0
+            for c in starts:
+                bits |= self.closure[c]
+            while bits:
+                lowest = bits & -bits
+                yield lowest.bit_length() - 1
+                bits ^= lowest
+            return
+        # Sem o fecho transitivo, uma única busca no grafo condensado, a partir de todas as origens.
+        dag_offsets, dag_targets = self.dag_offsets, self.dag_targets
+        visited = bytearray(self.component_count)
+        stack = list(starts)
+        for c in stack:
+            visited[c] = 1
+        while stack:
+            c = stack.pop()
+            yield c
+            for position in range(dag_offsets[c], dag_offsets[c + 1]):
+                successor = dag_targets[position]
+                if not visited[successor]:
+                    visited[successor] = 1
+                    stack.append(successor)
+
+    def get_reachable_vertexes(self, sources: tuple[str, ...] | str) -> list[str]:
+        """Retorna todos os vértices alcançados a partir de um ou mais vértices.
+
+        Args:
+            sources (tuple[str, ...] | str): Os rótulos dos vértices tomados como ponto de partida.
+
+        Returns:
+            list[str]: Os rótulos dos vértices alcançados, em ordem crescente, incluindo as origens.
+
+        Examples:
+            ReachabilityIndex.build(graph).get_reachable_vertexes("A")
+
+            ReachabilityIndex.build(graph).get_reachable_vertexes(("A", "B"))
+            ...
+        """
+        if isinstance(sources, str):
+            sources = (sources,)
+        member_offsets, members, vertexes = self.member_offsets, self.members, self.vertexes
+        return sorted(
+            vertexes[members[position]]
+            for c in self.iter_reachable_components(sources)
+            for position in range(member_offsets[c], member_offsets[c + 1])
+        )
+
+    def get_reachable_count(self, source: str) -> int:
+        """Retorna a quantidade de vértices alcançados a partir de um vértice, incluindo ele mesmo.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Returns:
+            int: A quantidade de vértices alcançados.
+        """
+        member_offsets = self.member_offsets
+        return sum(member_offsets[c + 1] - member_offsets[c] for c in self.iter_reachable_components((source,)))
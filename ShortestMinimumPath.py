@@ -1,7 +1,15 @@
-from copy import copy
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from heapq import heappop, heappush
 
+from AllPairsShortestPathResult import AllPairsShortestPathResult
+from BlockedFloydWarshall import BlockedFloydWarshall
+from DistanceMatrixFile import DistanceMatrixFile
 from Graph import Graph
+from KShortestPaths import KShortestPaths
+from Kernels import bellman_ford, dag_paths, dijkstra, floyd_warshall
+from ShortestPathResult import ShortestPathResult
 
 
 @dataclass
@@ -25,57 +33,98 @@ class ShortestMinimumPath:
             ShortestMinimumPath(...).apply_dijkstra_algorithm("1")
             ...
         """
+        graph = self.graph.freeze()
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        vertexes = graph.vertexes
         # Inicializa o custo dos vértices.
-        distance = [float("inf")] * self.graph.vertex_count
-        # Inicializa os vértices antecessores.
-        previous = dict.fromkeys(self.graph.vertexes, "")
+        distance = [float("inf")] * graph.vertex_count
+        # Inicializa os vértices antecessores, -1 indica nenhum antecessor.
+        previous = [-1] * graph.vertex_count
         # Indica o caminho percorrido pelo algoritmo.
         path = []
         # Indica os vértices a serem visitados.
-        queue = copy(self.graph.vertexes)
+        queue = list(range(graph.vertex_count))
 
         # Define o custo do vértice do ponto de partida.
-        distance[self.graph.translate_vertex_label_to_index(source)] = 0
+        distance[graph.translate_vertex_label_to_index(source)] = 0
 
         # Percorre todos os vértices do grafo.
         while queue:
             # Pega o vértice, que não foi visitado, com o menor custo.
-            remaining_cost = [
-                cost 
-                for vertex, cost in enumerate(distance) 
-                if self.graph.translate_vertex_index_to_label(vertex) in queue
-            ]
-            next_vertex = queue.pop(remaining_cost.index(min(remaining_cost)))
-            next_vertex_index = self.graph.translate_vertex_label_to_index(next_vertex)
+            next_vertex = queue.pop(min(range(len(queue)), key=lambda position: distance[queue[position]]))
 
             # Adiciona ao caminho percorrido.
-            if distance[next_vertex_index] != float("inf"):
-                path.append(next_vertex)
+            if distance[next_vertex] != float("inf"):
+                path.append(vertexes[next_vertex])
             
             # Pega todos os seus vizinhos e atualiza o custo e os antecessores.
-            for neighbor_index, neighbor in enumerate(self.graph.vertexes):
-                if self.graph.contain_directed_edge((next_vertex, neighbor)):
-                    # O novo custo, desde a origem, do vértice.
-                    new_cost = distance[next_vertex_index] + self.graph.get_edge_weight((next_vertex, neighbor))
-                    # Atualiza o custo e o antecessor se for menor.
-                    if new_cost < distance[neighbor_index]:
-                        distance[neighbor_index] = new_cost
-                        previous[neighbor] = next_vertex
-
-        # Organiza o caminho percorrido pelo algoritmo.
-        organized_path = []
-        for vertex in path:
-            if vertex not in organized_path:
-                organized_path.append(vertex)
+            for position in range(offsets[next_vertex], offsets[next_vertex + 1]):
+                neighbor = targets[position]
+                # O novo custo, desde a origem, do vértice.
+                new_cost = distance[next_vertex] + weights[position]
+                # Atualiza o custo e o antecessor se for menor.
+                if new_cost < distance[neighbor]:
+                    distance[neighbor] = new_cost
+                    previous[neighbor] = next_vertex
+
         return {
             "Custo dos vértices": distance, 
-            "Antecessores": previous, 
+            "Antecessores": {
+                vertex: vertexes[previous[index]] if previous[index] != -1 else ""
+                for index, vertex in enumerate(vertexes)
+            }, 
             "Caminho Percorrido": path
         }
-    
+
+    def iter_dijkstra(self, source: str) -> Iterator[tuple[str, float]]:
+        """Aplica o algoritmo de Dijkstra, gerando os vértices conforme o custo mínimo é definido.
+
+        Os vértices são gerados em ordem crescente de custo, a busca pode ser
+        interrompida a qualquer momento, basta parar a iteração.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Yields:
+            tuple[str, float]: O rótulo do vértice e o seu custo mínimo, desde a origem.
+
+        Examples:
+            next(ShortestMinimumPath(...).iter_dijkstra("A"))
+
+            for vertex, cost in ShortestMinimumPath(...).iter_dijkstra("1"): ...
+        """
+        graph = self.graph.freeze()
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        vertexes = graph.vertexes
+        # Inicializa o custo dos vértices.
+        distance = [float("inf")] * graph.vertex_count
+        # Indica quais vértices já possuem o custo mínimo definido.
+        settled = bytearray(graph.vertex_count)
+        source_index = graph.translate_vertex_label_to_index(source)
+        distance[source_index] = 0
+        # Fila de prioridade, com o custo e o índice dos vértices.
+        heap = [(0, source_index)]
+        while heap:
+            cost, vertex = heappop(heap)
+            # Ignora as entradas desatualizadas da fila.
+            if settled[vertex]:
+                continue
+            settled[vertex] = 1
+            yield (vertexes[vertex], cost)
+            # Atualiza o custo dos vizinhos.
+            for position in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = targets[position]
+                new_cost = cost + weights[position]
+                if new_cost < distance[neighbor]:
+                    distance[neighbor] = new_cost
+                    heappush(heap, (new_cost, neighbor))
+
     def apply_bellman_ford_algorithm(self, source: str) -> dict[str, list[float] | dict[str, str] | str]:
         """Aplica o algoritmo, de Bellman-Ford, de caminho mínimo, no grafo.
 
+        Caso o grafo seja acíclico, os arcos são relaxados uma única vez, em
+        ordem topológica, em tempo linear, mesmo com custos negativos.
+
         Args:
             source (str): O rótulo do vértice tomado como ponto de partida.
 
@@ -88,24 +137,30 @@ class ShortestMinimumPath:
             ShortestMinimumPath(...).apply_bellman_ford_algorithm("1")
             ...
         """
-        
-        def relax(source: str, destiny: str, cost: int):
-            """Aplica a técnica de relaxamento em um arco.
+        graph = self.graph.freeze()
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        vertexes = graph.vertexes
+
+        def relax(order: Iterable[int]) -> bool:
+            """Aplica a técnica de relaxamento em todos os arcos.
 
             Args:
-                source (str): O rótulo do vértice tomado como ponto de partida.
-                destiny (str): O rótulo do vértice tomado como destino.
-                cost (int): O custo do arco.
+                order (Iterable[int]): A ordem dos vértices de origem dos arcos.
+
+            Returns:
+                bool: Se algum custo foi atualizado.
             """
-            # Converte o rótulo dos vértices para o índice.
-            source_index, destiny_index = map(
-                self.graph.translate_vertex_label_to_index, (source, destiny)
-            )
-            # Atualiza o custo e o antecessor, caso seja possível.
-            if distance[destiny_index] > distance[source_index] + cost:
-                distance[destiny_index] = distance[source_index] + cost
-                previous[destiny] = source
-                relaxing_order.append((source, destiny))
+            updated = False
+            for u in order:
+                for position in range(offsets[u], offsets[u + 1]):
+                    v = targets[position]
+                    # Atualiza o custo e o antecessor, caso seja possível.
+                    if distance[v] > distance[u] + weights[position]:
+                        distance[v] = distance[u] + weights[position]
+                        previous[v] = u
+                        relaxing_order.append((vertexes[u], vertexes[v]))
+                        updated = True
+            return updated
 
         def find_cycles() -> bool:
             """Procura por ciclos no grafo.
@@ -113,37 +168,35 @@ class ShortestMinimumPath:
             Returns:
                 bool: Retorna verdadeiro caso exista um ciclo no grafo.
             """
-            # Itera sobre todos os arcos.
-            for u_index, u in enumerate(self.graph.vertexes):
-                for v_index, v in enumerate(self.graph.vertexes):
-                    # Verifica se existe um arco nos vértices 'u' e 'v'.
-                    if self.graph.contain_directed_edge((u, v)):
-                        # Se ainda for possível atualizar um custo, um ciclo existe no grafo.
-                        if distance[v_index] > distance[u_index] + self.graph.get_edge_weight((u, v)):
-                            return True
-            return False
+            # Se ainda for possível atualizar um custo, um ciclo existe no grafo.
+            return any(
+                distance[targets[position]] > distance[u] + weights[position]
+                for u in range(graph.vertex_count)
+                for position in range(offsets[u], offsets[u + 1])
+            )
 
         # Inicializa o custo dos vértices.
-        distance = [float("inf")] * self.graph.vertex_count
-        # Inicializa os vértices antecessores.
-        previous = dict.fromkeys(self.graph.vertexes, "")
+        distance = [float("inf")] * graph.vertex_count
+        # Inicializa os vértices antecessores, -1 indica nenhum antecessor.
+        previous = [-1] * graph.vertex_count
         # Ordem de relaxamento dos arcos.
         relaxing_order = []
 
         # Define o custo do vértice do ponto de partida.
-        distance[self.graph.translate_vertex_label_to_index(source)] = 0
+        distance[graph.translate_vertex_label_to_index(source)] = 0
 
-        # Itera sobre todos os arcos.
-        for _ in range(1, self.graph.vertex_count):
-            for u in self.graph.vertexes:
-                for v in self.graph.vertexes:
-                    # Verifica se existe um arco nos vértices 'u' e 'v'.
-                    if self.graph.contain_directed_edge((u, v)):
-                        # Aplica a técnica de relaxamento no arco.
-                        relax(u, v, self.graph.get_edge_weight((u, v)))
+        topological_order = graph.get_topological_order()
+        if topological_order is not None:
+            # Sem ciclos, cada vértice é finalizado antes dos seus sucessores.
+            relax(topological_order)
+        else:
+            # Relaxa todos os arcos, até que nenhum custo seja atualizado.
+            for _ in range(1, graph.vertex_count):
+                if not relax(range(graph.vertex_count)):
+                    break
 
         # Procura por ciclos no grafo.
-        if find_cycles():
+        if topological_order is None and find_cycles():
             return {
                 "Custo dos vértices": "Nenhum, um ciclo foi encontrado.", 
                 "Antecessores": "Nenhum, um ciclo foi encontrado.",
@@ -152,7 +205,10 @@ class ShortestMinimumPath:
         else:
             return {
                 "Custo dos vértices": distance, 
-                "Antecessores": previous, 
+                "Antecessores": {
+                    vertex: vertexes[previous[index]] if previous[index] != -1 else ""
+                    for index, vertex in enumerate(vertexes)
+                }, 
                 "Ordem de relaxamento": relaxing_order
             }
 
@@ -167,45 +223,292 @@ class ShortestMinimumPath:
             ...
         """
 
+        graph = self.graph.freeze()
+        n = graph.vertex_count
         # Cria a matriz de incidência, por padrão, com custos infinitos.
-        distance = [    # Custos dos arcos.
-            [float("inf") for _ in range(self.graph.vertex_count)]
-            for _ in range(self.graph.vertex_count)
-        ]
-        # Cria a matriz de incidência, por padrão, com antecessores nulos.
-        previous = [    # Antecessores.
-            ["" for _ in range(self.graph.vertex_count)]
-            for _ in range(self.graph.vertex_count)
-        ]
+        distance = [[float("inf")] * n for _ in range(n)]
+        # Cria a matriz de incidência, por padrão, sem antecessores (-1).
+        previous = [[-1] * n for _ in range(n)]
 
         # Atualiza os custos da matriz de incidência.
         # Junto com os antecessores.
-        for i in range(self.graph.vertex_count):
+        for i in range(n):
             distance[i][i] = 0
-            previous[i][i] = self.graph.translate_vertex_index_to_label(i)
-
-        # Percorre todos os arcos do grafo.
-        for (i, j) in self.graph.edges:
-            # Transforma para o rótulo para o índice.
-            i_index, j_index = map(self.graph.translate_vertex_label_to_index, (i, j))
-            # Adiciona o custo do arco ao custo.
-            distance[i_index][j_index] = self.graph.get_edge_weight((i, j))
-            # Adiciona o antecessor do arco.
-            previous[i_index][j_index] = j
+            previous[i][i] = i
+
+        # Percorre todos os arcos do grafo, adicionando o custo e o antecessor do arco.
+        for i, j, weight in graph.iter_edges():
+            distance[i][j] = weight
+            previous[i][j] = j
         
         # Atualiza o custo dos arcos, para menor, se possível, percorrendo "k" vértices.
-        for k in range(self.graph.vertex_count):
-            for i in range(self.graph.vertex_count):
-                for j in range(self.graph.vertex_count):
+        for k in range(n):
+            distance_k = distance[k]
+            for i in range(n):
+                distance_i, previous_i = distance[i], previous[i]
+                for j in range(n):
                     # Verifica se o novo custo é menor que o existente.
-                    if distance[i][j] > distance[i][k] + distance[k][j]:
+                    if distance_i[j] > distance_i[k] + distance_k[j]:
                         # Atualiza o custo para menor.
-                        distance[i][j] = distance[i][k] + distance[k][j]
+                        distance_i[j] = distance_i[k] + distance_k[j]
                         # Atualiza o antecessor.
-                        previous[i][j] = previous[i][k]
+                        previous_i[j] = previous_i[k]
         
         # Retorna o menor custo possível dos arcos e os antecessores.
         return {
             "Custo dos Arcos": distance,
-            "Vértices Antecessores": previous
+            "Vértices Antecessores": [
+                [graph.vertexes[k] if k != -1 else "" for k in row] for row in previous
+            ]
         }
+
+    def get_dijkstra_result(self, source: str, destinies: tuple[str, ...] | None = None) -> ShortestPathResult:
+        """Aplica o algoritmo de Dijkstra, retornando um resultado compacto.
+
+        Caso os destinos sejam fornecidos, a busca é interrompida assim que
+        todos eles forem alcançados, somente os seus custos são definitivos.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destinies (tuple[str, ...] | None, optional): Os rótulos dos vértices de destino.
+
+        Returns:
+            ShortestPathResult: Os custos e os antecessores, os caminhos são montados sob demanda.
+
+        Examples:
+            ShortestMinimumPath(...).get_dijkstra_result("A").path_to("B")
+            ...
+        """
+        graph = self.graph.freeze()
+        source_index = graph.translate_vertex_label_to_index(source)
+        # Destinos que, ao serem finalizados, interrompem a busca.
+        remaining = None
+        if destinies is not None:
+            remaining = {graph.translate_vertex_label_to_index(destiny) for destiny in destinies}
+        # O laço principal é executado pelo núcleo compilado, caso disponível.
+        distance, previous = dijkstra(
+            graph.offsets, graph.targets, graph.weights, graph.vertex_count, source_index, remaining
+        )
+        return ShortestPathResult(
+            graph.vertexes, graph.index, source, distance, previous, graph.weights.typecode == "q"
+        )
+
+    def get_bellman_ford_result(self, source: str) -> ShortestPathResult:
+        """Aplica o algoritmo de Bellman-Ford, retornando um resultado compacto.
+
+        As iterações são interrompidas assim que nenhum custo é atualizado e,
+        caso o grafo seja acíclico, os arcos são relaxados em ordem topológica.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Returns:
+            ShortestPathResult: Os custos e os antecessores, os caminhos são montados sob demanda.
+
+        Examples:
+            ShortestMinimumPath(...).get_bellman_ford_result("A").distance_to("B")
+            ...
+        """
+        graph = self.graph.freeze()
+        if graph.get_topological_order() is not None:
+            return self.get_dag_shortest_path_result(source)
+        # O laço principal é executado pelo núcleo compilado, caso disponível.
+        distance, previous, negative_cycle = bellman_ford(
+            graph.offsets, graph.targets, graph.weights, graph.vertex_count, graph.translate_vertex_label_to_index(source)
+        )
+        # Se ainda foi possível atualizar um custo, um ciclo negativo existe no grafo.
+        if negative_cycle:
+            raise ValueError("Um ciclo negativo foi encontrado no grafo.")
+        return ShortestPathResult(
+            graph.vertexes, graph.index, source, distance, previous, graph.weights.typecode == "q"
+        )
+
+    def get_dag_paths(self, sources: tuple[str, ...], longest: bool) -> ShortestPathResult:
+        """Relaxa os arcos em ordem topológica, a partir de um ou mais vértices.
+
+        Args:
+            sources (tuple[str, ...]): Os rótulos dos vértices tomados como ponto de partida.
+            longest (bool): Se os caminhos máximos devem ser calculados.
+
+        Returns:
+            ShortestPathResult: Os custos e os antecessores, a origem é o primeiro vértice fornecido.
+        """
+        graph = self.graph.freeze()
+        order = graph.get_topological_order()
+        if order is None:
+            raise ValueError("O grafo possui um ciclo.")
+        distance, previous = dag_paths(
+            order,
+            graph.offsets,
+            graph.targets,
+            graph.weights,
+            graph.vertex_count,
+            [graph.translate_vertex_label_to_index(source) for source in sources],
+            longest,
+        )
+        return ShortestPathResult(
+            graph.vertexes, graph.index, sources[0], distance, previous, graph.weights.typecode == "q"
+        )
+
+    def get_dag_shortest_path_result(self, source: str) -> ShortestPathResult:
+        """Calcula os caminhos mínimos em um grafo acíclico, em tempo linear, mesmo com custos negativos.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Returns:
+            ShortestPathResult: Os custos e os antecessores, os caminhos são montados sob demanda.
+
+        Examples:
+            ShortestMinimumPath(...).get_dag_shortest_path_result("A").distance_to("B")
+            ...
+        """
+        return self.get_dag_paths((source,), False)
+
+    def get_dag_longest_path_result(self, source: str) -> ShortestPathResult:
+        """Calcula os caminhos máximos em um grafo acíclico, em tempo linear.
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+
+        Returns:
+            ShortestPathResult: Os custos, menos infinito caso não seja alcançável, e os antecessores.
+
+        Examples:
+            ShortestMinimumPath(...).get_dag_longest_path_result("A").path_to("B")
+            ...
+        """
+        return self.get_dag_paths((source,), True)
+
+    def get_critical_path(self) -> tuple[int | float, list[str]]:
+        """Calcula o caminho crítico, o caminho de maior custo, entre quaisquer vértices, de um grafo acíclico.
+
+        Em um grafo de tarefas, onde o custo dos arcos é a duração das
+        tarefas, o custo do caminho crítico é a duração mínima do projeto.
+
+        Returns:
+            tuple[int | float, list[str]]: O custo e os rótulos dos vértices do caminho crítico.
+
+        Examples:
+            ShortestMinimumPath(...).get_critical_path()
+            ...
+        """
+        graph = self.graph.freeze()
+        if graph.vertex_count == 0:
+            return (0, [])
+        # Todos os vértices são pontos de partida, com custo 0.
+        result = self.get_dag_paths(graph.vertexes, True)
+        end = max(range(graph.vertex_count), key=result.distance.__getitem__)
+        path = result.path_to(graph.vertexes[end])
+        return (result.export_cost(result.distance[end]), path)
+
+    def get_floyd_warshall_result(self) -> AllPairsShortestPathResult:
+        """Aplica o algoritmo de Floyd-Warshall, retornando um resultado compacto.
+
+        Caso o grafo possua ciclos negativos, os custos não são confiáveis.
+
+        Returns:
+            AllPairsShortestPathResult: Os custos e os próximos vértices, os caminhos são montados sob demanda.
+
+        Examples:
+            ShortestMinimumPath(...).get_floyd_warshall_result().path("A", "B")
+            ...
+        """
+        graph = self.graph.freeze()
+        n = graph.vertex_count
+        # Matrizes, linha por linha, com os custos e os próximos vértices.
+        distances = array("d", [float("inf")]) * (n * n)
+        successors = array("q", [-1]) * (n * n)
+        for i in range(n):
+            distances[i * n + i] = 0
+            successors[i * n + i] = i
+        for i, j, weight in graph.iter_edges():
+            distances[i * n + j] = weight
+            successors[i * n + j] = j
+
+        # Atualiza o custo, para menor, se possível, percorrendo "k" vértices, pelo núcleo compilado, caso disponível.
+        floyd_warshall(n, distances, successors)
+        return AllPairsShortestPathResult(
+            graph.vertexes, graph.index, distances, successors, graph.weights.typecode == "q"
+        )
+
+    def get_blocked_floyd_warshall_result(self, tile_size: int = 64, workers: int | None = None) -> AllPairsShortestPathResult:
+        """Aplica o algoritmo de Floyd-Warshall em blocos, distribuindo os blocos entre processos.
+
+        Indicado para grafos grandes e densos, o tamanho dos blocos deve ser
+        ajustado para que três blocos caibam na memória cache.
+
+        Args:
+            tile_size (int, optional): O tamanho, em vértices, dos blocos.
+            workers (int | None, optional): A quantidade de processos, por padrão, a quantidade de CPUs.
+
+        Returns:
+            AllPairsShortestPathResult: Os custos e os próximos vértices, os caminhos são montados sob demanda.
+
+        Examples:
+            ShortestMinimumPath(...).get_blocked_floyd_warshall_result()
+
+            ShortestMinimumPath(...).get_blocked_floyd_warshall_result(128, 8)
+            ...
+        """
+        return BlockedFloydWarshall(self.graph, tile_size, workers).apply()
+
+    def get_k_shortest_paths(self, source: str, destiny: str, k: int = 10) -> list[tuple[int | float, list[str]]]:
+        """Calcula os "k" caminhos mínimos, sem vértices repetidos, entre dois vértices (rotas alternativas).
+
+        Args:
+            source (str): O rótulo do vértice tomado como ponto de partida.
+            destiny (str): O rótulo do vértice tomado como destino.
+            k (int, optional): A quantidade máxima de caminhos.
+
+        Returns:
+            list[tuple[int | float, list[str]]]: O custo e os rótulos dos vértices de cada caminho, em ordem crescente de custo.
+
+        Examples:
+            ShortestMinimumPath(...).get_k_shortest_paths("A", "B", 3)
+            ...
+        """
+        return KShortestPaths(self.graph, source, destiny, k).apply()
+
+    def get_contraction_hierarchy(self, witness_limit: int = 64) -> "ContractionHierarchy":
+        """Pré-processa o grafo em uma hierarquia de contração, para consultas rápidas entre dois vértices.
+
+        Indicado para grafos grandes, como malhas viárias, consultados muitas
+        vezes, o pré-processamento pode ser salvo em arquivo e reaproveitado.
+
+        Args:
+            witness_limit (int, optional): A quantidade máxima de vértices visitados na busca por caminhos alternativos.
+
+        Returns:
+            ContractionHierarchy: A hierarquia de contração.
+
+        Examples:
+            ShortestMinimumPath(...).get_contraction_hierarchy().query("A", "B")
+            ...
+        """
+        from ContractionHierarchy import ContractionHierarchy
+
+        return ContractionHierarchy.build(self.graph, witness_limit)
+
+    def write_all_pairs_distances(
+        self, path: str, method: str = "dijkstra", tile_size: int = 64, workers: int | None = None
+    ) -> DistanceMatrixFile:
+        """Calcula os custos mínimos entre todos os pares de vértices, diretamente em um arquivo.
+
+        A matriz não é mantida em memória, o arquivo é mapeado em memória e
+        pode ser consultado, posteriormente, por múltiplos processos.
+
+        Args:
+            path (str): O caminho do arquivo a ser criado.
+            method (str, optional): "dijkstra", uma linha por origem, ou "floyd-warshall", em blocos.
+            tile_size (int, optional): O tamanho dos blocos do Floyd-Warshall.
+            workers (int | None, optional): A quantidade de processos, por padrão, a quantidade de CPUs.
+
+        Returns:
+            DistanceMatrixFile: O arquivo, aberto para consultas.
+
+        Examples:
+            ShortestMinimumPath(...).write_all_pairs_distances("Custos.bin").distance("A", "B")
+            ...
+        """
+        return DistanceMatrixFile.write(self.graph, path, method, tile_size, workers)
@@ -0,0 +1,98 @@
+from array import array
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class ShortestPathResult:
+    """Representa o resultado de um algoritmo de caminho mínimo, a partir de um único vértice.
+
+    Os custos e os antecessores são guardados em vetores, indexados pelo
+    índice dos vértices, e os caminhos só são montados quando solicitados.
+    """
+
+    vertexes: tuple[str, ...] = field(repr=False)
+    index: dict[str, int] = field(repr=False)
+    source: str
+    distance: array = field(repr=False)
+    previous: array = field(repr=False)
+    integral: bool = field(repr=False, default=True)
+
+    def get_vertex_index(self, vertex: str) -> int:
+        """Transforma o rótulo de um vértice para o índice.
+
+        Args:
+            vertex (str): O rótulo do vértice a ser buscado.
+
+        Returns:
+            int: O índice do vértice.
+        """
+        if vertex in self.index:
+            return self.index[vertex]
+        raise ValueError("O grafo não possui o vértice: " + vertex)
+
+    def export_cost(self, cost: float) -> int | float:
+        """Converte o custo para inteiro, caso todos os custos do grafo sejam inteiros.
+
+        Args:
+            cost (float): O custo a ser convertido.
+
+        Returns:
+            int | float: O custo convertido.
+        """
+        if self.integral and cost not in (float("inf"), float("-inf")):
+            return int(cost)
+        return cost
+
+    def distance_to(self, vertex: str) -> int | float:
+        """Retorna o custo mínimo, desde a origem, até um vértice.
+
+        Args:
+            vertex (str): O rótulo do vértice de destino.
+
+        Returns:
+            int | float: O custo mínimo, infinito caso o vértice não seja alcançável.
+
+        Examples:
+            ShortestMinimumPath(...).get_dijkstra_result("A").distance_to("B")
+            ...
+        """
+        return self.export_cost(self.distance[self.get_vertex_index(vertex)])
+
+    def path_to(self, vertex: str) -> list[str]:
+        """Monta o caminho mínimo, desde a origem, até um vértice.
+
+        Args:
+            vertex (str): O rótulo do vértice de destino.
+
+        Returns:
+            list[str]: Os rótulos dos vértices do caminho, vazio caso o vértice não seja alcançável.
+
+        Examples:
+            ShortestMinimumPath(...).get_dijkstra_result("A").path_to("B")
+            ...
+        """
+        current = self.get_vertex_index(vertex)
+        # Nos caminhos máximos, os vértices não alcançáveis possuem custo menos infinito.
+        if self.distance[current] in (float("inf"), float("-inf")):
+            return []
+        path = []
+        # Percorre os antecessores até a origem.
+        while current != -1:
+            path.append(self.vertexes[current])
+            current = self.previous[current]
+        path.reverse()
+        return path
+
+    def to_dict(self) -> dict[str, list[int | float] | dict[str, str]]:
+        """Exporta o resultado no mesmo formato dos métodos "apply_*".
+
+        Returns:
+            dict[str, list[int | float] | dict[str, str]]: O custo e os antecessores dos vértices.
+        """
+        return {
+            "Custo dos vértices": [self.export_cost(cost) for cost in self.distance],
+            "Antecessores": {
+                vertex: self.vertexes[previous] if previous != -1 else ""
+                for vertex, previous in zip(self.vertexes, self.previous)
+            },
+        }
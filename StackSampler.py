@@ -0,0 +1,73 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from os.path import basename
+from sys import _current_frames
+from threading import Event, Thread, get_ident
+
+
+@dataclass
+class StackSampler:
+    """Responsável por amostrar, periodicamente, a pilha de chamadas de uma thread.
+
+    As pilhas são contadas no formato "folded", uma linha por pilha, com as
+    funções separadas por ";" e a quantidade de amostras, compatível com as
+    ferramentas de flame graph (flamegraph.pl, speedscope, inferno).
+
+    Examples:
+        with StackSampler() as sampler:
+            ...
+        sampler.write_folded("Perfil.folded")
+    """
+
+    interval: float = 0.001
+    counts: Counter = field(repr=False, init=False, default_factory=Counter)
+    target: int = field(repr=False, init=False, default=0)
+    thread: Thread | None = field(repr=False, init=False, default=None)
+    stopped: Event = field(repr=False, init=False, default_factory=Event)
+
+    def __post_init__(self):
+        if self.interval <= 0:
+            raise ValueError("O intervalo entre as amostras deve ser positivo.")
+
+    def __enter__(self) -> "StackSampler":
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def start(self):
+        """Inicia a amostragem da thread atual, em uma thread auxiliar."""
+        self.target = get_ident()
+        self.stopped.clear()
+        self.thread = Thread(target=self.sample, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Encerra a amostragem."""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def sample(self):
+        """Conta a pilha da thread amostrada a cada intervalo, até a amostragem ser encerrada."""
+        while not self.stopped.wait(self.interval):
+            frame = _current_frames().get(self.target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def write_folded(self, file_path: str):
+        """Escreve as pilhas amostradas no formato "folded".
+
+        Args:
+            file_path (str): O caminho do arquivo.
+        """
+        with open(file_path, "w", encoding="utf-8") as file:
+            for stack, count in self.counts.most_common():
+                file.write(f"{stack} {count}\n")
@@ -0,0 +1,84 @@
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+from FrozenGraph import FrozenGraph
+from GraphView import GraphView
+
+
+@dataclass(frozen=True, slots=True)
+class SubgraphView(GraphView):
+    """Representa o subgrafo induzido por um conjunto de vértices, sem copiar os arcos.
+
+    Somente os arcos entre dois vértices do conjunto pertencem à visão.
+    """
+
+    base: FrozenGraph = field(repr=False)
+    selected: array = field(repr=False)
+    mask: bytearray = field(repr=False)
+    cache: dict[str, object] = field(repr=False, compare=False, default_factory=dict)
+
+    @classmethod
+    def from_vertexes(cls, base: FrozenGraph, vertexes: tuple[str, ...]) -> "SubgraphView":
+        """Cria o subgrafo induzido pelos vértices fornecidos.
+
+        Args:
+            base (FrozenGraph): A cópia imutável do grafo.
+            vertexes (tuple[str, ...]): Os rótulos dos vértices do subgrafo.
+
+        Returns:
+            SubgraphView: A visão do subgrafo.
+
+        Examples:
+            SubgraphView.from_vertexes(graph.freeze(), ("A", "B", "C"))
+            ...
+        """
+        mask = bytearray(base.vertex_count)
+        for vertex in vertexes:
+            mask[base.translate_vertex_label_to_index(vertex)] = 1
+        return cls(base, array("q", (i for i in range(base.vertex_count) if mask[i])), mask)
+
+    @property
+    def members(self) -> Sequence[int]:
+        """Os índices, no grafo base, dos vértices da visão, em ordem crescente."""
+        return self.selected
+
+    def has_vertex(self, i: int) -> bool:
+        """Verifica se um vértice, pelo índice no grafo base, pertence à visão.
+
+        Args:
+            i (int): O índice do vértice no grafo base.
+
+        Returns:
+            bool: Se o vértice pertence à visão.
+        """
+        return self.mask[i] == 1
+
+    def iter_arcs(self, i: int) -> Iterator[tuple[int, int | float]]:
+        """Percorre os arcos de saída de um vértice, somente para os vértices da visão.
+
+        Args:
+            i (int): O índice do vértice no grafo base.
+
+        Yields:
+            tuple[int, int | float]: O índice do vizinho e o custo do arco.
+        """
+        base, mask = self.base, self.mask
+        for position in range(base.offsets[i], base.offsets[i + 1]):
+            if mask[base.targets[position]]:
+                yield (base.targets[position], base.weights[position])
+
+    def get_index_weight(self, i: int, j: int) -> int | float | None:
+        """Retorna o custo de um arco da visão, com os índices do grafo base.
+
+        Args:
+            i (int): O índice do vértice de origem.
+            j (int): O índice do vértice de destino.
+
+        Returns:
+            int | float | None: O custo do arco, ou None caso o arco não pertença à visão.
+        """
+        if not (self.mask[i] and self.mask[j]):
+            return None
+        position = self.base.find_edge_position(i, j)
+        return self.base.weights[position] if position != -1 else None
@@ -0,0 +1,148 @@
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+from FrozenGraph import FrozenGraph
+from GraphView import GraphView
+
+
+@dataclass(frozen=True, slots=True)
+class TreeView(GraphView):
+    """Representa uma árvore, ou floresta, guardada como um vetor de antecessores, sem copiar os arcos.
+
+    Cada vértice da árvore, exceto as raízes, possui um arco não-direcionado
+    com o seu antecessor, com o custo guardado junto do vértice.
+    """
+
+    base: FrozenGraph = field(repr=False)
+    order: array = field(repr=False)
+    parent: array = field(repr=False)
+    costs: array = field(repr=False)
+    cache: dict[str, object] = field(repr=False, compare=False, default_factory=dict)
+
+    @classmethod
+    def from_arcs(
+        cls, base: FrozenGraph, root: int, arcs: Iterator[tuple[int, int]], unit_cost: bool = False
+    ) -> "TreeView":
+        """Cria a árvore a partir dos arcos percorridos por uma busca.
+
+        Args:
+            base (FrozenGraph): A cópia imutável do grafo.
+            root (int): O índice da raiz.
+            arcs (Iterator[tuple[int, int]]): Os arcos, do antecessor para o vértice, na ordem de descoberta.
+            unit_cost (bool, optional): Se os arcos da árvore devem ter custo 1, ao invés do custo no grafo.
+
+        Returns:
+            TreeView: A visão da árvore.
+
+        Examples:
+            TreeView.from_arcs(graph, 0, BreadthFirstSearch(graph).iter_bfs_indexes(0))
+            ...
+        """
+        order = array("q", [root])
+        parent = array("q", [-1]) * base.vertex_count
+        costs = array(base.weights.typecode, [0]) * base.vertex_count
+        for u, v in arcs:
+            order.append(v)
+            parent[v] = u
+            costs[v] = 1 if unit_cost else base.weights[base.find_edge_position(u, v)]
+        return cls(base, order, parent, costs)
+
+    @property
+    def members(self) -> Sequence[int]:
+        """Os índices, no grafo base, dos vértices da visão, em ordem crescente."""
+        if "members" not in self.cache:
+            self.cache["members"] = array("q", sorted(self.order))
+        return self.cache["members"]
+
+    @property
+    def mask(self) -> bytearray:
+        """Indica, para cada vértice do grafo base, se ele pertence à árvore."""
+        if "mask" not in self.cache:
+            mask = bytearray(self.base.vertex_count)
+            for i in self.order:
+                mask[i] = 1
+            self.cache["mask"] = mask
+        return self.cache["mask"]
+
+    @property
+    def children(self) -> dict[int, list[int]]:
+        """Os filhos de cada vértice da árvore, na ordem de descoberta."""
+        if "children" not in self.cache:
+            children = {}
+            for v in self.order:
+                if self.parent[v] != -1:
+                    children.setdefault(self.parent[v], []).append(v)
+            self.cache["children"] = children
+        return self.cache["children"]
+
+    @property
+    def edges(self) -> dict[tuple[str, str], int | float]:
+        """Os arcos da árvore, nos dois sentidos, na ordem de descoberta, e os seus custos."""
+        vertexes, parent, costs = self.base.vertexes, self.parent, self.costs
+        edges = {}
+        for v in self.order:
+            u = parent[v]
+            if u != -1:
+                edges[(vertexes[u], vertexes[v])] = costs[v]
+                edges[(vertexes[v], vertexes[u])] = costs[v]
+        return edges
+
+    def has_vertex(self, i: int) -> bool:
+        """Verifica se um vértice, pelo índice no grafo base, pertence à árvore.
+
+        Args:
+            i (int): O índice do vértice no grafo base.
+
+        Returns:
+            bool: Se o vértice pertence à árvore.
+        """
+        return self.mask[i] == 1
+
+    def iter_arcs(self, i: int) -> Iterator[tuple[int, int | float]]:
+        """Percorre os arcos de um vértice da árvore, para o antecessor e para os filhos.
+
+        Args:
+            i (int): O índice do vértice no grafo base.
+
+        Yields:
+            tuple[int, int | float]: O índice do vizinho e o custo do arco.
+        """
+        if self.parent[i] != -1:
+            yield (self.parent[i], self.costs[i])
+        for child in self.children.get(i, ()):
+            yield (child, self.costs[child])
+
+    def get_index_weight(self, i: int, j: int) -> int | float | None:
+        """Retorna o custo de um arco da árvore, com os índices do grafo base.
+
+        Args:
+            i (int): O índice do vértice de origem.
+            j (int): O índice do vértice de destino.
+
+        Returns:
+            int | float | None: O custo do arco, ou None caso o arco não pertença à árvore.
+        """
+        if self.parent[j] == i and self.mask[j]:
+            return self.costs[j]
+        if self.parent[i] == j and self.mask[i]:
+            return self.costs[i]
+        return None
+
+    def get_path_to_root(self, vertex: str) -> list[str]:
+        """Retorna o caminho, na árvore, de um vértice até a raiz.
+
+        Args:
+            vertex (str): O rótulo do vértice.
+
+        Returns:
+            list[str]: Os rótulos dos vértices do caminho, começando pelo vértice fornecido.
+        """
+        i = self.get_base_index(vertex)
+        if i is None:
+            raise ValueError("A árvore não possui o vértice: " + vertex)
+        path = []
+        while i != -1:
+            path.append(self.base.vertexes[i])
+            i = self.parent[i]
+        return path
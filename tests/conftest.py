@@ -0,0 +1,5 @@
+import sys
+from os.path import abspath, dirname
+
+# Os módulos ficam na raiz do repositório.
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
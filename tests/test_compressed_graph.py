@@ -0,0 +1,31 @@
+from random import Random
+
+from BreadthFirstSearch import BreadthFirstSearch
+from CompressedGraph import CompressedGraph
+from GraphGenerator import GraphGenerator
+from ShortestMinimumPath import ShortestMinimumPath
+
+
+def test_compressed_graph_matches_frozen_graph():
+    for seed in range(3):
+        graph = GraphGenerator(seed=seed, weight_range=(-3, 9)).gnp(50, 0.1, directed=seed % 2 == 0)
+        compressed = graph.compress()
+        assert list(compressed.iter_edges()) == list(graph.iter_edges())
+        source = Random(seed).choice(graph.vertexes)
+        assert BreadthFirstSearch(compressed).apply_bfs(source) == BreadthFirstSearch(graph).apply_bfs(source)
+
+
+def test_snapshot_is_decompressed_once(monkeypatch):
+    compressed = GraphGenerator(seed=0).gnp(40, 0.1).compress()
+    calls = []
+    iter_edges = CompressedGraph.iter_edges
+
+    def counted(self):
+        calls.append(1)
+        return iter_edges(self)
+
+    monkeypatch.setattr(CompressedGraph, "iter_edges", counted)
+    assert compressed.freeze() is compressed.freeze()
+    BreadthFirstSearch(compressed).apply_bfs(compressed.vertexes[0])
+    ShortestMinimumPath(compressed).get_dijkstra_result(compressed.vertexes[0])
+    assert len(calls) == 1
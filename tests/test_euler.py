@@ -0,0 +1,31 @@
+import pytest
+
+from Euler import Euler
+from Graph import Graph
+
+
+def get_graph(edges: tuple[tuple[str, str], ...]) -> Graph:
+    """Cria um grafo não-direcionado, com um vértice isolado no início."""
+    graph = Graph()
+    graph.add_vertexes(("A", "B", "C", "D"))
+    for edge in edges:
+        graph.add_edge_undirected(edge)
+    return graph
+
+
+@pytest.mark.parametrize("attempt", range(10))
+def test_semi_euler_path_starts_at_an_odd_vertex(attempt):
+    euler = Euler(get_graph((("B", "C"), ("C", "D"))))
+    assert euler.is_graph_semi_euler()
+    path = euler.get_euler_circuit()["Caminho Euleriano"]
+    assert path in ([("B", "C"), ("C", "D")], [("D", "C"), ("C", "B")])
+
+
+@pytest.mark.parametrize("attempt", range(10))
+def test_euler_circuit_skips_isolated_vertexes(attempt):
+    euler = Euler(get_graph((("B", "C"), ("C", "D"), ("D", "B"))))
+    assert euler.is_graph_euler()
+    circuit = euler.get_euler_circuit()
+    assert len(circuit["Caminho Euleriano"]) == 3
+    assert circuit["Caminho Euleriano"][0][0] == circuit["Caminho Euleriano"][-1][1]
+    assert circuit["Custo do Caminho"] == [1, 1, 1]
@@ -0,0 +1,55 @@
+from sys import intern
+
+import pytest
+
+from BreadthFirstSearch import BreadthFirstSearch
+from Graph import Graph
+from GraphJournal import GraphJournal
+from ShortestMinimumPath import ShortestMinimumPath
+
+
+def test_labels_are_interned():
+    graph = Graph()
+    label = "".join(["vér", "tice"])
+    graph.add_vertex(label)
+    assert graph.vertexes[0] is intern("vértice")
+
+
+def test_non_text_labels_are_accepted():
+    graph = Graph()
+    graph.add_vertexes((1, 2, 3))
+    graph.add_edge_undirected((1, 2), 4)
+    graph.add_edge_directed((2, 3), 1)
+    assert graph.vertexes == [1, 2, 3]
+    assert graph.get_edge_weight((2, 1)) == 4
+    assert BreadthFirstSearch(graph).apply_bfs(1) == [(1, 2)]
+    assert ShortestMinimumPath(graph).get_dijkstra_result(1).distance_to(3) == 5
+
+
+def test_failed_nested_batch_undoes_only_its_changes(tmp_path):
+    path = str(tmp_path / "Grafo.journal")
+    with GraphJournal(path) as journal:
+        graph = Graph()
+        graph.journal = journal
+        with graph.batch():
+            graph.add_vertexes(("A", "B", "C"))
+            graph.add_edge_directed(("A", "B"), 2)
+            graph.remove_vertex("C")
+            with pytest.raises(RuntimeError):
+                with graph.batch():
+                    graph.add_vertexes(("C", "D"))
+                    graph.add_edge_directed(("A", "B"), 5)
+                    graph.add_edge_directed(("B", "D"), 1)
+                    graph.remove_vertex("A", tombstone=True)
+                    raise RuntimeError
+            graph.add_vertex("E")
+            graph.add_edge_directed(("B", "E"), 3)
+    assert graph.vertexes == ["A", "B", "E"] and graph.vertex_count == 3
+    assert graph.edges == {("A", "B"): 2, ("B", "E"): 3}
+    assert graph.graph == [[0, 2, 0], [0, 0, 3], [0, 0, 0]]
+    # O diário reproduz somente as alterações mantidas.
+    with GraphJournal(path) as journal:
+        replayed = Graph()
+        journal.replay(replayed)
+    assert replayed.vertexes == graph.vertexes
+    assert replayed.edges == graph.edges
@@ -0,0 +1,33 @@
+from Graph import Graph
+from GraphJournal import GraphJournal
+from GraphProfiler import main
+
+
+def write_journal(path: str):
+    """Escreve um diário com um vértice removido (tombstone)."""
+    graph = Graph()
+    with GraphJournal(path) as journal:
+        graph.journal = journal
+        graph.add_vertexes(("A", "B", "C", "D"))
+        graph.add_edge_undirected(("A", "B"))
+        graph.add_edge_undirected(("B", "C"))
+        graph.add_edge_undirected(("C", "D"))
+        graph.remove_vertex("A", tombstone=True)
+
+
+def test_removed_vertexes_are_not_sources(tmp_path, capsys):
+    path = str(tmp_path / "Grafo.journal")
+    write_journal(path)
+    main([path, "bfs"])
+    assert "(3 vértices, 4 arcos)" in capsys.readouterr().out
+    main([path, "dijkstra", "--all-sources"])
+    assert "dijkstra: 3 ponto(s) de partida" in capsys.readouterr().out
+
+
+def test_profile_and_sample_outputs(tmp_path, capsys):
+    path = str(tmp_path / "Grafo.journal")
+    write_journal(path)
+    profile, sample = tmp_path / "Perfil.pstats", tmp_path / "Perfil.folded"
+    main([path, "floyd-warshall", "--profile", str(profile), "--sample", str(sample), "--repeat", "3"])
+    assert "cProfile" in capsys.readouterr().out
+    assert profile.stat().st_size > 0 and sample.exists()
@@ -0,0 +1,132 @@
+import asyncio
+from threading import Event
+
+import GraphQueryService as service_module
+from Graph import Graph
+from GraphQueryClient import GraphQueryClient
+from GraphQueryService import GraphQueryService
+from ShortestMinimumPath import ShortestMinimumPath
+
+
+def get_graph() -> Graph:
+    """Cria um grafo pequeno, com um vértice isolado."""
+    graph = Graph()
+    with graph.batch():
+        graph.add_vertexes(("A", "B", "C", "D", "E"))
+        graph.add_edge_undirected(("A", "B"), 2)
+        graph.add_edge_undirected(("B", "C"), 3)
+        graph.add_edge_undirected(("A", "C"), 7)
+        graph.add_edge_directed(("C", "D"), 1)
+    return graph
+
+
+def count_calls(monkeypatch, name: str) -> list[tuple]:
+    """Conta as execuções de uma das funções executadas no pool."""
+    calls = []
+    function = getattr(service_module, name)
+
+    def counted(*arguments):
+        calls.append(arguments[1:])
+        return function(*arguments)
+
+    monkeypatch.setattr(service_module, name, counted)
+    return calls
+
+
+def test_requests_match_synchronous_algorithms():
+    graph = get_graph()
+
+    async def main():
+        async with GraphQueryService(graph) as service:
+            client = GraphQueryClient(service)
+            assert await client.request("route", source="A", destiny="D") == (6, ["A", "B", "C", "D"])
+            assert await client.request("distance", source="A", destiny="E") == float("inf")
+            result = await client.request("dijkstra", source="A")
+            assert list(result.distance) == list(ShortestMinimumPath(graph).get_dijkstra_result("A").distance)
+            assert await client.request("bfs", source="A") == [("A", "B"), ("A", "C")]
+
+    asyncio.run(main())
+
+
+def test_concurrent_requests_for_the_same_source_are_coalesced(monkeypatch):
+    calls = count_calls(monkeypatch, "run_bfs")
+
+    async def main():
+        async with GraphQueryService(get_graph()) as service:
+            responses = await GraphQueryClient(service).request_many([{"kind": "bfs", "source": "A"}] * 10)
+            assert all(response == responses[0] for response in responses)
+
+    asyncio.run(main())
+    assert len(calls) == 1
+
+
+def test_point_to_point_requests_share_one_dijkstra(monkeypatch):
+    calls = count_calls(monkeypatch, "run_dijkstra")
+
+    async def main():
+        async with GraphQueryService(get_graph()) as service:
+            requests = [{"kind": "route", "source": "A", "destiny": destiny} for destiny in "BCDB"]
+            responses = await GraphQueryClient(service).request_many(requests)
+            assert [response["result"][0] for response in responses] == [2, 5, 6, 2]
+            assert not service.tasks
+
+    asyncio.run(main())
+    assert calls == [("A", ("B", "C", "D"))]
+
+
+def test_unknown_destiny_fails_only_its_own_request():
+    async def main():
+        async with GraphQueryService(get_graph()) as service:
+            requests = [
+                {"kind": "route", "source": "A", "destiny": "D"},
+                {"kind": "route", "source": "A", "destiny": "Z"},
+                {"kind": "distance", "source": "A", "destiny": "C"},
+            ]
+            responses = await GraphQueryClient(service).request_many(requests)
+            assert responses[0] == {"result": (6, ["A", "B", "C", "D"])}
+            assert responses[1] == {"error": "O grafo não possui o vértice: Z"}
+            assert responses[2] == {"result": 5}
+
+    asyncio.run(main())
+
+
+def test_unknown_source_and_query_are_reported():
+    async def main():
+        async with GraphQueryService(get_graph()) as service:
+            responses = await GraphQueryClient(service).request_many(
+                [{"kind": "bfs", "source": "Z"}, {"kind": "route", "source": "Z", "destiny": "A"}, {"kind": "x"}]
+            )
+            assert all("error" in response for response in responses)
+
+    asyncio.run(main())
+
+
+def test_requests_after_a_mutation_are_not_coalesced_with_older_ones(monkeypatch):
+    graph = get_graph()
+    started, release = Event(), Event()
+    run_bfs = service_module.run_bfs
+
+    def blocking_bfs(frozen, source):
+        # A primeira busca só termina depois que o grafo for alterado.
+        if not started.is_set():
+            started.set()
+            release.wait(5)
+        return run_bfs(frozen, source)
+
+    monkeypatch.setattr(service_module, "run_bfs", blocking_bfs)
+
+    async def main():
+        async with GraphQueryService(graph) as service:
+            first = asyncio.ensure_future(service.bfs("A"))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            graph.add_edge_undirected(("C", "E"))
+            second = asyncio.ensure_future(service.bfs("A"))
+            await asyncio.sleep(0)
+            # A execução em andamento guarda a cópia consultada, que não pode ser liberada.
+            snapshot, _ = service.in_flight[("bfs", "A")]
+            assert snapshot is graph.freeze()
+            release.set()
+            assert await first == [("A", "B"), ("A", "C")]
+            assert await second == [("A", "B"), ("A", "C"), ("C", "E")]
+
+    asyncio.run(main())
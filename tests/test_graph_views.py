@@ -0,0 +1,90 @@
+from dataclasses import dataclass, field
+from random import Random
+
+import pytest
+
+from BreadthFirstSearch import BreadthFirstSearch
+from DepthFirstSearch import DepthFirstSearch
+from FrozenGraph import FrozenGraph
+from Graph import Graph
+from GraphView import GraphView
+from ShortestMinimumPath import ShortestMinimumPath
+from TreeView import TreeView
+
+
+def get_graph() -> Graph:
+    """Cria um grafo aleatório, com arcos direcionados e não-direcionados."""
+    random = Random(1)
+    labels = [f"v{i}" for i in range(60)]
+    graph = Graph()
+    with graph.batch():
+        graph.add_vertexes(tuple(labels))
+        for _ in range(200):
+            graph.add_edge_directed(tuple(random.sample(labels, 2)), random.randint(1, 9))
+        for _ in range(50):
+            source, destiny = random.sample(labels, 2)
+            graph.add_edge_undirected((source, destiny), random.randint(1, 9))
+    return graph
+
+
+def assert_same_as_materialized(view: GraphView):
+    """Compara a visão com o "Graph" criado a partir dela."""
+    graph = view.materialize()
+    assert view.vertexes == tuple(graph.vertexes)
+    assert view.edges == graph.edges
+    assert view.get_vertexes_degree() == graph.get_vertexes_degree()
+    assert view.get_graph_frequency() == graph.get_graph_frequency()
+    for vertex in view.vertexes[:5]:
+        assert sorted(view.find_adjacent_vertexes(vertex)[vertex]) == sorted(graph.find_adjacent_vertexes((vertex,))[vertex])
+        assert ShortestMinimumPath(view).apply_dijkstra_algorithm(vertex) == ShortestMinimumPath(graph).apply_dijkstra_algorithm(vertex)
+        assert BreadthFirstSearch(view).apply_bfs(vertex) == BreadthFirstSearch(graph).apply_bfs(vertex)
+    for edge in list(graph.edges)[:20]:
+        assert view.contain_directed_edge(edge)
+        assert view.get_edge_weight(edge) == graph.get_edge_weight(edge)
+
+
+def test_subgraph_view():
+    graph = get_graph()
+    view = graph.get_subgraph_view(tuple(Random(2).sample(graph.vertexes, 30)))
+    assert_same_as_materialized(view)
+    assert_same_as_materialized(view.freeze().get_subgraph_view(view.vertexes[:10]))
+
+
+def test_filtered_view():
+    assert_same_as_materialized(get_graph().get_filtered_view(lambda source, destiny, weight: weight < 5))
+
+
+def test_tree_views():
+    graph = get_graph()
+    tree = DepthFirstSearch(graph).get_dfs_tree("v1")
+    assert isinstance(tree, TreeView)
+    assert_same_as_materialized(tree)
+    tree = BreadthFirstSearch(graph).get_bfs_tree("v1")
+    assert_same_as_materialized(tree)
+    assert set(tree.edges.values()) == {1}
+    path = tree.get_path_to_root(tree.vertexes[-1])
+    assert path[-1] == "v1"
+
+
+def test_views_have_no_instance_dictionary():
+    graph = get_graph()
+    views = [
+        graph.get_subgraph_view(("v1", "v2")),
+        graph.get_filtered_view(lambda source, destiny, weight: True),
+        DepthFirstSearch(graph).get_dfs_tree("v1"),
+    ]
+    for view in views:
+        assert not hasattr(view, "__dict__")
+
+
+def test_incomplete_view_fails_on_creation():
+    @dataclass(frozen=True, slots=True)
+    class IncompleteView(GraphView):
+        base: FrozenGraph
+        cache: dict[str, object] = field(default_factory=dict)
+
+        def has_vertex(self, i: int) -> bool:
+            return True
+
+    with pytest.raises(TypeError):
+        IncompleteView(get_graph().freeze())
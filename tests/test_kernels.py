@@ -0,0 +1,233 @@
+from array import array
+from importlib.util import module_from_spec, spec_from_file_location
+from math import inf, isclose
+from os import environ
+from os.path import abspath, dirname, join
+from random import Random
+
+import pytest
+
+from FrozenGraph import FrozenGraph
+
+KERNELS_PATH = join(dirname(dirname(abspath(__file__))), "Kernels.py")
+
+
+def load_python_kernels():
+    """Carrega uma cópia independente do módulo "Kernels", executada em Python puro."""
+    previous = environ.get("GRAFOS_KERNELS")
+    environ["GRAFOS_KERNELS"] = "python"
+    try:
+        spec = spec_from_file_location("Kernels_python", KERNELS_PATH)
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if previous is None:
+            del environ["GRAFOS_KERNELS"]
+        else:
+            environ["GRAFOS_KERNELS"] = previous
+    return module
+
+
+PYTHON = load_python_kernels()
+
+
+@pytest.fixture(scope="module", params=("python", "numba"))
+def backends(request):
+    """Retorna o backend em Python puro e o backend comparado com ele."""
+    assert PYTHON.BACKEND == "python"
+    if request.param == "python":
+        return PYTHON, PYTHON
+    pytest.importorskip("numba")
+    # O próprio módulo, pois o cache do Numba guarda as funções compiladas pelo nome do módulo.
+    import Kernels
+
+    if Kernels.BACKEND != "numba":
+        pytest.skip("GRAFOS_KERNELS=python")
+    return PYTHON, Kernels
+
+
+def get_reference_distances(graph: FrozenGraph, source: int) -> list[float]:
+    """Calcula os custos mínimos pela relaxação repetida de todos os arcos, sem ciclos negativos."""
+    distance = [inf] * graph.vertex_count
+    distance[source] = 0
+    for _ in range(graph.vertex_count):
+        for i, j, weight in graph.iter_edges():
+            if distance[i] + weight < distance[j]:
+                distance[j] = distance[i] + weight
+    return distance
+
+
+def get_reference_levels(graph: FrozenGraph, source: int) -> list[int]:
+    """Calcula o nível dos vértices pela relaxação repetida dos arcos não-direcionados."""
+    level = [inf] * graph.vertex_count
+    level[source] = 0
+    for _ in range(graph.vertex_count):
+        for i in range(graph.vertex_count):
+            for position in range(graph.undirected_offsets[i], graph.undirected_offsets[i + 1]):
+                j = graph.undirected_targets[position]
+                level[j] = min(level[j], level[i] + 1)
+    return [0 if value == inf else value for value in level]
+
+
+def get_random_graph(seed: int, n: int = 40, m: int = 160, floats: bool = False, low: int = 1) -> FrozenGraph:
+    """Gera um grafo aleatório, com custos inteiros ou reais entre "low" e 9."""
+    random = Random(seed)
+    edges = {}
+    for _ in range(m):
+        i, j = random.randrange(n), random.randrange(n)
+        if i != j:
+            edges[(i, j)] = random.uniform(low, 9) if floats else random.randint(low, 9)
+    return FrozenGraph.from_edges((str(i) for i in range(n)), ((i, j, w) for (i, j), w in edges.items()))
+
+
+def get_random_dag(seed: int, n: int = 40, m: int = 160, floats: bool = False) -> FrozenGraph:
+    """Gera um grafo acíclico aleatório, os arcos sempre vão para um índice maior."""
+    random = Random(seed)
+    edges = {}
+    for _ in range(m):
+        i, j = sorted(random.sample(range(n), 2))
+        edges[(i, j)] = random.uniform(-5, 9) if floats else random.randint(-5, 9)
+    return FrozenGraph.from_edges((str(i) for i in range(n)), ((i, j, w) for (i, j), w in edges.items()))
+
+
+def assert_same(first, second):
+    """Compara dois vetores de custos, com tolerância para os custos reais."""
+    assert len(first) == len(second)
+    for a, b in zip(first, second):
+        assert a == b or isclose(a, b, rel_tol=1e-12), (a, b)
+
+
+GRAPHS = [(seed, floats) for seed in range(4) for floats in (False, True)]
+
+
+@pytest.mark.parametrize("seed, floats", GRAPHS)
+def test_bfs_levels(backends, seed, floats):
+    python, compiled = backends
+    graph = get_random_graph(seed, floats=floats)
+    for source in range(0, graph.vertex_count, 7):
+        arguments = (graph.undirected_offsets, graph.undirected_targets, graph.vertex_count, source)
+        assert list(python.bfs_levels(*arguments)) == get_reference_levels(graph, source)
+        assert python.bfs_levels(*arguments) == compiled.bfs_levels(*arguments)
+
+
+@pytest.mark.parametrize("seed, floats", GRAPHS)
+def test_dijkstra(backends, seed, floats):
+    python, compiled = backends
+    graph = get_random_graph(seed, floats=floats)
+    arguments = (graph.offsets, graph.targets, graph.weights, graph.vertex_count)
+    for source in range(0, graph.vertex_count, 7):
+        distance, previous = python.dijkstra(*arguments, source)
+        compiled_distance, compiled_previous = compiled.dijkstra(*arguments, source)
+        assert_same(distance, get_reference_distances(graph, source))
+        assert_same(distance, compiled_distance)
+        assert previous == compiled_previous
+        # Com destinos, os custos dos destinos são os mesmos da busca completa.
+        destinies = {(source + 3) % graph.vertex_count, (source + 11) % graph.vertex_count}
+        partial, _ = python.dijkstra(*arguments, source, destinies)
+        compiled_partial, _ = compiled.dijkstra(*arguments, source, destinies)
+        assert_same(partial, compiled_partial)
+        for destiny in destinies:
+            assert partial[destiny] == distance[destiny]
+
+
+@pytest.mark.parametrize("seed, floats", GRAPHS)
+def test_bellman_ford(backends, seed, floats):
+    python, compiled = backends
+    graph = get_random_graph(seed, floats=floats, low=-1)
+    arguments = (graph.offsets, graph.targets, graph.weights, graph.vertex_count)
+    for source in range(0, graph.vertex_count, 7):
+        distance, previous, negative = python.bellman_ford(*arguments, source)
+        compiled_distance, compiled_previous, compiled_negative = compiled.bellman_ford(*arguments, source)
+        assert negative == compiled_negative
+        if not negative:
+            assert_same(distance, get_reference_distances(graph, source))
+        assert_same(distance, compiled_distance)
+        assert previous == compiled_previous
+
+
+def test_bellman_ford_negative_cycle(backends):
+    python, compiled = backends
+    graph = FrozenGraph.from_edges("ABCD", [(0, 1, 1), (1, 2, -3), (2, 1, 1), (2, 3, 2)])
+    arguments = (graph.offsets, graph.targets, graph.weights, graph.vertex_count, 0)
+    assert python.bellman_ford(*arguments)[2] is True
+    assert compiled.bellman_ford(*arguments)[2] is True
+
+
+@pytest.mark.parametrize("seed, floats", GRAPHS)
+@pytest.mark.parametrize("longest", (False, True))
+def test_dag_paths(backends, seed, floats, longest):
+    python, compiled = backends
+    graph = get_random_dag(seed, floats=floats)
+    order = array("q", range(graph.vertex_count))
+    for sources in ([0], [1, 5]):
+        arguments = (order, graph.offsets, graph.targets, graph.weights, graph.vertex_count, sources, longest)
+        distance, previous = python.dag_paths(*arguments)
+        compiled_distance, compiled_previous = compiled.dag_paths(*arguments)
+        assert_same(distance, compiled_distance)
+        assert previous == compiled_previous
+        assert distance[sources[0]] == 0
+        if not longest and sources == [0]:
+            assert_same(distance, get_reference_distances(graph, 0))
+
+
+@pytest.mark.parametrize("seed, floats", GRAPHS)
+def test_floyd_warshall(backends, seed, floats):
+    python, compiled = backends
+    graph = get_random_graph(seed, n=25, m=90, floats=floats)
+    n = graph.vertex_count
+    results = []
+    for kernels in (python, compiled):
+        distances = array("d", [inf]) * (n * n)
+        successors = array("q", [-1]) * (n * n)
+        for i in range(n):
+            distances[i * n + i] = 0
+            successors[i * n + i] = i
+        for i, j, weight in graph.iter_edges():
+            distances[i * n + j] = weight
+            successors[i * n + j] = j
+        kernels.floyd_warshall(n, distances, successors)
+        results.append((distances, successors))
+    for source in range(0, n, 6):
+        assert_same(results[0][0][source * n:(source + 1) * n], get_reference_distances(graph, source))
+    assert_same(results[0][0], results[1][0])
+    assert results[0][1] == results[1][1]
+
+
+@pytest.mark.parametrize("seed, floats", GRAPHS)
+@pytest.mark.parametrize("with_successors", [True, False])
+def test_floyd_warshall_tile(backends, seed, floats, with_successors):
+    python, compiled = backends
+    graph = get_random_graph(seed, n=25, m=90, floats=floats)
+    n, tile_size = graph.vertex_count, 7
+    blocks = (n + tile_size - 1) // tile_size
+    results = []
+    for kernels in (python, compiled):
+        distances = array("d", [inf]) * (n * n)
+        successors = array("q", [-1]) * (n * n)
+        for i in range(n):
+            distances[i * n + i] = 0
+            successors[i * n + i] = i
+        for i, j, weight in graph.iter_edges():
+            distances[i * n + j] = weight
+            successors[i * n + j] = j
+        # As matrizes compartilhadas chegam aos núcleos como visões da memória.
+        distances_view = memoryview(distances)
+        successors_view = memoryview(successors) if with_successors else None
+        for k in range(blocks):
+            tiles = [(k, k)] + [(k, j) for j in range(blocks) if j != k] + [(i, k) for i in range(blocks) if i != k]
+            tiles += [(i, j) for i in range(blocks) if i != k for j in range(blocks) if j != k]
+            for i, j in tiles:
+                kernels.floyd_warshall_tile(
+                    n,
+                    distances_view,
+                    successors_view,
+                    (i * tile_size, min((i + 1) * tile_size, n)),
+                    (j * tile_size, min((j + 1) * tile_size, n)),
+                    (k * tile_size, min((k + 1) * tile_size, n)),
+                )
+        distances_view.release()
+        results.append((distances, successors))
+    for source in range(n):
+        assert_same(results[0][0][source * n:(source + 1) * n], get_reference_distances(graph, source))
+    assert_same(results[0][0], results[1][0])
+    assert results[0][1] == results[1][1]
@@ -0,0 +1,138 @@
+from random import Random
+
+import pytest
+
+from BreadthFirstSearch import BreadthFirstSearch
+from DepthFirstSearch import DepthFirstSearch
+from Euler import Euler
+from Graph import Graph
+from Hamiltonian import Hamiltonian
+from ShortestMinimumPath import ShortestMinimumPath
+
+REMOVED = ("C", "F")
+
+
+def get_graph(seed: int) -> Graph:
+    """Cria um grafo aleatório, com arcos direcionados e não-direcionados."""
+    random = Random(seed)
+    labels = "ABCDEFGH"
+    graph = Graph()
+    graph.add_vertexes(tuple(labels))
+    for _ in range(14):
+        source, destiny = random.sample(labels, 2)
+        graph.add_edge_undirected((source, destiny), random.randint(1, 9))
+    for _ in range(4):
+        source, destiny = random.sample(labels, 2)
+        graph.add_edge_directed((source, destiny), random.randint(1, 9))
+    return graph
+
+
+def get_outputs(graph: Graph) -> list:
+    """Executa todos os algoritmos, a partir de todos os vértices, e guarda os resultados."""
+    vertexes = [vertex for vertex in graph.vertexes if graph.contain_vertex(vertex)]
+    smp = ShortestMinimumPath(graph)
+    hamiltonian = Hamiltonian(graph)
+    outputs = [
+        graph.vertex_count,
+        graph.get_vertexes_degree(),
+        graph.get_graph_density(),
+        graph.get_graph_frequency(),
+        graph.find_vertexes_with_max_degree(),
+        graph.find_vertexes_with_min_degree(),
+        graph.get_adjacency_indexes(),
+        graph.get_properties(),
+        smp.apply_floyd_warshall_algorithm(),
+        smp.get_floyd_warshall_result().distances,
+        Euler(graph).is_graph_euler(),
+        Euler(graph).is_graph_semi_euler(),
+        Euler(graph, directed=True).is_graph_euler(),
+        hamiltonian.is_graph_dirac(),
+        hamiltonian.is_graph_ore(),
+        hamiltonian.is_graph_bondy(),
+        hamiltonian.graph_has_closure(),
+        BreadthFirstSearch(graph).get_bfs_level_multi_source(tuple(vertexes)),
+        graph.get_reachability_index().get_reachable_vertexes(tuple(vertexes)),
+    ]
+    for vertex in vertexes:
+        bfs, dfs = BreadthFirstSearch(graph), DepthFirstSearch(graph)
+        outputs += [
+            bfs.apply_bfs(vertex),
+            bfs.get_bfs_level(vertex),
+            bfs.get_bfs_level_direction_optimizing(vertex),
+            bfs.get_bfs_vertexes(vertex),
+            bfs.get_bfs_tree(vertex).edges,
+            dfs.apply_dfs(vertex),
+            dfs.get_dfs_level(vertex),
+            dfs.get_dfs_vertexes(vertex),
+            dfs.get_dfs_tree(vertex).edges,
+            smp.apply_dijkstra_algorithm(vertex),
+            smp.apply_bellman_ford_algorithm(vertex),
+            list(smp.get_dijkstra_result(vertex).distance),
+            graph.get_reachability_index().get_reachable_count(vertex),
+            smp.get_k_shortest_paths(vertex, vertexes[0], 3),
+        ]
+    return outputs
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_tombstones_match_compacted_graph(seed):
+    tombstoned = get_graph(seed)
+    tombstoned.remove_vertexes(REMOVED, tombstone=True)
+    compacted = get_graph(seed)
+    compacted.remove_vertexes(REMOVED)
+    assert tombstoned.vertex_count == compacted.vertex_count == 6
+    assert get_outputs(tombstoned) == get_outputs(compacted)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_tombstones_are_rejected_as_sources(seed):
+    graph = get_graph(seed)
+    graph.remove_vertex("C", tombstone=True)
+    assert "C" not in graph.freeze().vertexes
+    with pytest.raises(ValueError):
+        graph.translate_vertex_label_to_index("C")
+    with pytest.raises(ValueError):
+        graph.translate_vertex_index_to_label(2)
+    with pytest.raises(ValueError):
+        BreadthFirstSearch(graph).apply_bfs("C")
+    with pytest.raises(ValueError):
+        ShortestMinimumPath(graph).apply_dijkstra_algorithm("C")
+
+
+def test_reactivated_vertex_and_reorder():
+    graph = get_graph(0)
+    graph.remove_vertex("C", tombstone=True)
+    graph.add_vertex("C")
+    assert graph.vertex_count == 8
+    assert graph.vertexes.index("C") == 2
+    assert "C" in BreadthFirstSearch(graph).get_bfs_level("A")
+    graph.remove_vertex("C", tombstone=True)
+    graph.reorder()
+    assert "C" not in graph.vertexes and graph.vertex_count == 7
+
+
+def test_transaction_rollback_restores_vertex_count():
+    graph = get_graph(1)
+    with pytest.raises(RuntimeError):
+        with graph.batch():
+            graph.remove_vertex("C", tombstone=True)
+            graph.add_vertex("Z")
+            raise RuntimeError
+    assert graph.vertex_count == 8
+    assert graph.get_vertexes_degree() == get_graph(1).get_vertexes_degree()
+
+
+@pytest.mark.parametrize("tombstone", [True, False])
+def test_repeated_labels_are_removed_once(tombstone):
+    graph = get_graph(2)
+    graph.remove_vertexes(("C", "C"), tombstone=tombstone)
+    expected = get_graph(2)
+    expected.remove_vertexes(("C",), tombstone=tombstone)
+    assert graph.vertex_count == expected.vertex_count == 7
+    assert graph.get_vertexes_degree() == expected.get_vertexes_degree()
+    with pytest.raises(RuntimeError):
+        with graph.batch():
+            graph.remove_vertexes(("A", "A"), tombstone=True)
+            raise RuntimeError
+    assert graph.vertex_count == 7
+    assert graph.get_vertexes_degree() == expected.get_vertexes_degree()